@@ -6,8 +6,27 @@ __author__ = """Sommalia"""
 __email__ = 'sommalia@protonmail.com'
 __version__ = '0.11.2'
 
-from . import models
-from . import util
-from . import exceptions
+from importlib import import_module
 
-from .moco import Moco
+# submodules and classes are imported on first access, so importing the package itself stays cheap
+_submodules = ("models", "util", "exceptions")
+_classes = {
+    "Moco": ".moco",
+    "AsyncMoco": ".async_moco",
+}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return import_module("." + name, __name__)
+
+    if name in _classes:
+        value = getattr(import_module(_classes[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_submodules) + list(_classes.keys()))
@@ -0,0 +1,181 @@
+import asyncio
+
+from moco_wrapper.moco import Moco
+from moco_wrapper import util
+from moco_wrapper.util import endpoint
+from moco_wrapper.util.requestor import AsyncRequestor
+
+
+class AsyncMoco(Moco):
+    """
+    Moco class for using the moco api with asyncio.
+
+    The async moco instance has the same models as :class:`moco_wrapper.Moco`, but every model method returns an
+    awaitable instead of the response itself. This way many requests can be sent concurrently from one event loop.
+
+    :param auth: Dictionary containing authentication information, see :ref:`authentication`
+    :param objector: objector object (see :ref:`objector`, default: :class:`moco_wrapper.util.objector.DefaultObjector`)
+    :param requestor: requestor object (default: :class:`moco_wrapper.util.requestor.AsyncRequestor`, blocking
+        requestors will be wrapped into an :class:`moco_wrapper.util.requestor.AsyncRequestor`)
+    :param impersonate_user_id: user id the client should impersonate (default: None, see https://github.com/hundertzehn/mocoapp-api-docs#impersonation)
+
+    :type auth: dict
+    :type impersonate_user_id: int
+
+    .. code-block:: python
+
+        import asyncio
+        import moco_wrapper
+
+        moco = moco_wrapper.AsyncMoco(
+            auth = {
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            }
+        )
+
+        async def main():
+            project = await moco.Project.get(22)
+            tasks = await moco.ProjectTask.getlist(project.data.id)
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        auth={},
+        objector=None,
+        requestor=None,
+        impersonate_user_id: int = None,
+        **kwargs):
+
+        if requestor is None:
+            requestor = AsyncRequestor()
+        elif not isinstance(requestor, AsyncRequestor):
+            requestor = AsyncRequestor(requestor=requestor)
+
+        super(AsyncMoco, self).__init__(
+            auth=auth,
+            objector=objector,
+            requestor=requestor,
+            impersonate_user_id=impersonate_user_id,
+            **kwargs
+        )
+
+        self._async_auth_lock = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        bypass_auth: bool = False,
+        **kwargs
+    ):
+        """
+        Requests the given resource with the assigned requestor
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: path of the resource (e.g. ``/projects``)
+        :param params: url parameters (e.g. ``page=1``, query parameters)
+        :param data: dictionary with data (http body)
+        :param bypass_auth: If authentication checks should be skipped (default False)
+
+        .. seealso::
+
+            :meth:`moco_wrapper.Moco.request`
+        """
+        if not bypass_auth:
+            await self.authenticate()
+
+        full_path = self.full_domain + path
+        headers = self._merge_headers(kwargs)
+
+        requestor_response = await self._requestor.request(method, full_path, params=params, data=data,
+                                                           headers=headers, **kwargs)
+
+        if self._response_cache is not None and method != "GET":
+            self._response_cache.invalidate(util.cache.resource_family(path))
+
+        return self._process_response(self._objector.convert(requestor_response))
+
+    async def request_e(
+        self,
+        ep: endpoint.Endpoint,
+        ep_params=None,
+        params=None,
+        data=None,
+        bypass_auth: bool = False,
+        **kwargs
+    ):
+        if not bypass_auth:
+            await self.authenticate()
+
+        full_path = self.full_domain + ep.url_format(ep_params)
+        headers = self._merge_headers(kwargs)
+
+        cached_response, cache_entry = self._cache_lookup(ep, full_path, params, headers, kwargs)
+        if cached_response is not None:
+            return self._process_response(self._objector.convert_e(cached_response, ep))
+
+        requestor_response = await self._requestor.request(ep.method, full_path, params=params, data=data,
+                                                           headers=headers, **kwargs)
+        self._cache_store(ep, cache_entry, requestor_response)
+
+        return self._process_response(self._objector.convert_e(requestor_response, ep))
+
+    def close(self):
+        """
+        Releases the resources of the requestor (e.g. the thread pool of the
+        :class:`moco_wrapper.util.requestor.AsyncRequestor`)
+        """
+        close = getattr(self._requestor, "close", None)
+        if close is not None:
+            close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def authenticate(self):
+        """
+        Performs any action necessary to be authenticated against the moco api.
+
+        This method gets invoked automatically, on the very first request you send against the api. If multiple tasks
+        send their first request at the same time, only one of them authenticates.
+
+        .. seealso::
+
+            :meth:`moco_wrapper.Moco.authenticate`
+        """
+        if self.api_key is not None and self.domain is not None:
+            return  # already authenticated
+
+        # created here, so the lock belongs to the running event loop
+        if self._async_auth_lock is None:
+            self._async_auth_lock = asyncio.Lock()
+
+        async with self._async_auth_lock:
+            if self.api_key is not None and self.domain is not None:
+                return  # authenticated by another task
+
+            if all(x in self.auth.keys() for x in ['api_key', 'domain']):
+                # authentication with api key
+                self.api_key = self.auth["api_key"]
+                self.domain = self.auth["domain"]
+                del self.auth
+            elif all(x in self.auth.keys() for x in ['domain', 'email', 'password']):
+                # authentication with username/password
+                self.domain = self.auth["domain"]
+
+                email, password = self.auth["email"], self.auth["password"]
+                session = (await self.Session.authenticate(email, password)).data
+
+                self.api_key = session.api_key
+                del self.auth
+            else:
+                # raise error authentication information is very likely invalid
+                raise ValueError("Invalid authentication information given")
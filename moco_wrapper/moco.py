@@ -1,7 +1,69 @@
+import contextlib
+import contextvars
+import threading
+
+from types import MappingProxyType
+
 from moco_wrapper import models, util, exceptions
-from moco_wrapper.util import requestor, objector, response, endpoint
+from moco_wrapper.util import response, endpoint
+
+
+_default_requestor = None
+_default_objector = None
+_default_lock = threading.Lock()
+
+# impersonated user ids of the current context by moco instance (id of the instance => user id)
+_impersonations = contextvars.ContextVar("moco_wrapper_impersonations", default=MappingProxyType({}))
+
+
+def _shared_default_requestor():
+    """
+    Returns the requestor that is used by all moco instances without a requestor of their own, the requestor (and
+    the requests module) is only loaded when the first instance is created
+    """
+    global _default_requestor
+
+    if _default_requestor is None:
+        with _default_lock:
+            if _default_requestor is None:
+                _default_requestor = util.requestor.DefaultRequestor()
+
+    return _default_requestor
+
+
+def _shared_default_objector():
+    """
+    Returns the objector that is used by all moco instances without an objector of their own
+    """
+    global _default_objector
+
+    if _default_objector is None:
+        with _default_lock:
+            if _default_objector is None:
+                _default_objector = util.objector.DefaultObjector()
+
+    return _default_objector
+
 
-from requests import get, post, put, delete
+class _LazyModel(object):
+    """
+    Model attribute of the moco instance, the model is created on first access and then stored on the instance
+    """
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+        self.name = model_class.__name__
+        self.__doc__ = model_class.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # stored in the instance dictionary, later lookups do not reach the descriptor anymore
+        return instance.__dict__.setdefault(self.name, self.model_class(instance))
 
 
 class Moco(object):
@@ -12,9 +74,11 @@ class Moco(object):
     :param objector: objector object (see :ref:`objector`, default: :class:`moco_wrapper.util.objector.DefaultObjector`)
     :param requestor: requestor object (see :ref:`requestor`, default: :class:`moco_wrapper.util.requestor.DefaultRequestor`)
     :param impersonate_user_id: user id the client should impersonate (default: None, see https://github.com/hundertzehn/mocoapp-api-docs#impersonation)
+    :param response_cache: cache for the responses of read endpoints (see :ref:`cache`, default: None, no caching)
 
     :type auth: dict
     :type impersonate_user_id: int
+    :type response_cache: :class:`moco_wrapper.util.cache.ResponseCache`
 
     .. code-block:: python
 
@@ -27,12 +91,54 @@ class Moco(object):
         )
     """
 
+    HTTP_METHODS = ("GET", "PUT", "POST", "DELETE", "PATCH")
+    """Http methods the requestors support"""
+
+    HEADERS_CACHE_SIZE = 128
+    """Maximum number of cached header sets (one for every impersonated user)"""
+
+    # models are created on first access
+    Activity = _LazyModel(models.Activity)
+    AccountFixedCost = _LazyModel(models.AccountFixedCost)
+    AccountHourlyRate = _LazyModel(models.AccountHourlyRate)
+    AccountInternalHourlyRate = _LazyModel(models.AccountInternalHourlyRate)
+    Contact = _LazyModel(models.Contact)
+    Company = _LazyModel(models.Company)
+    Comment = _LazyModel(models.Comment)
+    Unit = _LazyModel(models.Unit)
+    User = _LazyModel(models.User)
+    UserPresence = _LazyModel(models.UserPresence)
+    UserHoliday = _LazyModel(models.UserHoliday)
+    UserEmployment = _LazyModel(models.UserEmployment)
+    Schedule = _LazyModel(models.Schedule)  # old way for handling planning + absenses
+    PlanningEntry = _LazyModel(models.PlanningEntry)  # new way for handling planning
+    Project = _LazyModel(models.Project)
+    ProjectContract = _LazyModel(models.ProjectContract)
+    ProjectExpense = _LazyModel(models.ProjectExpense)
+    ProjectGroup = _LazyModel(models.ProjectGroup)
+    ProjectTask = _LazyModel(models.ProjectTask)
+    ProjectRecurringExpense = _LazyModel(models.ProjectRecurringExpense)
+    ProjectPaymentSchedule = _LazyModel(models.ProjectPaymentSchedule)
+    Deal = _LazyModel(models.Deal)
+    DealCategory = _LazyModel(models.DealCategory)
+    Invoice = _LazyModel(models.Invoice)
+    InvoicePayment = _LazyModel(models.InvoicePayment)
+    Offer = _LazyModel(models.Offer)
+    Session = _LazyModel(models.Session)
+    PurchaseDraft = _LazyModel(models.PurchaseDraft)
+    PurchaseCategory = _LazyModel(models.PurchaseCategory)
+    Purchase = _LazyModel(models.Purchase)
+    Tagging = _LazyModel(models.Tagging)
+    Report = _LazyModel(models.Report)
+    Webhook = _LazyModel(models.Webhook)
+
     def __init__(
         self,
         auth={},
-        objector=objector.DefaultObjector(),
-        requestor=requestor.DefaultRequestor(),
+        objector=None,
+        requestor=None,
         impersonate_user_id: int = None,
+        response_cache=None,
         **kwargs):
 
         self.auth = auth
@@ -60,53 +166,23 @@ class Moco(object):
             )
 
         """
-        self.endpoint_manager = endpoint.EndpointManager()
-
-        self.Activity = models.Activity(self)
-        self.AccountFixedCost = models.AccountFixedCost(self)
-        self.AccountHourlyRate = models.AccountHourlyRate(self)
-        self.AccountInternalHourlyRate = models.AccountInternalHourlyRate(self)
-        self.Contact = models.Contact(self)
-        self.Company = models.Company(self)
-        self.Comment = models.Comment(self)
-        self.Unit = models.Unit(self)
-        self.User = models.User(self)
-        self.UserPresence = models.UserPresence(self)
-        self.UserHoliday = models.UserHoliday(self)
-        self.UserEmployment = models.UserEmployment(self)
-        self.Schedule = models.Schedule(self)  # old way for handling planning + absenses
-        self.PlanningEntry = models.PlanningEntry(self)  # new way for handling planning
-        self.Project = models.Project(self)
-        self.ProjectContract = models.ProjectContract(self)
-        self.ProjectExpense = models.ProjectExpense(self)
-        self.ProjectGroup = models.ProjectGroup(self)
-        self.ProjectTask = models.ProjectTask(self)
-        self.ProjectRecurringExpense = models.ProjectRecurringExpense(self)
-        self.ProjectPaymentSchedule = models.ProjectPaymentSchedule(self)
-        self.Deal = models.Deal(self)
-        self.DealCategory = models.DealCategory(self)
-        self.Invoice = models.Invoice(self)
-        self.InvoicePayment = models.InvoicePayment(self)
-        self.Offer = models.Offer(self)
-        self.Session = models.Session(self)
-        self.PurchaseDraft = models.PurchaseDraft(self)
-        self.PurchaseCategory = models.PurchaseCategory(self)
-        self.Purchase = models.Purchase(self)
-        self.Tagging = models.Tagging(self)
-        self.Report = models.Report(self)
-        self.Webhook = models.Webhook(self)
+        self.endpoint_manager = endpoint.EndpointManager.shared()
+        self._bound_endpoints = {}
 
         self._requestor = requestor
         self._objector = objector
 
-        # set default values if not already set
+        # use the shared default instances if not set
         if self._requestor is None:
-            self._requestor = util.requestor.DefaultRequestor()
+            self._requestor = _shared_default_requestor()
 
         if self._objector is None:
-            self._objector = util.objector.DefaultObjector()
+            self._objector = _shared_default_objector()
 
+        self._response_cache = response_cache
         self._impersonation_user_id = impersonate_user_id
+        self._headers_cache = {}
+        self._auth_lock = threading.RLock()
 
         # these will be (re)set on the first request
         self.api_key = None
@@ -148,36 +224,18 @@ class Moco(object):
         if not bypass_auth:
             self.authenticate()
 
-        # merge headers if set in model
-        headers = self.headers
-        if "headers" in kwargs.keys():
-            for key, value in kwargs["headers"].items():
-                headers[key] = value
-
-            del kwargs["headers"]
+        headers = self._merge_headers(kwargs)
 
         # pass request making to the requestor object
-        if method == "GET":
-            requestor_response = self._requestor.get(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "PUT":
-            requestor_response = self._requestor.put(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "POST":
-            requestor_response = self._requestor.post(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "DELETE":
-            requestor_response = self._requestor.delete(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "PATCH":
-            requestor_response = self._requestor.patch(full_path, params=params, data=data, headers=headers, **kwargs)
-
-        # push the response to the current objector
-        objector_result = self._objector.convert(requestor_response)
+        send = self._send_method(method)
+        if send is not None:
+            requestor_response = send(full_path, params=params, data=data, headers=headers, **kwargs)
 
-        # if the result is an exception we raise it, otherwise return it
-        if isinstance(objector_result, response.ErrorResponse) and isinstance(objector_result.data,
-                                                                              exceptions.MocoException):
-            raise objector_result.data
+        if self._response_cache is not None and method != "GET":
+            self._response_cache.invalidate(util.cache.resource_family(path))
 
-        # return the objector result by default
-        return objector_result
+        # push the response to the current objector
+        return self._process_response(self._objector.convert(requestor_response))
 
     def request_e(
         self,
@@ -188,35 +246,122 @@ class Moco(object):
         bypass_auth: bool = False,
         **kwargs
     ):
+        """
+        Requests the given endpoint with the assigned requestor
+
+        :param ep: Endpoint or bound endpoint (see :meth:`bind`)
+        :param ep_params: Parameters of the url template of the endpoint (e.g. ``{"id": 1}``)
+        :param params: url parameters (e.g. ``page=1``, query parameters)
+        :param data: dictionary with data (http body)
+        :param bypass_auth: If authentication checks should be skipped (default False)
+        """
         full_path = self.full_domain + ep.url_format(ep_params)
-        requestor_response = None
 
         if not bypass_auth:
             self.authenticate()
 
-        # merge headers if set in model
-        headers = self.headers
-        if "headers" in kwargs.keys():
-            for key, value in kwargs["headers"].items():
-                headers[key] = value
-
-            del kwargs["headers"]
+        headers = self._merge_headers(kwargs)
 
         # pass request making to the requestor object
-        if ep.method == "GET":
-            requestor_response = self._requestor.get(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "PUT":
-            requestor_response = self._requestor.put(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "POST":
-            requestor_response = self._requestor.post(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "DELETE":
-            requestor_response = self._requestor.delete(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "PATCH":
-            requestor_response = self._requestor.patch(full_path, params=params, data=data, headers=headers, **kwargs)
+        if not isinstance(ep, endpoint.BoundEndpoint):
+            ep = self.bind(ep)
+
+        cached_response, cache_entry = self._cache_lookup(ep, full_path, params, headers, kwargs)
+        if cached_response is not None:
+            return self._process_response(self._objector.convert_e(cached_response, ep))
+
+        requestor_response = ep.send(full_path, params=params, data=data, headers=headers, **kwargs)
+        self._cache_store(ep, cache_entry, requestor_response)
 
         # push the response to the current objector
-        objector_result = self._objector.convert_e(requestor_response, ep)
+        return self._process_response(self._objector.convert_e(requestor_response, ep))
+
+    def _cache_lookup(self, ep, full_path: str, params, headers, kwargs: dict):
+        """
+        Looks up the response of a read request in the response cache
+
+        :returns: Tuple of the cached response (``None`` if the response is not cached) and the entry the response of
+            the request is stored as (``None`` if the response may not be cached)
+        """
+        cache = self._response_cache
+        if cache is None or ep.method != "GET" or kwargs.get("stream", False):
+            return None, None
+
+        ttl = cache.ttl(ep)
+        if not ttl:
+            return None, None
+
+        key = cache.key(full_path, params, headers)
+        generation = cache.generation(ep.resource)
+
+        return cache.get(key), (key, ep.resource, ttl, generation)
+
+    def _cache_store(self, ep, cache_entry, requestor_response):
+        """
+        Stores the response of a read request in the response cache, writes remove the cached responses of their
+        resource family
+        """
+        cache = self._response_cache
+        if cache is None:
+            return
+
+        if cache_entry is not None:
+            key, resource, ttl, generation = cache_entry
+            cache.set(key, resource, requestor_response, ttl, generation=generation)
+        elif ep.method != "GET":
+            cache.invalidate(ep.resource)
+
+    def _merge_headers(self, kwargs: dict) -> dict:
+        """
+        Merges the headers set by a model (``kwargs["headers"]``) into the default headers
+
+        :param kwargs: Keyword arguments of the request, the ``headers`` key will be removed
+
+        :returns: Headers to send with the request (read-only if the model did not set any headers)
+        """
+        headers = self._default_headers()
+
+        # copy the cached default headers only if the model sets headers of its own
+        model_headers = kwargs.pop("headers", None)
+        if model_headers:
+            headers = dict(headers)
+            headers.update(model_headers)
+
+        return headers
+
+    def _default_headers(self):
+        """
+        Returns the default headers as a read-only mapping
+
+        The headers are cached by api key and impersonated user, so they are only built once for every user.
+        """
+        user_id = self.impersonation_user_id
+        state = (self.api_key, user_id)
+
+        headers = self._headers_cache.get(state, None)
+        if headers is None:
+            headers = {
+                'Content-Type': 'application/json',
+                'Authorization': 'Token token={}'.format(self.api_key)
+            }
+
+            if user_id is not None:
+                headers["X-IMPERSONATE-USER-ID"] = str(user_id)
+
+            headers = MappingProxyType(headers)
+
+            if len(self._headers_cache) >= self.HEADERS_CACHE_SIZE:
+                self._headers_cache.clear()
+            self._headers_cache[state] = headers
 
+        return headers
+
+    def _process_response(self, objector_result):
+        """
+        Raises the exception of an error response, otherwise returns the objector result as it is
+
+        :param objector_result: Response that was converted by the objector
+        """
         # if the result is an exception we raise it, otherwise return it
         if isinstance(objector_result, response.ErrorResponse) and isinstance(objector_result.data,
                                                                               exceptions.MocoException):
@@ -229,14 +374,16 @@ class Moco(object):
         """
         Helper function for GET requests
         """
-        # check if path is now and endpoint slug
-        ep = self.endpoint_manager.get(path)
+        # check if path is an endpoint slug
+        ep = self._bound_endpoints.get(path, None) or self.bind(path)
         if ep is not None:
-            return self.request_e(ep,
-                                  ep_params=ep_params,
-                                  params=params,
-                                  data=data,
-                                  **kwargs)
+            return self.request_e(
+                ep,
+                ep_params=ep_params,
+                params=params,
+                data=data,
+                **kwargs
+            )
 
         return self.request("GET", path, params=params, data=data, **kwargs)
 
@@ -244,7 +391,8 @@ class Moco(object):
         """
         Helper function for POST requests
         """
-        ep = self.endpoint_manager.get(path)
+        # check if path is an endpoint slug
+        ep = self._bound_endpoints.get(path, None) or self.bind(path)
         if ep is not None:
             return self.request_e(
                 ep,
@@ -260,7 +408,8 @@ class Moco(object):
         """
         Helper function for PUT requests
         """
-        ep = self.endpoint_manager.get(path)
+        # check if path is an endpoint slug
+        ep = self._bound_endpoints.get(path, None) or self.bind(path)
         if ep is not None:
             return self.request_e(
                 ep,
@@ -276,7 +425,8 @@ class Moco(object):
         """
         Helper function for DELETE requests
         """
-        ep = self.endpoint_manager.get(path)
+        # check if path is an endpoint slug
+        ep = self._bound_endpoints.get(path, None) or self.bind(path)
         if ep is not None:
             return self.request_e(
                 ep,
@@ -292,7 +442,8 @@ class Moco(object):
         """
         Helper function for PATCH requests
         """
-        ep = self.endpoint_manager.get(path)
+        # check if path is an endpoint slug
+        ep = self._bound_endpoints.get(path, None) or self.bind(path)
         if ep is not None:
             return self.request_e(
                 ep,
@@ -304,6 +455,54 @@ class Moco(object):
 
         return self.request("PATCH", path, params=params, data=data, **kwargs)
 
+    def bind(self, ep) -> endpoint.BoundEndpoint:
+        """
+        Binds an endpoint to the method of the assigned requestor it is sent with
+
+        Bound endpoints are cached, every endpoint is only bound once per moco instance.
+
+        :param ep: Endpoint or endpoint slug
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`, str
+
+        :returns: Bound endpoint, ``None`` if there is no endpoint with the given slug
+        :rtype: :class:`moco_wrapper.util.endpoint.BoundEndpoint`
+
+        .. code-block:: python
+
+            ep = m.bind("activity_get")
+            for activity_id in activity_ids:
+                m.request_e(ep, ep_params={"id": activity_id})
+        """
+        bound = self._bound_endpoints.get(ep, None)
+        if bound is not None:
+            return bound
+
+        if isinstance(ep, str):
+            slug_ep = self.endpoint_manager.get(ep)
+            if slug_ep is None:
+                return None
+
+            bound = endpoint.BoundEndpoint(slug_ep, self._send_method(slug_ep.method))
+        else:
+            bound = endpoint.BoundEndpoint(ep, self._send_method(ep.method))
+
+        self._bound_endpoints[ep] = bound
+        return bound
+
+    def _send_method(self, method: str):
+        """
+        Returns the method of the assigned requestor for the given http method (e.g. ``requestor.get`` for ``GET``)
+
+        :param method: Http method
+
+        :returns: Requestor method, ``None`` for unknown http methods
+        """
+        if method not in self.HTTP_METHODS:
+            return None
+
+        return getattr(self._requestor, method.lower())
+
     def impersonate(
         self,
         user_id: int
@@ -331,20 +530,64 @@ class Moco(object):
         """
         self._impersonation_user_id = None
 
+    @contextlib.contextmanager
+    def impersonation(
+        self,
+        user_id: int
+    ):
+        """
+        Impersonates the user with the supplied user id for all requests made inside the ``with`` block
+
+        Unlike :meth:`impersonate` this only affects the current thread (or asyncio task), so one moco instance can be
+        shared by threads that impersonate different users.
+
+        :param user_id: user id to impersonate (``None`` to send requests without impersonation)
+
+        .. code-block:: python
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            def user_projects(user_id):
+                with m.impersonation(user_id):
+                    return m.Project.assigned().items
+
+            with ThreadPoolExecutor() as executor:
+                projects = list(executor.map(user_projects, user_ids))
+        """
+        key = id(self)
+        impersonations = dict(_impersonations.get())
+        impersonations[key] = user_id
+
+        token = _impersonations.set(MappingProxyType(impersonations))
+        try:
+            yield self
+        finally:
+            _impersonations.reset(token)
+
     @property
-    def headers(self):
+    def impersonation_user_id(self) -> int:
         """
-        Returns all http headers to be used by the assigned requestor
+        Id of the user that is impersonated by requests of the current context (``None`` if no user is impersonated)
+
+        .. seealso::
+
+            :meth:`impersonation`, :meth:`impersonate`
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': 'Token token={}'.format(self.api_key)
-        }
+        impersonations = _impersonations.get()
+        key = id(self)
+        if key in impersonations:
+            return impersonations[key]
 
-        if self._impersonation_user_id is not None:
-            headers["X-IMPERSONATE-USER-ID"] = str(self._impersonation_user_id)
+        return self._impersonation_user_id
 
-        return headers
+    @property
+    def headers(self):
+        """
+        Returns all http headers to be used by the assigned requestor
+
+        The returned dictionary is a copy, changing it does not affect the headers that are sent.
+        """
+        return dict(self._default_headers())
 
     @property
     def full_domain(self) -> str:
@@ -378,6 +621,17 @@ class Moco(object):
         """
         return self._objector
 
+    @property
+    def response_cache(self):
+        """
+        Get the response cache of this instance, ``None`` if responses are not cached
+
+        .. seealso::
+
+            :class:`moco_wrapper.util.cache.ResponseCache`
+        """
+        return self._response_cache
+
     @property
     def requestor(self):
         """
@@ -393,25 +647,30 @@ class Moco(object):
         """
         Performs any action necessary to be authenticated against the moco api.
 
-        This method gets invoked automatically, on the very first request you send against the api.
+        This method gets invoked automatically, on the very first request you send against the api. If multiple
+        threads send their first request at the same time, only one of them authenticates.
         """
         if self.api_key is not None and self.domain is not None:
             return  # already authenticated
 
-        if all(x in self.auth.keys() for x in ['api_key', 'domain']):
-            # authentication with api key
-            self.api_key = self.auth["api_key"]
-            self.domain = self.auth["domain"]
-            del self.auth
-        elif all(x in self.auth.keys() for x in ['domain', 'email', 'password']):
-            # authentication with username/password
-            self.domain = self.auth["domain"]
-
-            email, password = self.auth["email"], self.auth["password"]
-            session = self.Session.authenticate(email, password).data
-
-            self.api_key = session.api_key
-            del self.auth
-        else:
-            # raise error authentication information is very likely invalid
-            raise ValueError("Invalid authentication information given")
+        with self._auth_lock:
+            if self.api_key is not None and self.domain is not None:
+                return  # authenticated by another thread
+
+            if all(x in self.auth.keys() for x in ['api_key', 'domain']):
+                # authentication with api key
+                self.api_key = self.auth["api_key"]
+                self.domain = self.auth["domain"]
+                del self.auth
+            elif all(x in self.auth.keys() for x in ['domain', 'email', 'password']):
+                # authentication with username/password
+                self.domain = self.auth["domain"]
+
+                email, password = self.auth["email"], self.auth["password"]
+                session = self.Session.authenticate(email, password).data
+
+                self.api_key = session.api_key
+                del self.auth
+            else:
+                # raise error authentication information is very likely invalid
+                raise ValueError("Invalid authentication information given")
@@ -20,7 +20,7 @@ class AccountHourlyRate(MWRAPBase):
 
         """
         return [
-            Endpoint("account_hourly_rate_get", "/account/hourly_rates", "GET", om.AccountHourlyRate),
+            Endpoint("account_hourly_rate_get", "/account/hourly_rates", "GET", om.AccountHourlyRate, cache_ttl=3600),
         ]
 
     def __init__(self, moco):
@@ -21,7 +21,7 @@ class AccountInternalHourlyRate(MWRAPBase):
         """
         return [
             Endpoint("account_internal_hourly_rate_get", "/account/internal_hourly_rates",
-                     "GET", om.AccountInternalHourlyRate),
+                     "GET", om.AccountInternalHourlyRate, cache_ttl=3600),
             Endpoint("account_internal_hourly_rate_update", "/account/internal_hourly_rates",
                      "PATCH")
         ]
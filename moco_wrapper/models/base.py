@@ -2,6 +2,7 @@ import datetime
 from typing import List
 
 from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util import pagination
 
 
 class MWRAPBase(object):
@@ -35,3 +36,134 @@ class MWRAPBase(object):
         :rtype: list
         """
         return []
+
+    def _getlist(self):
+        """
+        Returns the ``getlist`` method of the model
+
+        :raises TypeError: If the model has no ``getlist`` method (e.g. :class:`moco_wrapper.models.Session`)
+        """
+        getlist = getattr(self, "getlist", None)
+        if getlist is None:
+            raise TypeError("{} has no getlist method and cannot be paginated".format(type(self).__name__))
+
+        return getlist
+
+    def iter(self, *args, **kwargs):
+        """
+        Iterates over every item of the models ``getlist`` method, the pages are requested one after another while
+        iterating.
+
+        :param args: Positional arguments for ``getlist``
+        :param kwargs: Keyword arguments for ``getlist``
+
+        :returns: Generator of the (converted) items
+
+        :raises TypeError: If the model has no ``getlist`` method, or belongs to an :class:`moco_wrapper.AsyncMoco`
+            instance (use :meth:`aiter` instead)
+
+        .. code-block:: python
+
+            from moco_wrapper import Moco
+
+            m = Moco()
+            for activity in m.Activity.iter(from_date="2020-01-01", to_date="2020-12-31"):
+                print(activity.hours)
+
+        .. note::
+
+            Only the current page is kept in memory, the whole collection is never materialised.
+
+        .. seealso::
+
+            :meth:`moco_wrapper.util.pagination.iter_items`
+        """
+        return pagination.iter_items(self._getlist(), *args, **kwargs)
+
+    def aiter(self, *args, **kwargs):
+        """
+        Iterates over every item of the models ``getlist`` method of an :class:`moco_wrapper.AsyncMoco` instance, the
+        pages are awaited one after another while iterating.
+
+        :param args: Positional arguments for ``getlist``
+        :param kwargs: Keyword arguments for ``getlist``
+
+        :returns: Asynchronous generator of the (converted) items
+
+        :raises TypeError: If the model has no ``getlist`` method
+
+        .. code-block:: python
+
+            from moco_wrapper import AsyncMoco
+
+            m = AsyncMoco()
+
+            async def main():
+                async for activity in m.Activity.aiter(from_date="2020-01-01", to_date="2020-12-31"):
+                    print(activity.hours)
+
+        .. seealso::
+
+            :meth:`iter`, :meth:`moco_wrapper.util.pagination.aiter_items`
+        """
+        return pagination.aiter_items(self._getlist(), *args, **kwargs)
+
+    def fetch_all(self, *args, max_workers: int = 4, **kwargs) -> list:
+        """
+        Fetches every page of the models ``getlist`` method, the pages after the first one are requested at the same
+        time.
+
+        :param args: Positional arguments for ``getlist``
+        :param max_workers: Maximum number of pages that are requested at the same time (default ``4``)
+        :param kwargs: Keyword arguments for ``getlist``
+
+        :type max_workers: int
+
+        :returns: List of the (converted) items of all pages
+        :rtype: list
+
+        :raises TypeError: If the model has no ``getlist`` method, or belongs to an :class:`moco_wrapper.AsyncMoco`
+            instance (use :meth:`afetch_all` instead)
+
+        .. code-block:: python
+
+            from moco_wrapper import Moco
+
+            m = Moco()
+            activities = m.Activity.fetch_all(from_date="2020-01-01", to_date="2020-12-31", max_workers=8)
+
+        .. seealso::
+
+            :meth:`moco_wrapper.util.pagination.fetch_all`
+        """
+        return pagination.fetch_all(self._getlist(), *args, max_workers=max_workers, **kwargs)
+
+    def afetch_all(self, *args, max_workers: int = 4, **kwargs):
+        """
+        Fetches every page of the models ``getlist`` method of an :class:`moco_wrapper.AsyncMoco` instance, the pages
+        after the first one are awaited at the same time.
+
+        :param args: Positional arguments for ``getlist``
+        :param max_workers: Maximum number of pages that are requested at the same time (default ``4``)
+        :param kwargs: Keyword arguments for ``getlist``
+
+        :type max_workers: int
+
+        :returns: Awaitable list of the (converted) items of all pages
+
+        :raises TypeError: If the model has no ``getlist`` method
+
+        .. code-block:: python
+
+            from moco_wrapper import AsyncMoco
+
+            m = AsyncMoco()
+
+            async def main():
+                activities = await m.Activity.afetch_all(from_date="2020-01-01", to_date="2020-12-31")
+
+        .. seealso::
+
+            :meth:`fetch_all`, :meth:`moco_wrapper.util.pagination.afetch_all`
+        """
+        return pagination.afetch_all(self._getlist(), *args, max_workers=max_workers, **kwargs)
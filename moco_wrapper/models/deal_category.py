@@ -42,8 +42,8 @@ class DealCategory(MWRAPBase):
         return [
             Endpoint("deal_category_create", "/deal_categories", "POST", om.DealCategory),
             Endpoint("deal_category_update", "/deal_categories/{id}", "PUT", om.DealCategory),
-            Endpoint("deal_category_getlist", "/deal_categories", "GET", om.DealCategory),
-            Endpoint("deal_category_get", "/deal_categories/{id}", "GET", om.DealCategory),
+            Endpoint("deal_category_getlist", "/deal_categories", "GET", om.DealCategory, cache_ttl=3600),
+            Endpoint("deal_category_get", "/deal_categories/{id}", "GET", om.DealCategory, cache_ttl=3600),
             Endpoint("deal_category_delete", "/deal_categories/{id}", "DELETE")
         ]
 
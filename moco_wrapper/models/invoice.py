@@ -238,14 +238,18 @@ class Invoice(MWRAPBase):
 
     def pdf(
         self,
-        invoice_id: int
+        invoice_id: int,
+        stream: bool = False
     ):
         """
         Retrieve the invoice document as pdf.
 
         :param invoice_id: Invoice id
+        :param stream: If the document should be streamed instead of read into memory (default ``False``, see
+            :class:`moco_wrapper.util.response.FileResponse`)
 
         :type invoice_id: int
+        :type stream: bool
 
         :returns: Invoice pdf
         :rtype: :class:`moco_wrapper.util.response.FileResponse`
@@ -254,11 +258,12 @@ class Invoice(MWRAPBase):
             "id": invoice_id
         }
 
-        return self._moco.get("invoice_pdf", ep_params=ep_params)
+        return self._moco.get("invoice_pdf", ep_params=ep_params, stream=stream)
 
     def timesheet_pdf(
         self,
-        invoice_id: int
+        invoice_id: int,
+        stream: bool = False
     ):
         """
         Retrieve the invoice timesheet document as pdf.
@@ -268,8 +273,11 @@ class Invoice(MWRAPBase):
             by billing unbilled tasks.
 
         :param invoice_id: Invoice id
+        :param stream: If the document should be streamed instead of read into memory (default ``False``, see
+            :class:`moco_wrapper.util.response.FileResponse`)
 
         :type invoice_id: int
+        :type stream: bool
 
         :return: Invoice timesheet as pdf
         :rtype: :class:`moco_wrapper.util.response.FileResponse`
@@ -278,7 +286,7 @@ class Invoice(MWRAPBase):
             "id": invoice_id
         }
 
-        return self._moco.get("invoice_timesheet_pdf", ep_params=ep_params)
+        return self._moco.get("invoice_timesheet_pdf", ep_params=ep_params, stream=stream)
 
     def timesheet_activities(
         self,
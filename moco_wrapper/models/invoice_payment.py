@@ -171,7 +171,8 @@ class InvoicePayment(MWRAPBase):
             created_payments = m.InvoicePayment.create_bulk(items)
 
         .. seealso::
-            :class:`moco_wrapper.util.generator.InvoicePaymentGenerator`
+            :class:`moco_wrapper.util.generator.InvoicePaymentGenerator`,
+            :class:`moco_wrapper.util.bulk.BulkWriter` for creating large numbers of payments in chunks
 
         """
         data = {
@@ -0,0 +1,22 @@
+from .base import CompactModel
+
+from .activity import Activity
+from .company import Company
+from .deal import Deal
+from .deal_category import DealCategory
+from .project import Project
+from .project_contract import ProjectContract
+from .project_task import ProjectTask
+from .unit import Unit
+from .user import User
+
+
+def compact_type(model_type):
+    """
+    Returns the compact model class for a regular objector model class
+
+    :param model_type: Regular objector model class (e.g. :class:`moco_wrapper.models.objector_models.Activity`)
+
+    :returns: Compact model class, ``None`` if there is no compact model for the class
+    """
+    return CompactModel._types.get(model_type.__name__, None)
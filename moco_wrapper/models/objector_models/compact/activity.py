@@ -0,0 +1,16 @@
+from .base import CompactModel
+
+
+class Activity(CompactModel):
+    __slots__ = (
+        "id", "date", "hours", "seconds", "description", "billed", "billable", "tag", "remote_service", "remote_id",
+        "remote_url", "project", "task", "customer", "user", "hourly_rate", "timer_started_at", "invoice_id",
+        "locked", "created_at", "updated_at"
+    )
+
+    _nested = {
+        "project": "Project",
+        "task": "ProjectTask",
+        "customer": "Company",
+        "user": "User",
+    }
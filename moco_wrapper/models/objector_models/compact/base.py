@@ -0,0 +1,161 @@
+class NestedList(list):
+    """
+    List of converted nested objects, marks a list field of a compact model as converted
+    """
+
+    __slots__ = ()
+
+
+class NestedField(object):
+    """
+    Descriptor for fields of a compact model that contain nested objects.
+
+    The field stores the decoded json of the nested object and converts it into a compact model on first access, the
+    converted object replaces the json in the slot.
+    """
+
+    __slots__ = ("name", "type_name", "member")
+
+    def __init__(self, name, type_name, member):
+        """
+        Class constructor
+
+        :param name: Name of the field
+        :param type_name: Name of the compact model class of the nested object
+        :param member: Slot descriptor the value is stored in
+        """
+        self.name = name
+        self.type_name = type_name
+        self.member = member
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        value = self.member.__get__(obj, objtype)
+
+        # converted lists are lists as well, they are marked so they are not converted on every access
+        if isinstance(value, dict) or (isinstance(value, list) and not isinstance(value, NestedList)):
+            value = CompactModel._build_nested(self.type_name, value)
+            self.member.__set__(obj, value)
+
+        return value
+
+    def __set__(self, obj, value):
+        self.member.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.member.__delete__(obj)
+
+
+class CompactModel(object):
+    """
+    Base class for compact objector models.
+
+    Compact models store their fields in ``__slots__`` instead of an instance dictionary, which makes every object a lot
+    smaller than the regular objector models. Each subclass declares the fields it knows in ``__slots__``, keys the
+    api returns in addition are kept in a small fallback dictionary, so no data is lost and they can still be accessed
+    as attributes.
+
+    Nested objects are declared in ``_nested`` (field name to compact class name) and converted into compact models as
+    well, the conversion happens on first access of the field (see :class:`.NestedField`).
+
+    .. code-block:: python
+
+        class Unit(CompactModel):
+            __slots__ = ("id", "name", "users", "created_at", "updated_at")
+            _nested = {"users": "User"}
+    """
+
+    __slots__ = ("_extra", "__weakref__")
+
+    _nested = {}
+    """Fields that contain nested objects, maps the field name to the name of the compact model class"""
+
+    _types = {}
+    """All compact model classes by name"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        CompactModel._types[cls.__name__] = cls
+
+        # wrap the slots of nested fields, so nested objects are converted on first access
+        for name, type_name in cls._nested.items():
+            member = cls.__dict__.get(name, None)
+            if member is not None and not isinstance(member, NestedField):
+                setattr(cls, name, NestedField(name, type_name, member))
+
+    def __init__(self, **kwargs):
+        extra = None
+
+        for key, value in kwargs.items():
+            try:
+                object.__setattr__(self, key, value)
+            except AttributeError:
+                # key is not declared as a slot
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+
+        self._extra = extra
+
+    @classmethod
+    def _build_nested(cls, type_name, value):
+        type_ = CompactModel._types[type_name]
+
+        if isinstance(value, list):
+            return NestedList(type_(**x) if isinstance(x, dict) else x for x in value)
+
+        if isinstance(value, dict):
+            return type_(**value)
+
+        return value
+
+    def __getattr__(self, name):
+        # only called if the attribute was not found in a slot
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None
+
+        if extra is not None and name in extra:
+            return extra[name]
+
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    @classmethod
+    def fields(cls) -> tuple:
+        """
+        Returns all fields the model declares
+
+        :rtype: tuple
+        """
+        fields = []
+        for klass in reversed(cls.__mro__):
+            for name in getattr(klass, "__slots__", ()):
+                if name not in ("_extra", "__weakref__"):
+                    fields.append(name)
+
+        return tuple(fields)
+
+    def to_dict(self) -> dict:
+        """
+        Returns all fields that are set (declared and undeclared) as a dictionary, nested objects are not converted
+
+        :rtype: dict
+        """
+        values = {}
+        for name in self.fields():
+            try:
+                values[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+        extra = self._extra
+        if extra is not None:
+            values.update(extra)
+
+        return values
+
+    def __repr__(self):
+        return "<{} id={}>".format(type(self).__name__, getattr(self, "id", None))
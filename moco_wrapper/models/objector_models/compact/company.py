@@ -0,0 +1,16 @@
+from .base import CompactModel
+
+
+class Company(CompactModel):
+    __slots__ = (
+        "id", "type", "name", "website", "email", "billing_email_cc", "phone", "fax", "address", "tags", "labels",
+        "user", "info", "custom_properties", "identifier", "intern", "billing_tax", "customer_vat", "supplier_vat",
+        "currency", "custom_rates", "include_time_report", "billing_notes", "default_discount",
+        "default_cash_discount", "default_cash_discount_days", "default_invoice_due_days", "country_code",
+        "vat_identifier", "iban", "english_correspondence_language", "footer", "projects", "billing_vat",
+        "created_at", "updated_at"
+    )
+
+    _nested = {
+        "user": "User",
+    }
@@ -0,0 +1,14 @@
+from .base import CompactModel
+
+
+class Deal(CompactModel):
+    __slots__ = (
+        "id", "name", "status", "reminder_date", "closed_on", "money", "currency", "info", "tags",
+        "custom_properties", "user", "company", "customer", "person", "category", "created_at", "updated_at"
+    )
+
+    _nested = {
+        "user": "User",
+        "category": "DealCategory",
+        "company": "Company",
+    }
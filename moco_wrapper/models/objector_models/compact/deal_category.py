@@ -0,0 +1,7 @@
+from .base import CompactModel
+
+
+class DealCategory(CompactModel):
+    __slots__ = (
+        "id", "name", "probability", "created_at", "updated_at"
+    )
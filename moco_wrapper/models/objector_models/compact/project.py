@@ -0,0 +1,19 @@
+from .base import CompactModel
+
+
+class Project(CompactModel):
+    __slots__ = (
+        "id", "identifier", "name", "active", "billable", "fixed_price", "retainer", "start_date", "finish_date",
+        "color", "currency", "billing_variant", "billing_address", "billing_email_to", "billing_email_cc",
+        "billing_notes", "setting_include_time_report", "budget", "budget_monthly", "budget_expenses",
+        "hourly_rate", "info", "tags", "labels", "custom_properties", "leader", "co_leader", "customer", "deal",
+        "tasks", "contracts", "project_group", "created_at", "updated_at"
+    )
+
+    _nested = {
+        "customer": "Company",
+        "leader": "User",
+        "contracts": "ProjectContract",
+        "tasks": "ProjectTask",
+        "deal": "Deal",
+    }
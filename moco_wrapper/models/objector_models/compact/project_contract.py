@@ -0,0 +1,8 @@
+from .base import CompactModel
+
+
+class ProjectContract(CompactModel):
+    __slots__ = (
+        "id", "user_id", "firstname", "lastname", "active", "billable", "budget", "hourly_rate", "created_at",
+        "updated_at"
+    )
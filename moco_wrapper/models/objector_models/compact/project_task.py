@@ -0,0 +1,7 @@
+from .base import CompactModel
+
+
+class ProjectTask(CompactModel):
+    __slots__ = (
+        "id", "name", "active", "billable", "budget", "hourly_rate", "description", "created_at", "updated_at"
+    )
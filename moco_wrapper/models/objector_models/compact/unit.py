@@ -0,0 +1,11 @@
+from .base import CompactModel
+
+
+class Unit(CompactModel):
+    __slots__ = (
+        "id", "name", "users", "custom_properties", "created_at", "updated_at"
+    )
+
+    _nested = {
+        "users": "User",
+    }
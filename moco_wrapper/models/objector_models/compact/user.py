@@ -0,0 +1,18 @@
+from .base import CompactModel
+
+
+class User(CompactModel):
+    __slots__ = (
+        "id", "firstname", "lastname", "active", "extern", "email", "mobile_phone", "work_phone", "home_address",
+        "info", "birthday", "iban", "avatar_url", "tags", "custom_properties", "unit", "created_at", "updated_at"
+    )
+
+    _nested = {
+        "unit": "Unit",
+    }
+
+    def __init__(self, **kwargs):
+        if "bday" in kwargs.keys():
+            kwargs["birthday"] = kwargs.pop("bday")
+
+        super(User, self).__init__(**kwargs)
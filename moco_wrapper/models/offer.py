@@ -159,13 +159,17 @@ class Offer(MWRAPBase):
     def pdf(
         self,
         offer_id: int,
+        stream: bool = False
     ):
         """
         Retrieve the offer document for a single offer.
 
         :param offer_id: Id of the offer
+        :param stream: If the document should be streamed instead of read into memory (default ``False``, see
+            :class:`moco_wrapper.util.response.FileResponse`)
 
         :type offer_id: int
+        :type stream: bool
 
         :returns: The offers pdf document
         :rtype: :class:`moco_wrapper.util.response.FileResponse`
@@ -174,7 +178,7 @@ class Offer(MWRAPBase):
             "id": offer_id
         }
 
-        return self._moco.get("offer_pdf", ep_params=ep_params)
+        return self._moco.get("offer_pdf", ep_params=ep_params, stream=stream)
 
     def create(
         self,
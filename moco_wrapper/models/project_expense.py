@@ -158,7 +158,8 @@ class ProjectExpense(MWRAPBase):
         :rtype: :class:`moco_wrapper.util.response.ListResponse`
 
         .. seealso::
-            :class:`moco_wrapper.util.generator.ProjectExpenseGenerator`
+            :class:`moco_wrapper.util.generator.ProjectExpenseGenerator`,
+            :class:`moco_wrapper.util.bulk.BulkWriter` for creating large numbers of expenses in chunks
         """
 
         ep_params = {
@@ -4,7 +4,7 @@ from typing import List
 from moco_wrapper.models.base import MWRAPBase
 from moco_wrapper.models import objector_models as om
 from moco_wrapper.util.endpoint import Endpoint
-from moco_wrapper.util.io import File
+from moco_wrapper.util.io import File, MultipartStream
 
 from enum import Enum
 
@@ -362,27 +362,17 @@ class Purchase(MWRAPBase):
         :rtype: :class:`moco_wrapper.util.response.EmptyResponse`
         """
 
-        # overwrite content-type with None so content-type can be set by the requests module
-        # the content-type will be multipart/form-data. For multipart/form-data a boundary parameter also has to be set
-        # we cannot set this parameter at this stage, so we clear the content-type and let the content-type be
-        # automatically be determined by the requests module
-        # for more info see https://www.w3.org/Protocols/rfc1341/7_2_Multipart.html
-        headers = {
-            "Content-Type": None
-        }
-
         ep_params = {
             "id": purchase_id
         }
 
-        files = {
-            "file": (file.name, open(file.path, "rb"))
-        }
+        # the document is streamed from disk as multipart/form-data body
+        # the requestor closes the file after the request was sent, so it is not left open if sending fails
+        body = MultipartStream({"file": file})
 
         return self._moco.patch(
             "purchase_store_document",
             ep_params=ep_params,
-            headers=headers,
-            data=None,
-            files=files
+            headers={"Content-Type": body.content_type},
+            data=body
         )
@@ -20,8 +20,8 @@ class PurchaseCategory(MWRAPBase):
 
         """
         return [
-            Endpoint("purchase_category_get", "/purchases/categories/{id}", "GET", om.PurchaseCategory),
-            Endpoint("purchase_category_getlist", "/purchases/categories", "GET", om.PurchaseCategory)
+            Endpoint("purchase_category_get", "/purchases/categories/{id}", "GET", om.PurchaseCategory, cache_ttl=3600),
+            Endpoint("purchase_category_getlist", "/purchases/categories", "GET", om.PurchaseCategory, cache_ttl=3600)
         ]
 
     def __init__(self, moco):
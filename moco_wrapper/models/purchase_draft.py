@@ -64,14 +64,18 @@ class PurchaseDraft(MWRAPBase):
 
     def pdf(
         self,
-        draft_id: int
+        draft_id: int,
+        stream: bool = False
     ):
         """
         Retrieve a draft document
 
         :param draft_id: Id of the draft to retrieve the document for
+        :param stream: If the document should be streamed instead of read into memory (default ``False``, see
+            :class:`moco_wrapper.util.response.FileResponse`)
 
         :type draft_id: int
+        :type stream: bool
 
         :returns: The draft document
         :rtype: :class:`moco_wrapper.util.response.FileResponse`
@@ -79,4 +83,4 @@ class PurchaseDraft(MWRAPBase):
         ep_params = {
             "id": draft_id
         }
-        return self._moco.get("purchase_draft_pdf", ep_params=ep_params)
+        return self._moco.get("purchase_draft_pdf", ep_params=ep_params, stream=stream)
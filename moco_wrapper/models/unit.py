@@ -22,8 +22,8 @@ class Unit(MWRAPBase):
 
         """
         return [
-            Endpoint("unit_get", "/units/{id}", "GET", om.Unit),
-            Endpoint("unit_getlist", "/units", "GET", om.Unit)
+            Endpoint("unit_get", "/units/{id}", "GET", om.Unit, cache_ttl=3600),
+            Endpoint("unit_getlist", "/units", "GET", om.Unit, cache_ttl=3600)
         ]
 
     def __init__(self, moco):
@@ -24,8 +24,8 @@ class User(MWRAPBase):
             Endpoint("user_create", "/users", "POST", om.User),
             Endpoint("user_update", "/users/{id}", "PUT", om.User),
             Endpoint("user_delete", "/users/{id}", "DELETE"),
-            Endpoint("user_get", "/users/{id}", "GET", om.User),
-            Endpoint("user_getlist", "/users", "GET", om.User),
+            Endpoint("user_get", "/users/{id}", "GET", om.User, cache_ttl=300),
+            Endpoint("user_getlist", "/users", "GET", om.User, cache_ttl=300),
             Endpoint("user_performance_report", "/users/{id}/performance_report", "GET", om.UserPerformanceReport)
         ]
 
@@ -6,9 +6,31 @@ __author__ = """Sommalia"""
 __email__ = 'sommalia@protonmail.com'
 __version__ = '0.10.0'
 
-from . import generator
-from . import requestor
-from . import objector
-from . import response
-from . import endpoint
-from . import io
+from importlib import import_module
+
+# submodules are imported on first access
+_submodules = (
+    "generator",
+    "requestor",
+    "objector",
+    "response",
+    "endpoint",
+    "io",
+    "pagination",
+    "json_codec",
+    "archive",
+    "bulk",
+    "batch",
+    "cache",
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return import_module("." + name, __name__)
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_submodules))
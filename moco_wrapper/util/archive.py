@@ -0,0 +1,398 @@
+import contextvars
+import hashlib
+import json
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from moco_wrapper.exceptions import MocoException
+from moco_wrapper.util.pagination import iter_items
+from moco_wrapper.util.response import FileResponse
+
+
+class ArchiveResult(object):
+    """
+    Outcome of downloading a single document
+    """
+
+    DOWNLOADED = "downloaded"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        document_type: str,
+        document_id: int,
+        path: str,
+        status: str,
+        size: int = None,
+        sha256: str = None,
+        error: Exception = None
+    ):
+        self.document_type = document_type
+        """Type of the document (key of :attr:`DocumentArchiver.DOCUMENT_TYPES`)"""
+
+        self.document_id = document_id
+        """Id of the invoice, offer or purchase draft"""
+
+        self.path = path
+        """Path of the file"""
+
+        self.status = status
+        """``downloaded``, ``skipped`` (already archived) or ``failed``"""
+
+        self.size = size
+        """Size of the file in bytes"""
+
+        self.sha256 = sha256
+        """Sha256 hex digest of the file"""
+
+        self.error = error
+        """Exception that occurred, if the download failed"""
+
+    @property
+    def ok(self) -> bool:
+        """
+        If the document is archived (downloaded now or before)
+
+        :rtype: bool
+        """
+        return self.status != self.FAILED
+
+    def __repr__(self):
+        return "<ArchiveResult {} {} {}>".format(self.document_type, self.document_id, self.status)
+
+
+class DocumentArchiver(object):
+    """
+    Downloads invoice, offer and purchase draft pdfs concurrently into a directory.
+
+    Every document is streamed into a temporary ``.part`` file, that is renamed once the download is complete. Size and
+    sha256 hash of every archived document are appended to a manifest file (``.moco_archive.jsonl``) in the target
+    directory. Running the archiver again skips all documents that are present with the size (or hash, see
+    ``verify``) recorded in the manifest, so an interrupted archive can be resumed.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.archive import DocumentArchiver
+
+        m = Moco(...)
+
+        def progress(result, done, total):
+            print("{}/{} {}".format(done, total, result))
+
+        archiver = DocumentArchiver(m, "./archive/2020-12", max_workers=8, progress=progress)
+        results = archiver.archive_invoices(date_from=date(2020, 12, 1), date_to=date(2020, 12, 31), timesheets=True)
+
+        failed = [x for x in results if not x.ok]
+
+    .. note::
+
+        Use a requestor with a connection pool that is at least as large as ``max_workers`` (see
+        :class:`moco_wrapper.util.requestor.ConnectionPool`).
+    """
+
+    DOCUMENT_TYPES = {
+        "invoice": ("Invoice", "pdf", "invoice_{id}.pdf"),
+        "invoice_timesheet": ("Invoice", "timesheet_pdf", "invoice_{id}_timesheet.pdf"),
+        "offer": ("Offer", "pdf", "offer_{id}.pdf"),
+        "purchase_draft": ("PurchaseDraft", "pdf", "purchase_draft_{id}.pdf"),
+    }
+    """Document types by name, maps to the model attribute, the model method and the file name template"""
+
+    MANIFEST_NAME = ".moco_archive.jsonl"
+    """File name of the manifest in the target directory"""
+
+    def __init__(
+        self,
+        moco,
+        target_dir: str,
+        max_workers: int = 4,
+        verify: str = "size",
+        progress=None
+    ):
+        """
+        Class constructor
+
+        :param moco: Moco instance the documents are downloaded with
+        :param target_dir: Directory the documents are written to (created if it does not exist)
+        :param max_workers: Maximum number of documents that are downloaded at the same time (default ``4``)
+        :param verify: How existing files are compared to the manifest, ``size`` or ``hash`` (default ``size``)
+        :param progress: Function that is called after every document with the
+            :class:`.ArchiveResult`, the number of finished documents and the total number of documents (``None``
+            while the ids are still being listed)
+
+        :type moco: :class:`moco_wrapper.Moco`
+        :type target_dir: str
+        :type max_workers: int
+        :type verify: str
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if verify not in ("size", "hash"):
+            raise ValueError("verify must be either 'size' or 'hash'")
+
+        self._moco = moco
+        self.target_dir = target_dir
+        self.max_workers = max_workers
+        self.verify = verify
+        self.progress = progress
+
+        self._lock = threading.Lock()
+        self._manifest = None
+
+    @property
+    def manifest_path(self) -> str:
+        """
+        Path of the manifest file
+
+        :rtype: str
+        """
+        return os.path.join(self.target_dir, self.MANIFEST_NAME)
+
+    def archive_invoices(
+        self,
+        ids=None,
+        timesheets: bool = False,
+        **filters
+    ) -> list:
+        """
+        Archives invoice pdfs (and optionally their timesheets)
+
+        :param ids: Invoice ids, if not given all invoices :meth:`moco_wrapper.models.Invoice.getlist` returns for
+            ``filters`` are archived
+        :param timesheets: If the timesheet pdf of every invoice should be archived as well (default ``False``)
+        :param filters: Keyword arguments for :meth:`moco_wrapper.models.Invoice.getlist`
+
+        :type timesheets: bool
+
+        :returns: List of :class:`.ArchiveResult`
+        :rtype: list
+        """
+        types = ["invoice", "invoice_timesheet"] if timesheets else ["invoice"]
+        return self.archive(self._documents(types, ids, self._moco.Invoice.getlist, filters))
+
+    def archive_offers(
+        self,
+        ids=None,
+        **filters
+    ) -> list:
+        """
+        Archives offer pdfs
+
+        :param ids: Offer ids, if not given all offers :meth:`moco_wrapper.models.Offer.getlist` returns for
+            ``filters`` are archived
+        :param filters: Keyword arguments for :meth:`moco_wrapper.models.Offer.getlist`
+
+        :returns: List of :class:`.ArchiveResult`
+        :rtype: list
+        """
+        return self.archive(self._documents(["offer"], ids, self._moco.Offer.getlist, filters))
+
+    def archive_purchase_drafts(
+        self,
+        ids=None
+    ) -> list:
+        """
+        Archives purchase draft pdfs
+
+        :param ids: Purchase draft ids, if not given all purchase drafts are archived
+
+        :returns: List of :class:`.ArchiveResult`
+        :rtype: list
+        """
+        return self.archive(self._documents(["purchase_draft"], ids, self._moco.PurchaseDraft.getlist, {}))
+
+    def archive(self, documents) -> list:
+        """
+        Archives the given documents
+
+        :param documents: Iterable of ``(document type, id)`` tuples, e.g. ``[("invoice", 1), ("offer", 2)]``. The
+            iterable is consumed while downloading, so generators of any length can be passed
+
+        :returns: List of :class:`.ArchiveResult` in the order of ``documents``
+        :rtype: list
+        """
+        os.makedirs(self.target_dir, exist_ok=True)
+
+        total = len(documents) if isinstance(documents, (list, tuple)) else None
+
+        results = {}
+        done = 0
+        pending = {}
+        index = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for document_type, document_id in documents:
+                if document_type not in self.DOCUMENT_TYPES:
+                    raise ValueError("Unknown document type: {}".format(document_type))
+
+                # only a few documents are queued ahead, so long id generators are not read all at once
+                if len(pending) >= self.max_workers * 2:
+                    done = self._collect(pending, results, done, total)
+
+                # run in a copy of the callers context, so e.g. Moco.impersonation applies to the download
+                future = executor.submit(contextvars.copy_context().run, self.download, document_type, document_id)
+                pending[future] = index
+                index += 1
+
+            while pending:
+                done = self._collect(pending, results, done, index)
+
+        return [results[x] for x in range(index)]
+
+    def _collect(self, pending: dict, results: dict, done: int, total) -> int:
+        """
+        Waits for at least one download to finish and reports the finished downloads
+        """
+        finished, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+
+        for future in finished:
+            result = future.result()
+            results[pending.pop(future)] = result
+            done += 1
+
+            if self.progress is not None:
+                self.progress(result, done, total)
+
+        return done
+
+    def _documents(self, types, ids, list_method, filters):
+        """
+        Yields ``(document type, id)`` tuples for the given ids, or for every item ``list_method`` returns
+        """
+        if ids is None:
+            ids = (x.id if hasattr(x, "id") else x["id"] for x in iter_items(list_method, **filters))
+
+        for document_id in ids:
+            for document_type in types:
+                yield document_type, document_id
+
+    def path(self, document_type: str, document_id: int) -> str:
+        """
+        Returns the path a document is archived at
+
+        :param document_type: Type of the document (see :attr:`DOCUMENT_TYPES`)
+        :param document_id: Id of the document
+
+        :rtype: str
+        """
+        _, _, file_name = self.DOCUMENT_TYPES[document_type]
+        return os.path.join(self.target_dir, file_name.format(id=document_id))
+
+    def download(self, document_type: str, document_id: int) -> ArchiveResult:
+        """
+        Downloads a single document, unless it is already archived
+
+        :param document_type: Type of the document (see :attr:`DOCUMENT_TYPES`)
+        :param document_id: Id of the document
+
+        :returns: Result of the download, errors are not raised but returned as failed result
+        :rtype: :class:`.ArchiveResult`
+        """
+        path = self.path(document_type, document_id)
+
+        entry = self._archived(path)
+        if entry is not None:
+            return ArchiveResult(document_type, document_id, path, ArchiveResult.SKIPPED,
+                                 size=entry["size"], sha256=entry["sha256"])
+
+        model_name, method_name, _ = self.DOCUMENT_TYPES[document_type]
+        part_path = path + ".part"
+
+        file_response = None
+        try:
+            file_response = getattr(getattr(self._moco, model_name), method_name)(document_id, stream=True)
+            if not isinstance(file_response, FileResponse):
+                raise ValueError("Expected a pdf document, got {}".format(file_response))
+
+            digest = hashlib.sha256()
+            size = 0
+
+            with open(part_path, "wb") as part_file:
+                for chunk in file_response.iter_chunks():
+                    part_file.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+
+            os.replace(part_path, path)
+        except (Exception, MocoException) as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+            return ArchiveResult(document_type, document_id, path, ArchiveResult.FAILED, error=e)
+        finally:
+            # releases the connection of the stream, also if the download failed
+            if isinstance(file_response, FileResponse):
+                file_response.close()
+
+        result = ArchiveResult(document_type, document_id, path, ArchiveResult.DOWNLOADED,
+                               size=size, sha256=digest.hexdigest())
+        self._record(result)
+        return result
+
+    def _load_manifest(self) -> dict:
+        """
+        Reads the manifest once, later entries of a file replace earlier ones
+        """
+        if self._manifest is None:
+            manifest = {}
+
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, "r", encoding="utf-8") as manifest_file:
+                    for line in manifest_file:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # incomplete last line of an interrupted run
+
+                        manifest[entry["file"]] = entry
+
+            self._manifest = manifest
+
+        return self._manifest
+
+    def _archived(self, path: str) -> dict:
+        """
+        Returns the manifest entry of a file, if the file exists and matches the entry
+        """
+        with self._lock:
+            entry = self._load_manifest().get(os.path.basename(path), None)
+
+        if entry is None or not os.path.isfile(path):
+            return None
+
+        if os.path.getsize(path) != entry["size"]:
+            return None
+
+        if self.verify == "hash":
+            digest = hashlib.sha256()
+            with open(path, "rb") as archived_file:
+                for chunk in iter(lambda: archived_file.read(64 * 1024), b""):
+                    digest.update(chunk)
+
+            if digest.hexdigest() != entry["sha256"]:
+                return None
+
+        return entry
+
+    def _record(self, result: ArchiveResult):
+        """
+        Appends a downloaded document to the manifest
+        """
+        entry = {
+            "file": os.path.basename(result.path),
+            "type": result.document_type,
+            "id": result.document_id,
+            "size": result.size,
+            "sha256": result.sha256,
+        }
+
+        with self._lock:
+            self._load_manifest()[entry["file"]] = entry
+
+            with open(self.manifest_path, "a", encoding="utf-8") as manifest_file:
+                manifest_file.write(json.dumps(entry) + "\n")
@@ -0,0 +1,312 @@
+import contextvars
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from requests import exceptions as http_exceptions
+from urllib3 import exceptions as urllib3_exceptions
+
+from moco_wrapper.exceptions import MocoException, RateLimitException, ServerErrorException
+from moco_wrapper.util.requestor.retry import RetryPolicy
+
+
+class Operation(namedtuple("Operation", ["model", "method", "kwargs"])):
+    """
+    Single call of a model method
+
+    :param model: Name of the model (e.g. ``"Activity"``) or the model object itself (e.g. ``m.Activity``)
+    :param method: Name of the model method (e.g. ``"create"``)
+    :param kwargs: Keyword arguments of the method
+
+    .. code-block:: python
+
+        from moco_wrapper.util.batch import Operation
+
+        Operation("Activity", "create", {"activity_date": date(2020, 1, 1), "project_id": 1, "task_id": 2, "hours": 1})
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, model, method: str, kwargs: dict = None):
+        return super(Operation, cls).__new__(cls, model, method, kwargs if kwargs is not None else {})
+
+    def bind(self, moco):
+        """
+        Returns the model method of the operation
+
+        :param moco: Moco instance the model name is resolved with
+
+        :returns: Bound method
+        """
+        model = getattr(moco, self.model) if isinstance(self.model, str) else self.model
+        return getattr(model, self.method)
+
+
+class OperationResult(object):
+    """
+    Outcome of a single operation of a batch
+    """
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        index: int,
+        operation: Operation,
+        status: str,
+        response=None,
+        error: Exception = None,
+        attempts: int = 1
+    ):
+        self.index = index
+        """Position of the operation in the batch"""
+
+        self.operation = operation
+        """The operation"""
+
+        self.status = status
+        """``succeeded`` or ``failed``"""
+
+        self.response = response
+        """Response the model method returned, if the operation succeeded"""
+
+        self.error = error
+        """Exception that occurred in the last attempt, if the operation failed"""
+
+        self.attempts = attempts
+        """Number of times the operation was executed"""
+
+    @property
+    def ok(self) -> bool:
+        """
+        If the operation succeeded
+
+        :rtype: bool
+        """
+        return self.status == self.SUCCEEDED
+
+    @property
+    def data(self):
+        """
+        Data of the response, ``None`` if the operation failed
+        """
+        return self.response.data if self.response is not None else None
+
+    def __repr__(self):
+        model = self.operation.model
+        model_name = model if isinstance(model, str) else type(model).__name__
+
+        return "<OperationResult {} {}.{} {}>".format(self.index, model_name, self.operation.method, self.status)
+
+
+class BatchExecutor(object):
+    """
+    Executes model methods concurrently, for write operations that have no bulk endpoint in the api.
+
+    The operations are read from the iterable while executing, so generators of any length can be passed. An operation
+    that fails with an error that guarantees the request was not processed (rate limit, no connection to the api) is
+    executed again according to the ``retry_policy``, every other error is recorded in the result of the operation and
+    the batch goes on.
+
+    Server errors, read timeouts and connections that were lost while the request was sent are only retried with
+    ``retry_unsafe=True``. The api may have processed such a request already, so executing a write operation like
+    ``Activity.create`` again can create the record twice. Only enable it for idempotent operations.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.batch import BatchExecutor, Operation
+
+        m = Moco(...)
+
+        operations = (
+            Operation("Activity", "create", {
+                "activity_date": x.date,
+                "project_id": x.project_id,
+                "task_id": x.task_id,
+                "hours": x.hours,
+                "description": x.description,
+            })
+            for x in timesheet_entries
+        )
+
+        executor = BatchExecutor(m, max_workers=8)
+        results = executor.run(operations)
+
+        failed = [x for x in results if not x.ok]
+
+    .. note::
+
+        All operations are sent with the requestor of the moco instance, so a rate limiter of the requestor (see
+        :class:`moco_wrapper.util.requestor.RateLimiter`) paces the concurrent requests. Use a connection pool that is
+        at least as large as ``max_workers`` (see :class:`moco_wrapper.util.requestor.ConnectionPool`).
+
+    .. note::
+
+        The :class:`moco_wrapper.util.requestor.DefaultRequestor` already retries rate limited requests (up to 10
+        attempts with its default retry policy) before a :class:`moco_wrapper.exceptions.RateLimitException` reaches
+        the executor. The attempts of the executor add to those, one operation can be sent up to
+        ``10 * retry_policy.max_attempts`` times.
+    """
+
+    RETRY_EXCEPTIONS = (
+        RateLimitException,
+        http_exceptions.ConnectTimeout
+    )
+    """Exceptions after which an operation is executed again, the request was not processed by the api"""
+
+    UNSAFE_RETRY_EXCEPTIONS = (
+        ServerErrorException,
+        http_exceptions.ConnectionError,
+        http_exceptions.Timeout
+    )
+    """Exceptions after which an operation is only executed again with ``retry_unsafe``, the request may have been
+    processed by the api"""
+
+    def __init__(
+        self,
+        moco,
+        max_workers: int = 4,
+        retry_policy: RetryPolicy = None,
+        progress=None,
+        retry_unsafe: bool = False
+    ):
+        """
+        Class constructor
+
+        :param moco: Moco instance the operations are executed with
+        :param max_workers: Maximum number of operations that are executed at the same time (default ``4``)
+        :param retry_policy: Policy for executing failed operations again (default ``None``, at most 3 attempts)
+        :param progress: Function that is called after every operation with the :class:`.OperationResult`, the number
+            of finished operations and the total number of operations (``None`` while operations are still being read)
+        :param retry_unsafe: If operations are also executed again after server errors, read timeouts and lost
+            connections, only for idempotent operations (default ``False``, see :attr:`UNSAFE_RETRY_EXCEPTIONS`)
+
+        :type moco: :class:`moco_wrapper.Moco`
+        :type max_workers: int
+        :type retry_policy: :class:`moco_wrapper.util.requestor.RetryPolicy`
+        :type retry_unsafe: bool
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_attempts=3)
+
+        self._moco = moco
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy
+        self.progress = progress
+        self.retry_unsafe = retry_unsafe
+
+    def run(self, operations) -> list:
+        """
+        Executes the operations
+
+        :param operations: Iterable of :class:`.Operation` or ``(model, method, kwargs)`` tuples, consumed while
+            executing
+
+        :returns: List of :class:`.OperationResult` in the order of ``operations``
+        :rtype: list
+        """
+        total = len(operations) if isinstance(operations, (list, tuple)) else None
+
+        results = {}
+        done = 0
+        pending = {}
+        index = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for operation in operations:
+                if not isinstance(operation, Operation):
+                    operation = Operation(*operation)
+
+                # only a few operations are queued ahead, so long generators are not read all at once
+                if len(pending) >= self.max_workers * 2:
+                    done = self._collect(pending, results, done, total)
+
+                # run in a copy of the callers context, so e.g. Moco.impersonation applies to the operation
+                pending[executor.submit(contextvars.copy_context().run, self.execute, index, operation)] = index
+                index += 1
+
+            while pending:
+                done = self._collect(pending, results, done, index)
+
+        return [results[x] for x in range(index)]
+
+    def _collect(self, pending: dict, results: dict, done: int, total) -> int:
+        """
+        Waits for at least one operation to finish and reports the finished operations
+        """
+        finished, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+
+        for future in finished:
+            result = future.result()
+            results[pending.pop(future)] = result
+            done += 1
+
+            if self.progress is not None:
+                self.progress(result, done, total)
+
+        return done
+
+    def is_retryable(self, error) -> bool:
+        """
+        Checks if an operation that failed with the given error is executed again
+
+        :param error: Exception the operation failed with
+
+        :rtype: bool
+        """
+        if isinstance(error, self.RETRY_EXCEPTIONS):
+            return True
+
+        if isinstance(error, http_exceptions.ConnectionError):
+            # the connection could not be established (e.g. refused or unknown host), nothing was sent
+            reason = error.args[0] if error.args else None
+            if isinstance(getattr(reason, "reason", reason), urllib3_exceptions.NewConnectionError):
+                return True
+
+        return self.retry_unsafe and isinstance(error, self.UNSAFE_RETRY_EXCEPTIONS)
+
+    def execute(self, index: int, operation: Operation) -> OperationResult:
+        """
+        Executes a single operation, retrying errors after which that is safe (see :meth:`is_retryable`)
+
+        :param index: Position of the operation in the batch
+        :param operation: Operation to execute
+
+        :returns: Result of the operation, errors are not raised but returned as failed result
+        :rtype: :class:`.OperationResult`
+        """
+        policy = self.retry_policy
+        started_at = policy.clock()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            policy.statistics.record_attempt()
+
+            try:
+                response = operation.bind(self._moco)(**operation.kwargs)
+                return OperationResult(index, operation, OperationResult.SUCCEEDED, response=response,
+                                       attempts=attempt)
+            except (Exception, MocoException) as e:
+                if not self.is_retryable(e):
+                    return OperationResult(index, operation, OperationResult.FAILED, error=e, attempts=attempt)
+
+                http_response = getattr(e, "http_response", None)
+                delay = policy.next_delay(attempt, http_response, started_at)
+                if delay is None:
+                    policy.statistics.record_exhausted()
+                    return OperationResult(index, operation, OperationResult.FAILED, error=e, attempts=attempt)
+
+                retry_after = policy.retry_after(http_response) if policy.respect_retry_after else None
+                rate_limiter = getattr(getattr(self._moco, "requestor", None), "rate_limiter", None)
+                if retry_after is not None and rate_limiter is not None:
+                    # pause every operation of the batch, not only the one that was rate limited
+                    rate_limiter.block(retry_after)
+
+                policy.statistics.record_retry(delay)
+                policy.sleep(delay)
@@ -0,0 +1,268 @@
+import contextvars
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from moco_wrapper.exceptions import MocoException, UnprocessableException
+from moco_wrapper.util.json_codec import default_codec
+from moco_wrapper.util.response import ErrorResponse
+
+
+class BulkItemResult(object):
+    """
+    Outcome of writing a single item of a bulk write
+    """
+
+    CREATED = "created"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        index: int,
+        item: dict,
+        status: str,
+        data=None,
+        error: Exception = None
+    ):
+        self.index = index
+        """Position of the item in the items that were passed to the writer"""
+
+        self.item = item
+        """Item that was written"""
+
+        self.status = status
+        """``created`` or ``failed``"""
+
+        self.data = data
+        """Object the api returned for the item, if it was created"""
+
+        self.error = error
+        """Exception that occurred, if the item could not be written"""
+
+    @property
+    def ok(self) -> bool:
+        """
+        If the item was created
+
+        :rtype: bool
+        """
+        return self.status == self.CREATED
+
+    def __repr__(self):
+        return "<BulkItemResult {} {}>".format(self.index, self.status)
+
+
+class BulkWriter(object):
+    """
+    Writes large numbers of items with the bulk endpoints of the api, split into chunks that are sent concurrently.
+
+    The items are read from the iterable while writing, so generators of any length can be passed. Every chunk holds
+    at most ``chunk_size`` items and ``max_chunk_bytes`` bytes of json. The bulk endpoints create either all items of a
+    request or none, so a chunk that is rejected as invalid (``422``) is split in halves and written again, until the
+    invalid items are isolated. Every other item of the chunk is still created.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.bulk import BulkWriter
+        from moco_wrapper.util.generator import ProjectExpenseGenerator
+
+        m = Moco(...)
+        gen = ProjectExpenseGenerator()
+
+        items = (gen.generate(x.date, x.title, x.quantity, x.unit, x.price, x.cost) for x in erp_expenses)
+
+        writer = BulkWriter(m, max_workers=4, chunk_size=100)
+        results = writer.write_project_expenses(project_id=22, items=items)
+
+        failed = [x for x in results if not x.ok]
+
+    .. note::
+
+        All chunks are sent with the requestor of the moco instance, so a rate limiter of the requestor (see
+        :class:`moco_wrapper.util.requestor.RateLimiter`) paces the concurrent requests as well. Use a connection pool
+        that is at least as large as ``max_workers`` (see :class:`moco_wrapper.util.requestor.ConnectionPool`).
+    """
+
+    def __init__(
+        self,
+        moco,
+        max_workers: int = 4,
+        chunk_size: int = 100,
+        max_chunk_bytes: int = 512 * 1024,
+        split_invalid: bool = True,
+        progress=None
+    ):
+        """
+        Class constructor
+
+        :param moco: Moco instance the items are written with
+        :param max_workers: Maximum number of chunks that are sent at the same time (default ``4``)
+        :param chunk_size: Maximum number of items per chunk (default ``100``)
+        :param max_chunk_bytes: Maximum size of the json encoded items of a chunk in bytes (default ``512 KiB``), a
+            single item that is larger is sent as a chunk of its own
+        :param split_invalid: If chunks that are rejected as invalid should be split to write the valid items
+            (default ``True``)
+        :param progress: Function that is called after every chunk with the list of :class:`.BulkItemResult` of the
+            chunk, the number of finished items and the number of items read so far
+
+        :type moco: :class:`moco_wrapper.Moco`
+        :type max_workers: int
+        :type chunk_size: int
+        :type max_chunk_bytes: int
+        :type split_invalid: bool
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if chunk_size < 1 or max_chunk_bytes < 1:
+            raise ValueError("chunk_size and max_chunk_bytes must be at least 1")
+
+        self._moco = moco
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.split_invalid = split_invalid
+        self.progress = progress
+
+        self._codec = default_codec()
+
+    def write_project_expenses(
+        self,
+        project_id: int,
+        items
+    ) -> list:
+        """
+        Creates project expenses with :meth:`moco_wrapper.models.ProjectExpense.create_bulk`
+
+        :param project_id: Id of the project to create the expenses for
+        :param items: Iterable of expense items (see :class:`moco_wrapper.util.generator.ProjectExpenseGenerator`)
+
+        :type project_id: int
+
+        :returns: List of :class:`.BulkItemResult` in the order of ``items``
+        :rtype: list
+        """
+        return self.write(lambda chunk: self._moco.ProjectExpense.create_bulk(project_id, chunk), items)
+
+    def write_invoice_payments(
+        self,
+        items
+    ) -> list:
+        """
+        Creates invoice payments with :meth:`moco_wrapper.models.InvoicePayment.create_bulk`
+
+        :param items: Iterable of payment items (see :class:`moco_wrapper.util.generator.InvoicePaymentGenerator`)
+
+        :returns: List of :class:`.BulkItemResult` in the order of ``items``
+        :rtype: list
+        """
+        return self.write(lambda chunk: self._moco.InvoicePayment.create_bulk(chunk), items)
+
+    def write(
+        self,
+        create_bulk,
+        items
+    ) -> list:
+        """
+        Writes items in chunks
+
+        :param create_bulk: Function that is called with a list of items and returns the list response of the bulk
+            endpoint
+        :param items: Iterable of items, consumed while writing
+
+        :returns: List of :class:`.BulkItemResult` in the order of ``items``
+        :rtype: list
+        """
+        results = {}
+        pending = {}
+        state = {"done": 0, "read": 0}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk in self._chunks(items, results, state):
+                # only a few chunks are queued ahead, so long item generators are not read all at once
+                if len(pending) >= self.max_workers * 2:
+                    self._collect(pending, results, state)
+
+                # run in a copy of the callers context, so e.g. Moco.impersonation applies to the chunk
+                future = executor.submit(contextvars.copy_context().run, self._write_chunk, create_bulk, chunk)
+                pending[future] = len(chunk)
+
+            while pending:
+                self._collect(pending, results, state)
+
+        return [results[x] for x in range(state["read"])]
+
+    def _collect(self, pending: dict, results: dict, state: dict):
+        """
+        Waits for at least one chunk to finish and reports the finished chunks
+        """
+        finished, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+
+        for future in finished:
+            pending.pop(future)
+            self._report(future.result(), results, state)
+
+    def _report(self, chunk_results: list, results: dict, state: dict):
+        for result in chunk_results:
+            results[result.index] = result
+
+        state["done"] += len(chunk_results)
+
+        if self.progress is not None:
+            self.progress(chunk_results, state["done"], state["read"])
+
+    def _chunks(self, items, results: dict, state: dict):
+        """
+        Yields lists of ``(index, item)`` tuples that fit into a single request
+        """
+        chunk = []
+        chunk_bytes = 0
+
+        for item in items:
+            index = state["read"]
+            state["read"] += 1
+
+            try:
+                item_bytes = len(self._codec.dumps(item)) + 1  # separating comma
+            except (TypeError, ValueError, OverflowError) as e:
+                # items that cannot be encoded would fail the whole chunk
+                self._report([BulkItemResult(index, item, BulkItemResult.FAILED, error=e)], results, state)
+                continue
+
+            if chunk and (len(chunk) >= self.chunk_size or chunk_bytes + item_bytes > self.max_chunk_bytes):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append((index, item))
+            chunk_bytes += item_bytes
+
+        if chunk:
+            yield chunk
+
+    def _write_chunk(self, create_bulk, chunk: list) -> list:
+        """
+        Writes a chunk, errors are not raised but returned as failed results
+        """
+        try:
+            response = create_bulk([item for _, item in chunk])
+
+            if isinstance(response, ErrorResponse):
+                error = response.data
+                raise error if isinstance(error, BaseException) else ValueError("Bulk request failed: {}".format(error))
+
+            created = list(response.data)
+            if len(created) != len(chunk):
+                created = [None] * len(chunk)  # the created objects cannot be matched to the items
+        except (Exception, MocoException) as e:
+            if self.split_invalid and len(chunk) > 1 and isinstance(e, UnprocessableException):
+                middle = len(chunk) // 2
+                return self._write_chunk(create_bulk, chunk[:middle]) + \
+                    self._write_chunk(create_bulk, chunk[middle:])
+
+            return [BulkItemResult(index, item, BulkItemResult.FAILED, error=e) for index, item in chunk]
+
+        return [
+            BulkItemResult(index, item, BulkItemResult.CREATED, data=data)
+            for (index, item), data in zip(chunk, created)
+        ]
@@ -0,0 +1,260 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+from moco_wrapper.util.response import ObjectResponse, ListResponse
+
+
+def resource_family(path: str) -> str:
+    """
+    Returns the resource family of an url path, the first segment of the path (e.g. ``projects`` for
+    ``/projects/1/tasks``)
+
+    :param path: Url path or url template
+
+    :type path: str
+
+    :rtype: str
+    """
+    segments = [x for x in path.split("?", 1)[0].split("/") if x]
+    return segments[0] if segments else ""
+
+
+class _Entry(object):
+    __slots__ = ("response", "resource", "expires_at", "size")
+
+    def __init__(self, response, resource, expires_at, size):
+        self.response = response
+        self.resource = resource
+        self.expires_at = expires_at
+        self.size = size
+
+
+class ResponseCache(object):
+    """
+    In-memory cache for the responses of read endpoints
+
+    Only responses of endpoints that declare a ``cache_ttl`` (see :class:`moco_wrapper.util.endpoint.Endpoint`) are
+    cached, e.g. units, deal categories, purchase categories and the hourly rates of the account. The ttl of an
+    endpoint can be changed (or caching enabled for other endpoints) with ``ttls``. The least recently used responses
+    are removed once the cache holds ``max_entries`` responses or ``max_bytes`` bytes of response bodies.
+
+    Every write request (``POST``, ``PUT``, ``PATCH``, ``DELETE``) removes the cached responses of the same resource
+    family, e.g. creating a unit removes all cached responses of ``/units``.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.cache import ResponseCache
+
+        m = Moco(
+            auth={...},
+            response_cache=ResponseCache(max_entries=512, ttls={"user_getlist": 600})
+        )
+
+        units = m.Unit.getlist()  # sent to the api
+        units = m.Unit.getlist()  # returned from the cache
+
+        print(m.response_cache.hits, m.response_cache.misses)
+
+    .. note::
+
+        Responses are cached by url, url parameters and headers, so every api key and impersonated user has its own
+        entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttls: dict = None,
+        clock=time.monotonic
+    ):
+        """
+        Class constructor
+
+        :param max_entries: Maximum number of cached responses (default ``1024``)
+        :param max_bytes: Maximum size of all cached response bodies in bytes (default ``32 MiB``)
+        :param ttls: Time to live in seconds by endpoint slug, replaces the ttl of the endpoint (``0`` or ``None``
+            disables caching of an endpoint, default ``None``)
+        :param clock: Monotonic clock function (default :func:`time.monotonic`)
+
+        :type max_entries: int
+        :type max_bytes: int
+        :type ttls: dict
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls) if ttls is not None else {}
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+
+        # incremented by every invalidation, responses requested before are not stored anymore
+        self._generations = {}
+        self._cleared = 0
+
+        self.hits = 0
+        """Number of responses that were returned from the cache"""
+
+        self.misses = 0
+        """Number of cacheable requests that were sent to the api"""
+
+        self.evictions = 0
+        """Number of responses that were removed to stay within the limits"""
+
+    def ttl(self, ep) -> float:
+        """
+        Returns the time to live for the responses of an endpoint
+
+        :param ep: Endpoint or bound endpoint
+
+        :returns: Time to live in seconds, ``None`` if the endpoint is not cached
+        :rtype: float
+        """
+        if ep.slug in self.ttls:
+            return self.ttls[ep.slug] or None
+
+        return getattr(ep, "cache_ttl", None)
+
+    @staticmethod
+    def key(path: str, params=None, headers=None) -> tuple:
+        """
+        Returns the cache key of a request
+
+        :param path: Full url of the request
+        :param params: Url parameters
+        :param headers: Headers of the request
+
+        :rtype: tuple
+        """
+        return (
+            path,
+            tuple(sorted((str(k), repr(v)) for k, v in (params or {}).items())),
+            tuple(sorted((str(k), str(v)) for k, v in (headers or {}).items())),
+        )
+
+    def get(self, key: tuple):
+        """
+        Returns a copy of a cached response
+
+        :param key: Cache key (see :meth:`key`)
+
+        :returns: Response object, ``None`` if the response is not cached or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is not None and entry.expires_at <= self.clock():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # every caller gets its own response and decoded body, changes to the returned objects never reach the cache
+        return entry.response.copy()
+
+    def generation(self, resource: str) -> int:
+        """
+        Returns the number of times the responses of a resource family were invalidated
+
+        :param resource: Resource family (see :func:`resource_family`)
+
+        :rtype: int
+        """
+        return self._cleared + self._generations.get(resource, 0)
+
+    def set(self, key: tuple, resource: str, response, ttl: float, generation: int = None):
+        """
+        Caches a response, only successful object and list responses are cached
+
+        :param key: Cache key (see :meth:`key`)
+        :param resource: Resource family of the request (see :func:`resource_family`)
+        :param response: Response object of the requestor
+        :param ttl: Time to live in seconds
+        :param generation: Generation of the resource family before the request was sent (see :meth:`generation`),
+            the response is not stored if the resource family was invalidated in the meantime (default ``None``)
+        """
+        if not ttl or not isinstance(response, (ObjectResponse, ListResponse)):
+            return
+
+        size = self._response_size(response)
+        if size > self.max_bytes:
+            return
+
+        # the cached response is never handed out, callers only receive copies (the response that is stored is
+        # converted and returned to the caller of the request, so it must not share its decoded body either)
+        entry = _Entry(response.copy(), resource, self.clock() + ttl, size)
+
+        with self._lock:
+            if generation is not None and generation != self._cleared + self._generations.get(resource, 0):
+                return  # written while the response was requested, the response may be outdated
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, resource: str = None):
+        """
+        Removes cached responses
+
+        :param resource: Resource family whose responses are removed (default ``None``, all responses)
+
+        :type resource: str
+        """
+        with self._lock:
+            if resource is None:
+                self._cleared += 1
+                self._entries.clear()
+                self._size = 0
+                return
+
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+
+            for key in [k for k, v in self._entries.items() if v.resource == resource]:
+                self._remove(key)
+
+    def _remove(self, key: tuple):
+        self._size -= self._entries.pop(key).size
+
+    @staticmethod
+    def _response_size(response) -> int:
+        content = getattr(response.response, "content", None)
+        if isinstance(content, bytes):
+            return len(content)
+
+        return len(repr(response.data))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Size of all cached response bodies in bytes
+
+        :rtype: int
+        """
+        return self._size
+
+    def __str__(self):
+        return "<ResponseCache, Entries: {}, Size: {} bytes, Hits: {}, Misses: {}>".format(
+            len(self._entries), self._size, self.hits, self.misses
+        )
@@ -1,2 +1,3 @@
 from .endpoint import Endpoint
+from .bound import BoundEndpoint
 from .manager import EndpointManager
@@ -0,0 +1,35 @@
+class BoundEndpoint(object):
+    """
+    Endpoint that is bound to the requestor method it is sent with.
+
+    Bound endpoints are created once per moco instance (see :meth:`moco_wrapper.Moco.bind`), so sending a request only
+    needs a single dictionary lookup by slug instead of resolving the endpoint and the http method on every call.
+    Bound endpoints provide the same attributes as :class:`.Endpoint` and can be used wherever an endpoint is expected.
+    """
+
+    __slots__ = ("endpoint", "slug", "method", "type", "url_format", "send", "cache_ttl", "resource")
+
+    def __init__(
+        self,
+        endpoint,
+        send
+    ):
+        """
+        Class constructor
+
+        :param endpoint: Endpoint to bind
+        :param send: Requestor method the endpoint is sent with (e.g. ``requestor.get``)
+
+        :type endpoint: :class:`moco_wrapper.util.endpoint.Endpoint`
+        """
+        self.endpoint = endpoint
+        self.slug = endpoint.slug
+        self.method = endpoint.method
+        self.type = endpoint.type
+        self.url_format = endpoint.url_format
+        self.send = send
+        self.cache_ttl = endpoint.cache_ttl
+        self.resource = endpoint.resource
+
+    def __repr__(self):
+        return "<BoundEndpoint {} {} {}>".format(self.slug, self.method, self.endpoint.url_template)
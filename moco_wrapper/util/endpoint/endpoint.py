@@ -1,10 +1,16 @@
+import string
+
+from moco_wrapper.util.cache import resource_family
+
+
 class Endpoint(object):
     def __init__(
         self,
         slug: str,
         url_template: str,
         http_method: str,
-        objector_model_type=None
+        objector_model_type=None,
+        cache_ttl: float = None
     ):
         """
         Class constructor for Endpoint object
@@ -13,17 +19,35 @@ class Endpoint(object):
         :param url_template: Url Path this Endpoint uses
         :param http_method: Http method this endpoint uses
         :param objector_model_type: Type of objector model this endpoint returns
+        :param cache_ttl: Time in seconds responses of this endpoint may be cached for, if the moco instance has a
+            response cache (see :class:`moco_wrapper.util.cache.ResponseCache`, default ``None``, not cached)
 
         :type slug: str
         :type url_template: str
         :type http_method: str
         :type objector_model_type: type
+        :type cache_ttl: float
         """
 
         self.slug = slug
         self.url_template = url_template
         self.objector_model_type = objector_model_type
         self.method = http_method
+        self.cache_ttl = cache_ttl
+
+        self.resource = resource_family(url_template)
+        """Resource family of the endpoint, writes invalidate the cached responses of the same family"""
+
+        self.url_fields = tuple(
+            name for _, name, _, _ in string.Formatter().parse(url_template) if name is not None
+        )
+        """Names of the parameters the url template contains"""
+
+        # templates are parsed once, static urls are returned as they are
+        if len(self.url_fields) > 0:
+            self._format_url = url_template.format_map
+        else:
+            self._format_url = None
 
     def url_format(self, params=None):
         """
@@ -50,10 +74,10 @@ class Endpoint(object):
             '/projects/44/assigned'
 
         """
-        if params is None:
+        if params is None or self._format_url is None:
             return self.url_template
         else:
-            return self.url_template.format(**params)
+            return self._format_url(params)
 
     @property
     def type(self):
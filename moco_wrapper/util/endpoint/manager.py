@@ -1,3 +1,7 @@
+import threading
+
+from types import MappingProxyType
+
 from moco_wrapper import models as m
 from moco_wrapper.util.endpoint import Endpoint
 
@@ -5,8 +9,14 @@ from moco_wrapper.util.endpoint import Endpoint
 class EndpointManager(object):
     """
     Class for managing all models that the moco class uses
+
+    The endpoints never change at runtime, so all moco instances share one manager (see :meth:`shared`). The map of
+    endpoints is read-only.
     """
 
+    _shared = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         """
         Class constructor
@@ -51,9 +61,27 @@ class EndpointManager(object):
 
         self._build_map()
 
+    @classmethod
+    def shared(cls) -> "EndpointManager":
+        """
+        Returns the endpoint manager that is shared by all moco instances, it is created on first use
+
+        :rtype: :class:`moco_wrapper.util.endpoint.EndpointManager`
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+
+        return cls._shared
+
     def _build_map(self):
+        endpoint_map = {}
         for endpoint in self.endpoints:
-            self.map[endpoint.slug] = endpoint
+            endpoint_map[endpoint.slug] = endpoint
+
+        self.endpoints = tuple(self.endpoints)
+        self.map = MappingProxyType(endpoint_map)
 
     def get(self, slug) -> Endpoint:
         """
@@ -1 +1,2 @@
 from .file import File
+from .multipart import MultipartStream
@@ -7,6 +7,9 @@ class File(object):
     Helper class for handling files
     """
 
+    CHUNK_SIZE = 48 * 1024
+    """Default number of bytes that are read at a time (48 KiB, a multiple of 3)"""
+
     def __init__(self, file_path, file_name=None):
         """
         Class Constructor
@@ -25,18 +28,50 @@ class File(object):
 
         # if no name was set for the file, use the basename
         if file_name is None:
-            with open(self.path, "r") as f:
-                self.name = basename(f.name)
+            self.name = basename(file_path)
 
     def to_base64(self):
         """
         Converts the content of the file to its base64 representation.
 
+        The file is encoded in chunks (see :meth:`iter_base64`), so the raw content is never read as a whole.
+
         :returns: File content as base64
         :rtype: str
         """
+        return "".join(self.iter_base64())
+
+    def iter_base64(
+        self,
+        chunk_size: int = None
+    ):
+        """
+        Yields the base64 representation of the file in chunks
+
+        The chunks can be joined (or written one after another) to get the same result as :meth:`to_base64`.
+
+        :param chunk_size: Number of bytes of the file that are encoded at a time, rounded down to a multiple of 3
+            (default :attr:`CHUNK_SIZE`)
+
+        :type chunk_size: int
+
+        .. code-block:: python
+
+            from moco_wrapper.util.io import File
+
+            with open("./receipt.b64", "w") as target:
+                for chunk in File("./receipt.pdf").iter_base64():
+                    target.write(chunk)
+        """
+        if chunk_size is None:
+            chunk_size = self.CHUNK_SIZE
+
+        # three bytes are encoded as four characters, only the last chunk may be padded
+        chunk_size = max(3, chunk_size - chunk_size % 3)
+
         with open(self.path, "rb") as f:
-            return b64encode(f.read()).decode("utf-8")
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                yield b64encode(chunk).decode("ascii")
 
     @classmethod
     def load(cls, path):
@@ -0,0 +1,209 @@
+import io
+import mimetypes
+import os
+
+from .file import File
+
+
+class MultipartStream(io.RawIOBase):
+    """
+    ``multipart/form-data`` http body that is read from disk while it is sent
+
+    The files are only opened when their part of the body is read, and every file is closed as soon as it was read
+    completely. The requestors close the file that is still open after sending the body (e.g. if the connection was
+    lost while sending). At most ``size`` bytes (the block size of the http connection) are held in memory at a time.
+    The length of the body is known in advance, so the request is sent with a ``Content-Length`` header.
+
+    .. code-block:: python
+
+        from moco_wrapper.util.io import File, MultipartStream
+
+        body = MultipartStream({"file": File("./receipt.pdf")})
+        m.patch(
+            "purchase_store_document",
+            ep_params={"id": 123},
+            headers={"Content-Type": body.content_type},
+            data=body
+        )
+
+    .. note::
+
+        The body can be sent again after calling ``seek(0)``, e.g. when the request is retried. Seeking to any other
+        position is not supported.
+    """
+
+    DEFAULT_CONTENT_TYPE = "application/octet-stream"
+    """Content type of files whose type cannot be guessed from their name"""
+
+    def __init__(
+        self,
+        files: dict,
+        fields: dict = None,
+        boundary: str = None
+    ):
+        """
+        Class constructor
+
+        :param files: Files of the body by field name
+        :param fields: Text fields of the body by field name (default ``None``)
+        :param boundary: Boundary between the parts (default ``None``, a random boundary)
+
+        :type files: dict
+        :type fields: dict
+        :type boundary: str
+        """
+        super(MultipartStream, self).__init__()
+
+        self.boundary = boundary if boundary is not None else os.urandom(16).hex()
+        """Boundary between the parts of the body"""
+
+        # parts are either encoded bytes or files that are read from disk
+        self._parts = []
+
+        for name, value in (fields or {}).items():
+            self._parts.append(self._part_header(name) + str(value).encode("utf-8") + b"\r\n")
+
+        for name, file in files.items():
+            if not isinstance(file, File):
+                file = File(file)
+
+            content_type = mimetypes.guess_type(file.name)[0] or self.DEFAULT_CONTENT_TYPE
+            self._parts.append(self._part_header(name, file.name, content_type))
+            self._parts.append(file)
+            self._parts.append(b"\r\n")
+
+        self._parts.append("--{}--\r\n".format(self.boundary).encode("utf-8"))
+
+        self._length = sum(
+            os.path.getsize(x.path) if isinstance(x, File) else len(x) for x in self._parts
+        )
+
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+        self._file = None
+
+    def _part_header(self, name: str, file_name: str = None, content_type: str = None) -> bytes:
+        """
+        Returns the boundary and headers of a single part
+        """
+        disposition = 'form-data; name="{}"'.format(self._quote(name))
+        if file_name is not None:
+            disposition += '; filename="{}"'.format(self._quote(file_name))
+
+        lines = [
+            "--{}".format(self.boundary),
+            "Content-Disposition: {}".format(disposition),
+        ]
+
+        if content_type is not None:
+            lines.append("Content-Type: {}".format(content_type))
+
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "%0D").replace("\n", "%0A")
+
+    @property
+    def content_type(self) -> str:
+        """
+        Value of the ``Content-Type`` header the body has to be sent with (includes the boundary)
+
+        :rtype: str
+        """
+        return "multipart/form-data; boundary={}".format(self.boundary)
+
+    def __len__(self):
+        return self._length
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Rewinds the body, only ``seek(0)`` is supported
+        """
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartStream can only be rewound to the start")
+
+        self.close_file()
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+        return 0
+
+    def read(self, size=-1) -> bytes:
+        """
+        Reads the next ``size`` bytes of the body (everything that is left if ``size`` is negative)
+
+        :param size: Maximum number of bytes to read
+
+        :rtype: bytes
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed MultipartStream")
+
+        if size is None or size < 0:
+            size = self._length - self._position
+
+        chunks = []
+        remaining = size
+
+        while remaining > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+
+            if isinstance(part, File):
+                if self._file is None:
+                    self._file = open(part.path, "rb")
+
+                chunk = self._file.read(remaining)
+                if not chunk:
+                    self.close_file()
+                    self._index += 1
+                    continue
+            else:
+                chunk = part[self._offset:self._offset + remaining]
+                self._offset += len(chunk)
+
+                if self._offset >= len(part):
+                    self._index += 1
+                    self._offset = 0
+
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        data = b"".join(chunks)
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close_file(self):
+        """
+        Closes the file that is currently read
+
+        The body can still be read again after ``seek(0)``, the files are opened again when they are read.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """
+        Closes the stream and the file that is currently read
+        """
+        self.close_file()
+        super(MultipartStream, self).close()
+
+    def __str__(self):
+        return "<MultipartStream, Boundary: {}, Length: {}>".format(self.boundary, self._length)
@@ -0,0 +1,117 @@
+import json
+
+
+class JsonCodec(object):
+    """
+    Codec for decoding response bodies and encoding request bodies, uses the :mod:`json` module of the standard
+    library.
+
+    .. seealso::
+
+        :meth:`default_codec`
+    """
+
+    name = "json"
+
+    def loads(self, content):
+        """
+        Decodes json content
+
+        :param content: Json document
+
+        :type content: bytes, str
+
+        :returns: Decoded content
+        :raises ValueError: If the content is not valid json
+        """
+        return json.loads(content)
+
+    def dumps(self, data) -> bytes:
+        """
+        Encodes data as json
+
+        :param data: Data to encode
+
+        :returns: Utf-8 encoded json document
+        :rtype: bytes
+        """
+        return json.dumps(data).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec that uses `orjson <https://github.com/ijl/orjson>`_.
+
+    Data that orjson cannot encode (e.g. :class:`decimal.Decimal` values) is encoded with the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, content):
+        return self._orjson.loads(content)
+
+    def dumps(self, data) -> bytes:
+        try:
+            return self._orjson.dumps(data)
+        except TypeError:
+            return super(OrjsonCodec, self).dumps(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Codec that uses `ujson <https://github.com/ultrajson/ultrajson>`_.
+
+    Data that ujson cannot encode is encoded with the standard library.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, content):
+        return self._ujson.loads(content)
+
+    def dumps(self, data) -> bytes:
+        try:
+            return self._ujson.dumps(data, ensure_ascii=False).encode("utf-8")
+        except (TypeError, OverflowError):
+            return super(UjsonCodec, self).dumps(data)
+
+
+_default_codec = None
+
+
+def default_codec() -> JsonCodec:
+    """
+    Returns the fastest codec that is installed, ``orjson`` is preferred over ``ujson`` and the standard library is
+    used if neither of them is installed.
+
+    :rtype: :class:`.JsonCodec`
+
+    .. code-block:: python
+
+        from moco_wrapper.util.json_codec import JsonCodec
+        from moco_wrapper.util.requestor import DefaultRequestor
+
+        # always use the standard library
+        requestor = DefaultRequestor(json_codec=JsonCodec())
+    """
+    global _default_codec
+
+    if _default_codec is None:
+        for codec_class in (OrjsonCodec, UjsonCodec):
+            try:
+                _default_codec = codec_class()
+                break
+            except ImportError:
+                continue
+        else:
+            _default_codec = JsonCodec()
+
+    return _default_codec
@@ -1,3 +1,5 @@
 from .raw import RawObjector
 from .default import DefaultObjector
 from .no_error import NoErrorObjector
+from .lazy import LazyList
+from .identity_map import IdentityMap
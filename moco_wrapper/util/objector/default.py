@@ -1,7 +1,11 @@
 from .base import BaseObjector
+from .lazy import LazyList
+from .identity_map import IdentityMap
 
 from moco_wrapper.util.response import EmptyResponse, PagedListResponse, ListResponse, ObjectResponse, ErrorResponse
 
+from moco_wrapper.models.objector_models import compact
+
 from importlib import import_module
 
 
@@ -15,9 +19,62 @@ class DefaultObjector(BaseObjector):
 
         If you do not want exceptions to be raised see :class:`moco_wrapper.util.objector.NoErrorObjector`
 
+    To reduce the memory used by large responses, the objector can create compact models (see
+    :class:`moco_wrapper.models.objector_models.compact.CompactModel`) instead of the regular objector models. Types
+    that have no compact model are converted into regular objector models.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.objector import DefaultObjector
+
+        m = Moco(
+            objector=DefaultObjector(compact=True)
+        )
+
+    In lazy mode the items of list responses are only converted when they are accessed (see
+    :class:`moco_wrapper.util.objector.LazyList`). Nested objects of compact models are always converted on first
+    attribute access, so combining both modes converts only what is actually read.
+
+    .. code-block:: python
+
+        m = Moco(
+            objector=DefaultObjector(compact=True, lazy=True)
+        )
+
+    With an identity map nested entities that occur multiple times in a response (e.g. the project of every activity)
+    are only converted once and shared between all items (see :class:`moco_wrapper.util.objector.IdentityMap`).
+
+    .. code-block:: python
+
+        m = Moco(
+            objector=DefaultObjector(compact=True, identity_map=True)
+        )
+
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        compact: bool = False,
+        lazy: bool = False,
+        identity_map=False
+    ):
+        """
+        Class constructor
+
+        :param compact: If responses should be converted into compact models (default ``False``)
+        :param lazy: If items of list responses should only be converted when they are accessed (default ``False``)
+        :param identity_map: ``True`` to share nested entities within each response, an :class:`.IdentityMap` instance
+            to share them across all responses (default ``False``)
+
+        :type compact: bool
+        :type lazy: bool
+        :type identity_map: bool, :class:`.IdentityMap`
+        """
+        self.compact = compact
+        self.lazy = lazy
+        self.identity_map = identity_map
+
         self.module_path = "moco_wrapper.models.objector_models"
 
         self.class_map = {
@@ -167,20 +224,24 @@ class DefaultObjector(BaseObjector):
         if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse)):
             class_name = self.get_class_name_from_request_url(http_response.request.url)
             if class_name is not None:
-                class_ = getattr(
+                class_ = self.get_model_type(getattr(
                     import_module(self.module_path),
                     class_name
-                )
+                ))
+
+                factory = self.get_factory(class_)
 
                 if isinstance(requestor_response, ObjectResponse):
-                    obj = class_(**requestor_response.data)
+                    obj = factory(**requestor_response.data)
                     requestor_response._data = obj
+                elif isinstance(requestor_response, (ListResponse, PagedListResponse)) and self.lazy:
+                    requestor_response._data = LazyList(requestor_response.items, factory)
                 elif isinstance(requestor_response, (ListResponse, PagedListResponse)):
                     new_items = []
 
                     for item in requestor_response.items:
                         new_items.append(
-                            class_(**item)
+                            factory(**item)
                         )
 
                     requestor_response._data = new_items
@@ -203,12 +264,17 @@ class DefaultObjector(BaseObjector):
 
     def convert_e(self, requestor_response, endpoint):
         http_response = requestor_response.response
+        model_type = self.get_model_type(endpoint.type)
+        factory = self.get_factory(model_type) if model_type is not None else None
 
-        if isinstance(requestor_response, ObjectResponse) and endpoint.type is not None:
-            obj = endpoint.type(**requestor_response.data)
+        if isinstance(requestor_response, ObjectResponse) and model_type is not None:
+            obj = factory(**requestor_response.data)
             requestor_response._data = obj
-        elif isinstance(requestor_response, (ListResponse, PagedListResponse)) and endpoint.type is not None:
-            obj_list = [endpoint.type(**x) for x in requestor_response.items]
+        elif isinstance(requestor_response, (ListResponse, PagedListResponse)) and model_type is not None:
+            if self.lazy:
+                obj_list = LazyList(requestor_response.items, factory)
+            else:
+                obj_list = [factory(**x) for x in requestor_response.items]
             requestor_response._data = obj_list
         elif isinstance(requestor_response, ErrorResponse):
             # convert the data for the error response into an actual exception
@@ -226,6 +292,43 @@ class DefaultObjector(BaseObjector):
 
         return requestor_response
 
+    def get_model_type(self, model_type):
+        """
+        Returns the class the data of a response is converted into
+
+        :param model_type: Objector model class of the endpoint (may be ``None``)
+
+        :returns: Compact model class if :attr:`compact` is set and there is one, otherwise ``model_type``
+        """
+        if self.compact and model_type is not None:
+            compact_model_type = compact.compact_type(model_type)
+            if compact_model_type is not None:
+                return compact_model_type
+
+        return model_type
+
+    def get_factory(self, model_type):
+        """
+        Returns the callable that converts a single item of a response
+
+        :param model_type: Class the items are converted into (see :meth:`get_model_type`)
+
+        :returns: ``model_type`` itself, or a function that converts items through an identity map if
+            :attr:`identity_map` is set
+        """
+        if isinstance(self.identity_map, IdentityMap):
+            identity_map = self.identity_map
+        elif self.identity_map:
+            # new map for every response
+            identity_map = IdentityMap()
+        else:
+            return model_type
+
+        def factory(**data):
+            return identity_map.build(model_type, data)
+
+        return factory
+
     def get_error_class_name_from_response_status_code(self, status_code) -> str:
         """
         Get the class name of the exception class based on the given http status code
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import threading
+import weakref
+
+from moco_wrapper.models.objector_models.compact import CompactModel
+
+
+class IdentityMap(object):
+    """
+    Map of converted objects by type, id and data, so equal nested entities share one instance.
+
+    In a list of activities the same project, task, customer and user objects are contained over and over again. With
+    an identity map every nested entity is only kept once, all items reference the same instance.
+
+    The map only holds weak references, objects are freed as soon as no response references them anymore. Create one
+    map and pass it to the objector to share instances across responses (session scope), or pass ``True`` to use a new
+    map for every response.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.objector import DefaultObjector, IdentityMap
+
+        # new map for every response
+        m = Moco(
+            objector=DefaultObjector(identity_map=True)
+        )
+
+        # one map for all responses
+        m = Moco(
+            objector=DefaultObjector(compact=True, identity_map=IdentityMap())
+        )
+
+    .. note::
+
+        Entities are identified by their type, id and data. If the api returns different representations of an entity
+        (e.g. a nested project with only some fields and the full project), every representation has its own instance,
+        so no object ever holds the data of another representation.
+    """
+
+    MODEL_MODULE = "moco_wrapper.models.objector_models"
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def clear(self):
+        """
+        Removes all objects from the map
+        """
+        with self._lock:
+            self._objects.clear()
+
+    def build(self, model_type, data: dict):
+        """
+        Converts the data of a single item into an object, nested entities are taken from the map
+
+        :param model_type: Objector model class (regular or compact)
+        :param data: Decoded json of the item
+
+        :returns: Converted object
+        """
+        if isinstance(model_type, type) and issubclass(model_type, CompactModel):
+            return model_type(**self._prepare_compact(model_type, data))
+
+        obj = model_type(**data)
+        self.intern_nested(obj)
+        return obj
+
+    def _prepare_compact(self, model_type, data: dict) -> dict:
+        """
+        Replaces the json of nested entities with the shared compact model instances (before the object is created,
+        so duplicates are never built)
+        """
+        prepared = None
+
+        for name, type_name in model_type._nested.items():
+            value = data.get(name, None)
+            nested_type = CompactModel._types[type_name]
+
+            if isinstance(value, dict) and "id" in value:
+                shared = self._get_or_build_compact(nested_type, value)
+            elif isinstance(value, list):
+                shared = [
+                    self._get_or_build_compact(nested_type, x) if isinstance(x, dict) and "id" in x else x
+                    for x in value
+                ]
+            else:
+                continue
+
+            if prepared is None:
+                prepared = dict(data)
+            prepared[name] = shared
+
+        return prepared if prepared is not None else data
+
+    def _get_or_build_compact(self, model_type, data: dict):
+        key = (model_type, data["id"], self._fingerprint(data))
+
+        with self._lock:
+            obj = self._objects.get(key, None)
+            if obj is None:
+                obj = model_type(**self._prepare_compact(model_type, data))
+                self._objects[key] = obj
+
+        return obj
+
+    def intern_nested(self, obj):
+        """
+        Replaces the nested entities of a regular objector model with the shared instances
+
+        :param obj: Objector model instance
+        """
+        values = getattr(obj, "__dict__", None)
+        if values is None:
+            return
+
+        for name, value in list(values.items()):
+            if self._is_model(value):
+                values[name] = self._canonical(value)
+            elif isinstance(value, list) and len(value) > 0 and self._is_model(value[0]):
+                values[name] = [self._canonical(x) if self._is_model(x) else x for x in value]
+
+    def _canonical(self, obj):
+        entity_id = getattr(obj, "id", None)
+        if entity_id is None:
+            self.intern_nested(obj)
+            return obj
+
+        key = (type(obj), entity_id, self._fingerprint(obj))
+
+        with self._lock:
+            existing = self._objects.get(key, None)
+            if existing is not None:
+                return existing
+
+            self.intern_nested(obj)
+            self._objects[key] = obj
+
+        return obj
+
+    def _fingerprint(self, value) -> bytes:
+        """
+        Returns a digest of the data of an entity (json or regular objector model), entities are only shared if their
+        data is equal
+        """
+        canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=self._json_default)
+        return hashlib.sha1(canonical.encode("utf-8")).digest()
+
+    def _json_default(self, value):
+        if self._is_model(value):
+            return vars(value)
+
+        return repr(value)
+
+    def _is_model(self, value):
+        return type(value).__module__.startswith(self.MODEL_MODULE) and hasattr(value, "__dict__")
@@ -0,0 +1,94 @@
+import threading
+
+from collections.abc import Sequence
+
+
+class LazyList(Sequence):
+    """
+    List of items that are converted into objects on first access.
+
+    The list holds the decoded json items of a response and converts an item with ``factory`` only when it is accessed
+    (by index or while iterating). Converted items are kept, so every item is converted at most once, also if the list
+    is shared by threads.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.objector import DefaultObjector
+
+        m = Moco(
+            objector=DefaultObjector(lazy=True)
+        )
+
+        activities = m.Activity.getlist(from_date="2020-01-01", to_date="2020-01-31")
+        print(activities[0].hours) # only the first activity is converted
+    """
+
+    __slots__ = ("_items", "_converted", "_factory", "_lock")
+
+    def __init__(self, items, factory):
+        """
+        Class constructor
+
+        :param items: Decoded json items
+        :param factory: Callable that converts a single item (e.g. an objector model class)
+        """
+        self._items = list(items)
+        self._converted = bytearray(len(self._items))
+        self._factory = factory
+        self._lock = threading.Lock()
+
+    def _get(self, index):
+        if not self._converted[index]:
+            # checked again while holding the lock, another thread may have converted the item in the meantime
+            with self._lock:
+                if not self._converted[index]:
+                    self._items[index] = self._factory(**self._items[index])
+                    self._converted[index] = 1
+
+        return self._items[index]
+
+    def __getstate__(self):
+        # the lock cannot be pickled or copied, every list gets its own
+        return self._items, self._converted, self._factory
+
+    def __setstate__(self, state):
+        self._items, self._converted, self._factory = state
+        self._lock = threading.Lock()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+
+        if index < 0:
+            index += len(self._items)
+
+        if index < 0 or index >= len(self._items):
+            raise IndexError("list index out of range")
+
+        return self._get(index)
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self._get(index)
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def converted_count(self) -> int:
+        """
+        Number of items that were converted so far
+
+        :type: int
+        """
+        return sum(self._converted)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+    def __repr__(self):
+        return "<LazyList, Items: {}, Converted: {}>".format(len(self._items), self.converted_count)
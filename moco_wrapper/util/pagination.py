@@ -0,0 +1,255 @@
+import contextvars
+import inspect
+
+from moco_wrapper.util.response import PagedListResponse
+
+
+def _check_blocking(response, alternative: str):
+    """
+    Raises an error if a listing method of an :class:`moco_wrapper.AsyncMoco` instance was passed to a blocking
+    function
+    """
+    if inspect.isawaitable(response):
+        if hasattr(response, "close"):
+            response.close()  # nothing was sent, the coroutine is never awaited
+
+        raise TypeError(
+            "The listing method returns an awaitable (AsyncMoco instance), use {} instead".format(alternative)
+        )
+
+
+def iter_pages(list_method, *args, **kwargs):
+    """
+    Calls a listing method page by page and yields every response.
+
+    :param list_method: Method that returns a list response and takes a ``page`` keyword argument
+        (e.g. :meth:`moco_wrapper.models.Project.getlist`)
+    :param args: Positional arguments for ``list_method``
+    :param kwargs: Keyword arguments for ``list_method``, pass ``page`` to start on a page other than the first
+
+    :returns: Generator of list responses
+
+    :raises TypeError: If ``list_method`` returns awaitables (e.g. a model of :class:`moco_wrapper.AsyncMoco`), use
+        :meth:`aiter_pages` instead
+
+    .. note::
+
+        Only the page that is currently yielded is referenced by the generator, so all previous pages can be freed
+        while iterating.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.pagination import iter_pages
+
+        m = Moco()
+        for page in iter_pages(m.ProjectExpense.getall, from_date="2020-01-01", to_date="2020-12-31"):
+            print(page.current_page, len(page))
+    """
+    response = list_method(*args, **kwargs)
+    _check_blocking(response, "aiter_pages")
+    yield response
+
+    while isinstance(response, PagedListResponse) and not response.is_last:
+        kwargs["page"] = response.next_page
+
+        response = list_method(*args, **kwargs)
+        yield response
+
+
+async def aiter_pages(list_method, *args, **kwargs):
+    """
+    Awaits a listing method of an :class:`moco_wrapper.AsyncMoco` instance page by page and yields every response.
+
+    :param list_method: Method that returns an awaitable list response and takes a ``page`` keyword argument
+        (e.g. :meth:`moco_wrapper.models.Project.getlist` of an :class:`moco_wrapper.AsyncMoco` instance)
+    :param args: Positional arguments for ``list_method``
+    :param kwargs: Keyword arguments for ``list_method``, pass ``page`` to start on a page other than the first
+
+    :returns: Asynchronous generator of list responses
+
+    .. code-block:: python
+
+        from moco_wrapper import AsyncMoco
+        from moco_wrapper.util.pagination import aiter_pages
+
+        m = AsyncMoco()
+
+        async def main():
+            async for page in aiter_pages(m.ProjectExpense.getall, from_date="2020-01-01", to_date="2020-12-31"):
+                print(page.current_page, len(page))
+
+    .. seealso::
+
+        :meth:`iter_pages`
+    """
+    response = await list_method(*args, **kwargs)
+    yield response
+
+    while isinstance(response, PagedListResponse) and not response.is_last:
+        kwargs["page"] = response.next_page
+
+        response = await list_method(*args, **kwargs)
+        yield response
+
+
+def iter_items(list_method, *args, **kwargs):
+    """
+    Calls a listing method page by page and yields every item of every page.
+
+    :param list_method: Method that returns a list response and takes a ``page`` keyword argument
+        (e.g. :meth:`moco_wrapper.models.Project.getlist`)
+    :param args: Positional arguments for ``list_method``
+    :param kwargs: Keyword arguments for ``list_method``
+
+    :returns: Generator of the (converted) items
+
+    :raises TypeError: If ``list_method`` returns awaitables (e.g. a model of :class:`moco_wrapper.AsyncMoco`), use
+        :meth:`aiter_items` instead
+
+    .. seealso::
+
+        :meth:`iter_pages`
+    """
+    for response in iter_pages(list_method, *args, **kwargs):
+        for item in response:
+            yield item
+
+
+async def aiter_items(list_method, *args, **kwargs):
+    """
+    Awaits a listing method of an :class:`moco_wrapper.AsyncMoco` instance page by page and yields every item of every
+    page.
+
+    :param list_method: Method that returns an awaitable list response and takes a ``page`` keyword argument
+    :param args: Positional arguments for ``list_method``
+    :param kwargs: Keyword arguments for ``list_method``
+
+    :returns: Asynchronous generator of the (converted) items
+
+    .. seealso::
+
+        :meth:`aiter_pages`
+    """
+    async for response in aiter_pages(list_method, *args, **kwargs):
+        for item in response:
+            yield item
+
+
+def fetch_all(list_method, *args, max_workers: int = 4, **kwargs) -> list:
+    """
+    Fetches every page of a listing method and returns all items in order.
+
+    The first page is requested on its own to find out how many pages there are (see
+    :attr:`moco_wrapper.util.response.PagedListResponse.last_page`), the remaining pages are then requested at the same
+    time on a thread pool. The pages are requested in a copy of the callers context, so an impersonation started with
+    :meth:`moco_wrapper.Moco.impersonation` applies to every page.
+
+    :param list_method: Method that returns a list response and takes a ``page`` keyword argument
+        (e.g. :meth:`moco_wrapper.models.Project.getlist`)
+    :param args: Positional arguments for ``list_method``
+    :param max_workers: Maximum number of pages that are requested at the same time (default ``4``)
+    :param kwargs: Keyword arguments for ``list_method``
+
+    :type max_workers: int
+
+    :returns: List of the (converted) items of all pages
+    :rtype: list
+
+    :raises TypeError: If ``list_method`` returns awaitables (e.g. a model of :class:`moco_wrapper.AsyncMoco`), use
+        :meth:`afetch_all` instead
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.pagination import fetch_all
+
+        m = Moco()
+        invoices = fetch_all(m.Invoice.getlist, status="paid", max_workers=8)
+
+    .. seealso::
+
+        :meth:`iter_items` for processing large collections without holding them in memory
+    """
+    # always start at the first page, listing methods default to it
+    kwargs.pop("page", None)
+    first_page = list_method(*args, **kwargs)
+    _check_blocking(first_page, "afetch_all")
+
+    items = list(first_page)
+    if not isinstance(first_page, PagedListResponse) or first_page.is_last:
+        return items
+
+    def fetch_page(page):
+        return list_method(*args, **dict(kwargs, page=page))
+
+    # imported here, the thread pool is only needed for paginated collections
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # every page runs in a copy of the callers context, so e.g. Moco.impersonation applies to all pages
+        futures = [
+            executor.submit(contextvars.copy_context().run, fetch_page, page)
+            for page in range(2, first_page.last_page + 1)
+        ]
+
+        for future in futures:
+            items.extend(future.result())
+
+    return items
+
+
+async def afetch_all(list_method, *args, max_workers: int = 4, **kwargs) -> list:
+    """
+    Fetches every page of a listing method of an :class:`moco_wrapper.AsyncMoco` instance and returns all items in
+    order.
+
+    The first page is awaited on its own to find out how many pages there are, the remaining pages are then awaited
+    at the same time.
+
+    :param list_method: Method that returns an awaitable list response and takes a ``page`` keyword argument
+    :param args: Positional arguments for ``list_method``
+    :param max_workers: Maximum number of pages that are requested at the same time (default ``4``)
+    :param kwargs: Keyword arguments for ``list_method``
+
+    :type max_workers: int
+
+    :returns: List of the (converted) items of all pages
+    :rtype: list
+
+    .. code-block:: python
+
+        from moco_wrapper import AsyncMoco
+        from moco_wrapper.util.pagination import afetch_all
+
+        m = AsyncMoco()
+
+        async def main():
+            invoices = await afetch_all(m.Invoice.getlist, status="paid", max_workers=8)
+
+    .. seealso::
+
+        :meth:`fetch_all`
+    """
+    # always start at the first page, listing methods default to it
+    kwargs.pop("page", None)
+    first_page = await list_method(*args, **kwargs)
+
+    items = list(first_page)
+    if not isinstance(first_page, PagedListResponse) or first_page.is_last:
+        return items
+
+    # imported here, asyncio is only needed for paginated collections
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_page(page):
+        async with semaphore:
+            return await list_method(*args, **dict(kwargs, page=page))
+
+    # gather returns the results in the order of the page numbers
+    for response in await asyncio.gather(*[fetch_page(x) for x in range(2, first_page.last_page + 1)]):
+        items.extend(response)
+
+    return items
@@ -1,3 +1,10 @@
 from .default import DefaultRequestor
 from .raw import RawRequestor
 from .no_retry import NoRetryRequestor
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy, RetryStatistics
+from .pool import ConnectionPool
+from .compression import TransferStatistics, TransferRecord
+from .asynchronous import AsyncRequestor
+from .single_flight import SingleFlightRequestor
+from .disk_cache import DiskCacheRequestor, DiskCacheStatistics
@@ -0,0 +1,152 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from moco_wrapper.util.requestor.default import DefaultRequestor
+
+
+class AsyncRequestor(object):
+    """
+    Requestor class that is used by the :class:`moco_wrapper.AsyncMoco` instance.
+
+    The async requestor wraps a regular (blocking) requestor and runs every request of it on a thread pool, so the
+    event loop is free while a request waits on the network. All retry and response handling is done by the wrapped
+    requestor, so the responses are the same as with the synchronous :class:`moco_wrapper.Moco` instance.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from moco_wrapper import AsyncMoco
+        from moco_wrapper.util.requestor import AsyncRequestor, NoRetryRequestor
+
+        m = AsyncMoco(
+            requestor=AsyncRequestor(
+                requestor=NoRetryRequestor(),
+                max_concurrency=20
+            )
+        )
+
+        async def main():
+            return await asyncio.gather(*[m.Project.get(x) for x in project_ids])
+
+        projects = asyncio.run(main())
+
+    .. note::
+
+        The thread pool the requestor creates lives until :meth:`close` is called. Close short-lived requestors, or
+        use them (or the :class:`moco_wrapper.AsyncMoco` instance) as asynchronous context manager:
+
+        .. code-block:: python
+
+            async def main():
+                async with AsyncMoco(auth={...}) as m:
+                    return await m.Project.getlist()
+
+    .. seealso::
+
+        :class:`moco_wrapper.util.requestor.DefaultRequestor`
+    """
+
+    def __init__(
+        self,
+        requestor=None,
+        max_concurrency: int = 10,
+        executor=None
+    ):
+        """
+        Class constructor
+
+        :param requestor: Blocking requestor the requests are sent with
+            (default ``None``, a new :class:`moco_wrapper.util.requestor.DefaultRequestor`)
+        :param max_concurrency: Maximum number of requests that are in flight at the same time (default ``10``)
+        :param executor: Executor the requests are run on (default ``None``, a thread pool with
+            ``max_concurrency`` workers is created and shut down by :meth:`close`, a given executor is not shut down)
+
+        :type requestor: :class:`moco_wrapper.util.requestor.BaseRequestor`
+        :type max_concurrency: int
+        :type executor: :class:`concurrent.futures.Executor`
+        """
+        if requestor is None:
+            requestor = DefaultRequestor()
+
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+        self._requestor = requestor
+        self._executor = executor
+
+    @property
+    def requestor(self):
+        """
+        Blocking requestor this requestor wraps
+        """
+        return self._requestor
+
+    @property
+    def session(self):
+        """
+        Http Session of the wrapped requestor
+        """
+        return self._requestor.session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        **kwargs
+    ):
+        """
+        Request the given resource.
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: Path of the resource (e.g. ``/projects``)
+        :param params: Url parameters (e.g. ``page=1``, query parameters) (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+        :param kwargs: Additional http arguments.
+
+        :type method: str
+        :type path: str
+        :type params: dict
+        :type data: dict
+
+        :returns: Response object
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._requestor.request, method, path, params=params, data=data, **kwargs)
+
+        return await loop.run_in_executor(self._executor, call)
+
+    async def get(self, path, params=None, **kwargs):
+        return await self.request("GET", path, params=params, **kwargs)
+
+    async def post(self, path, data=None, **kwargs):
+        return await self.request("POST", path, data=data, **kwargs)
+
+    async def put(self, path, data=None, params=None, **kwargs):
+        return await self.request("PUT", path, data=data, params=params, **kwargs)
+
+    async def delete(self, path, data=None, params=None, **kwargs):
+        return await self.request("DELETE", path, data=data, params=params, **kwargs)
+
+    async def patch(self, path, data=None, params=None, **kwargs):
+        return await self.request("PATCH", path, data=data, params=params, **kwargs)
+
+    def close(self):
+        """
+        Shuts down the thread pool the requests are run on, if it was created by the requestor
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,3 +1,9 @@
+from moco_wrapper.util.io import MultipartStream
+from moco_wrapper.util.json_codec import default_codec
+from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, \
+    FileResponse
+
+
 class BaseRequestor(object):
     """
     Base class all other Requestor classes inherit from
@@ -6,10 +12,46 @@ class BaseRequestor(object):
     ERROR_STATUS_CODES = [400, 401, 403, 404, 422, 429, 500]
     SUCCESS_STATUS_CODES = [200, 201, 204]
 
+    rate_limiter = None
+    """
+    Rate limiter that paces the requests of this requestor (see :class:`moco_wrapper.util.requestor.RateLimiter`,
+    default ``None``)
+    """
+
+    transfer_statistics = None
+    """
+    Counters for the size of the received response bodies (see
+    :class:`moco_wrapper.util.requestor.TransferStatistics`, default ``None``)
+    """
+
+    connection_pool = None
+    """
+    Settings for the http connections of this requestor (see :class:`moco_wrapper.util.requestor.ConnectionPool`,
+    default ``None``)
+    """
+
+    json_codec = None
+    """
+    Codec used for encoding request bodies and decoding response bodies (see
+    :class:`moco_wrapper.util.json_codec.JsonCodec`, default ``None``, the fastest installed codec is used)
+    """
+
     @property
     def session(self):
         return None
 
+    @property
+    def codec(self):
+        """
+        Json codec this requestor uses
+
+        :rtype: :class:`moco_wrapper.util.json_codec.JsonCodec`
+        """
+        if self.json_codec is None:
+            return default_codec()
+
+        return self.json_codec
+
     def get(self, path, params=None, **kwargs):
         return self.request("GET", path, params=params, **kwargs)
 
@@ -25,6 +67,120 @@ class BaseRequestor(object):
     def patch(self, path, data=None, params=None, **kwargs):
         return self.request("PATCH", path, data=data, params=params, **kwargs)
 
+    def _send(self, method, path, params=None, data=None, **kwargs):
+        """
+        Sends the request with the http session of the requestor
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: Path of the resource (e.g. ``/projects``)
+        :param params: Url parameters (e.g. ``page=1``, query parameters)
+        :param data: Dictionary with data (http body)
+        :param kwargs: Additional http arguments.
+
+        :returns: http response object
+        """
+        if params is not None:
+            params = self._format_params(params)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        if data is not None:
+            kwargs = self._encode_body(data, kwargs)
+
+        try:
+            response = self.session.request(method, path, params=params, **kwargs)
+        finally:
+            if isinstance(data, MultipartStream):
+                data.close_file()
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+
+        # streamed bodies are not read yet and cannot be measured here
+        if self.transfer_statistics is not None and not kwargs.get("stream", False):
+            self.transfer_statistics.record(response)
+
+        return response
+
+    def _encode_body(self, data, kwargs: dict) -> dict:
+        """
+        Encodes the http body as json
+
+        Bodies that are already encoded (bytes or file like objects, e.g. :class:`moco_wrapper.util.io.MultipartStream`)
+        are sent as they are, the ``Content-Type`` header has to be set by the caller.
+
+        :param data: Dictionary with data (http body)
+        :param kwargs: Additional http arguments
+
+        :returns: Http arguments containing the encoded body
+        :rtype: dict
+        """
+        if isinstance(data, (bytes, bytearray)) or hasattr(data, "read"):
+            kwargs = dict(kwargs)
+            kwargs["data"] = data
+            return kwargs
+
+        headers = kwargs.get("headers", None) or {}
+        if "Content-Type" not in headers.keys():
+            headers = dict(headers)
+            headers["Content-Type"] = "application/json"
+
+        kwargs = dict(kwargs)
+        kwargs["headers"] = headers
+        kwargs["data"] = self.codec.dumps(data)
+
+        return kwargs
+
+    def _create_response(self, response):
+        """
+        Converts the http response into a response object (see :ref:`response`)
+
+        :param response: http response object
+
+        :returns: Response object
+        """
+        try:
+            # check if the response has a success status code
+            if response.status_code in self.SUCCESS_STATUS_CODES:
+                if response.status_code == 204:
+                    # no content but success
+                    return EmptyResponse(response)
+
+                # checked before the body is touched, so pdf documents can be streamed
+                content_type = response.headers.get("Content-Type", "") or ""
+                if content_type.split(";")[0].strip() == "application/pdf":
+                    return FileResponse(response)
+
+                if response.status_code == 200 and response.content.strip() == b"":
+                    # touch endpoint returns 200 with no content
+                    return EmptyResponse(response)
+
+                # json response handling is the default, the body is only decoded here
+                # the decoded content is handed to the response classes
+                response_content = self.codec.loads(response.content)
+
+                # if response is a list, return list response
+                if isinstance(response_content, list):
+                    if "X-Page" in response.headers.keys():
+                        return PagedListResponse(response, data=response_content)  # response is a paged list
+                    else:
+                        return ListResponse(response, data=response_content)  # response is an unpaged list
+
+                # return object response as default
+                return ObjectResponse(response, data=response_content)
+
+            if response.status_code == 304:
+                # conditional request without a cached body (see DiskCacheRequestor for reusing cached bodies)
+                return EmptyResponse(response)
+
+            # check if the response has an error status code
+            if response.status_code in self.ERROR_STATUS_CODES:
+                return ErrorResponse(response)
+
+        except ValueError:
+            return ErrorResponse(response)
+
     def _format_params(self, params):
         """
         Format boolean query string parameter to lower case (True => true)
@@ -0,0 +1,172 @@
+import threading
+
+from collections import namedtuple
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+def accept_encoding() -> str:
+    """
+    Returns the value of the ``Accept-Encoding`` header the requestors send
+
+    ``gzip`` and ``deflate`` are always accepted, ``br`` if `brotli <https://pypi.org/project/Brotli/>`_ is installed
+    and ``zstd`` if `zstandard <https://pypi.org/project/zstandard/>`_ is installed (and supported by urllib3). The
+    responses are decompressed by urllib3 while they are read.
+
+    :rtype: str
+    """
+    return ", ".join(x.strip() for x in ACCEPT_ENCODING.split(","))
+
+
+class TransferRecord(namedtuple("TransferRecord", ["encoding", "wire_bytes", "decoded_bytes"])):
+    """
+    Size of a single response body, as transferred and after decompression
+    """
+
+    __slots__ = ()
+
+    @property
+    def ratio(self) -> float:
+        """
+        Compressed size divided by the decompressed size (``1.0`` for uncompressed or empty responses)
+
+        :rtype: float
+        """
+        if self.decoded_bytes == 0:
+            return 1.0
+
+        return self.wire_bytes / self.decoded_bytes
+
+    @classmethod
+    def from_response(cls, http_response):
+        """
+        Measures the body of a http response
+
+        :param http_response: http response object
+
+        :returns: Transfer record, ``None`` if the body was not read yet (streamed responses)
+        :rtype: :class:`.TransferRecord`
+        """
+        if not getattr(http_response, "_content_consumed", True):
+            return None
+
+        content = getattr(http_response, "content", None)
+        if not isinstance(content, bytes):
+            return None
+
+        headers = getattr(http_response, "headers", None) or {}
+        encoding = headers.get("Content-Encoding", "identity")
+        decoded_bytes = len(content)
+
+        # bytes urllib3 read from the socket, before decompression
+        wire_bytes = None
+        raw = getattr(http_response, "raw", None)
+        if raw is not None and hasattr(raw, "tell"):
+            try:
+                wire_bytes = raw.tell()
+            except (TypeError, ValueError, OSError):
+                wire_bytes = None
+
+        if not wire_bytes:
+            content_length = headers.get("Content-Length", None)
+            if content_length is not None and str(content_length).isdigit():
+                wire_bytes = int(content_length)
+            else:
+                wire_bytes = decoded_bytes
+
+        return cls(encoding, wire_bytes, decoded_bytes)
+
+
+class TransferStatistics(object):
+    """
+    Counters for the response bodies a requestor received
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+
+        m = Moco(...)
+        activities = m.Activity.getlist(from_date="2020-01-01", to_date="2020-12-31")
+
+        print(m.requestor.transfer_statistics)
+        print(activities.transfer.wire_bytes, activities.transfer.decoded_bytes)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.responses = 0
+        """Number of responses that were measured"""
+
+        self.compressed_responses = 0
+        """Number of responses that were compressed"""
+
+        self.wire_bytes = 0
+        """Bytes received (compressed size)"""
+
+        self.decoded_bytes = 0
+        """Bytes after decompression"""
+
+        self.encodings = {}
+        """Number of responses by content encoding (e.g. ``{"gzip": 10, "identity": 2}``)"""
+
+    def record(self, http_response) -> TransferRecord:
+        """
+        Adds the body size of a response to the counters
+
+        :param http_response: http response object
+
+        :returns: Transfer record of the response, ``None`` if the body was not read yet
+        :rtype: :class:`.TransferRecord`
+        """
+        record = TransferRecord.from_response(http_response)
+        if record is None:
+            return None
+
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += record.wire_bytes
+            self.decoded_bytes += record.decoded_bytes
+            self.encodings[record.encoding] = self.encodings.get(record.encoding, 0) + 1
+
+            if record.encoding != "identity":
+                self.compressed_responses += 1
+
+        return record
+
+    @property
+    def saved_bytes(self) -> int:
+        """
+        Bytes that were not transferred thanks to compression
+
+        :rtype: int
+        """
+        return self.decoded_bytes - self.wire_bytes
+
+    @property
+    def ratio(self) -> float:
+        """
+        Compressed size of all responses divided by their decompressed size
+
+        :rtype: float
+        """
+        if self.decoded_bytes == 0:
+            return 1.0
+
+        return self.wire_bytes / self.decoded_bytes
+
+    def reset(self):
+        """
+        Sets all counters back to zero
+        """
+        with self._lock:
+            self.responses = 0
+            self.compressed_responses = 0
+            self.wire_bytes = 0
+            self.decoded_bytes = 0
+            self.encodings = {}
+
+    def __str__(self):
+        return "<TransferStatistics, Responses: {}, Compressed: {}, Wire: {} bytes, Decoded: {} bytes>".format(
+            self.responses, self.compressed_responses, self.wire_bytes, self.decoded_bytes
+        )
@@ -1,8 +1,10 @@
-import requests
 import time
 
 from moco_wrapper.util.requestor.base import BaseRequestor
-from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, FileResponse
+from moco_wrapper.util.requestor.pool import create_session
+from moco_wrapper.util.requestor.compression import TransferStatistics
+from moco_wrapper.util.requestor.retry import RetryPolicy
+from moco_wrapper.util.response import ErrorResponse
 
 
 class DefaultRequestor(BaseRequestor):
@@ -10,7 +12,8 @@ class DefaultRequestor(BaseRequestor):
     Default Requestor class that is used by the :class:`moco_wrapper.Moco` instance.
 
     When the default requestor requests a resources and it sees the error code 429 (too many requests),
-    it waits a bit and then tries the request again. If you do not want that behaviour, use
+    it waits a bit and then tries the request again. How often and how long it waits is decided by its
+    :class:`moco_wrapper.util.requestor.RetryPolicy`. If you do not want that behaviour, use
     :class:`moco_wrapper.util.requestor.NoRetryRequestor`.
 
     .. seealso::
@@ -19,12 +22,26 @@ class DefaultRequestor(BaseRequestor):
 
     def __init__(
         self,
-        delay_ms: float = 1000.0
+        delay_ms: float = 1000.0,
+        rate_limiter=None,
+        retry_policy=None,
+        json_codec=None,
+        connection_pool=None
     ):
         """
         Class constructor
 
-        :param delay_ms: How long the requestor should wait before retrying the resource again (default 1000).
+        :param delay_ms: How long the requestor should wait before retrying the resource the first time (default 1000).
+            Only used if no ``retry_policy`` is given, later retries back off exponentially.
+        :param rate_limiter: Rate limiter that paces all requests of this requestor
+            (see :class:`moco_wrapper.util.requestor.RateLimiter`, default ``None``)
+        :param retry_policy: Policy that decides when and how often recoverable errors are retried
+            (see :class:`moco_wrapper.util.requestor.RetryPolicy`, default ``None``, a policy starting with
+            ``delay_ms``)
+        :param json_codec: Codec for encoding and decoding json (see :class:`moco_wrapper.util.json_codec.JsonCodec`,
+            default ``None``, orjson is used if it is installed, otherwise the standard library)
+        :param connection_pool: Settings for the http connections (see
+            :class:`moco_wrapper.util.requestor.ConnectionPool`, default ``None``, a plain :class:`requests.Session`)
 
         Overwrite delay:
 
@@ -33,7 +50,7 @@ class DefaultRequestor(BaseRequestor):
             from moco_wrapper.util.requestor import DefaultRequestor
             from moco_wrapper import Moco
 
-            #wait 5 seconds on an error
+            #wait up to 5 seconds before the first retry
             lazy_requestor = DefaultRequestor(
                 delay_ms = 5000
             )
@@ -42,9 +59,25 @@ class DefaultRequestor(BaseRequestor):
                 requestor = lazy_requestor
             )
         """
-        self._session = requests.Session()
+        self._session = create_session(connection_pool)
+        self.connection_pool = connection_pool
+        self.transfer_statistics = TransferStatistics()
 
         self.delay_milliseconds_on_error = delay_ms
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy(base_delay_ms=delay_ms)
+
+        self.retry_policy = retry_policy
+
+    @property
+    def retry_statistics(self):
+        """
+        Retry counters of this requestor (see :class:`moco_wrapper.util.requestor.RetryStatistics`)
+        """
+        return self.retry_policy.statistics
 
     @property
     def session(self):
@@ -70,7 +103,7 @@ class DefaultRequestor(BaseRequestor):
         :param params: Url parameters (e.g. ``page=1``, query parameters) (default ``None``)
         :param data: Dictionary with data (http body) (default ``None``)
         :param delay_ms: Delay in milliseconds the requestor should wait before sending the request
-            (used for retrying, default ``0``)
+            (default ``0``)
         :param kwargs: Additional http arguments.
 
         :type method: str
@@ -85,66 +118,35 @@ class DefaultRequestor(BaseRequestor):
         if delay_ms > 0:
             time.sleep(delay_ms / 1000.0)
 
-        if params is not None:
-            params = self._format_params(params)
-
-        response = None
-        if method == "GET":
-            response = self.session.get(path, params=params, json=data, **kwargs)
-        elif method == "POST":
-            response = self.session.post(path, params=params, json=data, **kwargs)
-        elif method == "DELETE":
-            response = self.session.delete(path, params=params, json=data, **kwargs)
-        elif method == "PUT":
-            response = self.session.put(path, params=params, json=data, **kwargs)
-        elif method == "PATCH":
-            response = self.session.patch(path, params=params, json=data, **kwargs)
-
-        # convert the response into an MWRAPResponse object
-        try:
-            # check if the response has a success status code
-            if response.status_code in self.SUCCESS_STATUS_CODES:
-                if response.status_code == 204:
-                    # no content but success
-                    return EmptyResponse(response)
-
-                if response.status_code == 200 and response.text.strip() == "":
-                    # touch endpoint returns 200 with no content
-                    return EmptyResponse(response)
-
-                if response.headers["Content-Type"] == "application/pdf":
-                    return FileResponse(response)
-
-                # json response handling is the default
-                response_content = response.json()
-
-                # if response is a list, return list response
-                if isinstance(response_content, list):
-                    if "X-Page" in response.headers.keys():
-                        return PagedListResponse(response)  # response is a paged list
-                    else:
-                        return ListResponse(response)  # response is an unpaged list
-
-                # return object response as default
-                return ObjectResponse(response)
-
-            # check if the response has an error status code
-            if response.status_code in self.ERROR_STATUS_CODES:
-                response_obj = ErrorResponse(response)
-
-                if response_obj.is_recoverable:
-                    return self.request(method, path, params=params, data=data,
-                                        delay_ms=self.delay_milliseconds_on_error, **kwargs)
-
-                # error is not recoverable
+        policy = self.retry_policy
+        started_at = policy.clock()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            policy.statistics.record_attempt()
+
+            if attempt > 1 and hasattr(data, "seek"):
+                # streamed bodies were read by the previous attempt
+                data.seek(0)
+
+            response_obj = self._create_response(
+                self._send(method, path, params=params, data=data, **kwargs)
+            )
+
+            if not isinstance(response_obj, ErrorResponse) or not response_obj.is_recoverable:
+                return response_obj
+
+            delay = policy.next_delay(attempt, response_obj.response, started_at)
+            if delay is None:
+                # maximum attempts or deadline reached, return the error
+                policy.statistics.record_exhausted()
                 return response_obj
 
-        except ValueError as ex:
-            response_obj = ErrorResponse(response)
-            if response_obj.is_recoverable:
-                # error is recoverable, try the resource again
-                return self.request(method, path, params=params, data=data,
-                                    delay_ms=self.delay_milliseconds_on_error, **kwargs)
+            retry_after = policy.retry_after(response_obj.response) if policy.respect_retry_after else None
+            if retry_after is not None and self.rate_limiter is not None:
+                # the whole budget is used up, pause every request that shares the limiter
+                self.rate_limiter.block(retry_after)
 
-            # error is not recoverable
-            return response_obj
+            policy.statistics.record_retry(delay)
+            policy.sleep(delay)
@@ -0,0 +1,345 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from moco_wrapper.util.requestor.default import DefaultRequestor
+
+
+class DiskCacheRequestor(DefaultRequestor):
+    """
+    Requestor that stores the bodies of ``GET`` responses on disk and revalidates them with conditional requests.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are written to ``cache_dir``. When the same resource is
+    requested again (also from another process, e.g. the next run of a cron job), the request is sent with
+    ``If-None-Match`` and ``If-Modified-Since``. If the api answers ``304 Not Modified``, the stored body is used and
+    the response is handled as if it was sent with status ``200``, so only the headers go over the wire.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DiskCacheRequestor
+
+        m = Moco(
+            auth={...},
+            requestor=DiskCacheRequestor("/var/cache/moco")
+        )
+
+        projects = m.Project.getlist()  # revalidated if the project list was stored by an earlier run
+
+        print(m.requestor.cache_statistics)
+
+    .. note::
+
+        Entries are stored by url, url parameters and headers, so every api key and impersonated user has its own
+        entries. The files contain the response bodies and are only readable by the current user.
+
+        Entries that were not used for ``max_age_s`` seconds are removed, and the least recently used entries are
+        removed once all entries together are larger than ``max_bytes``. Both limits are enforced while storing
+        responses, :meth:`prune` can also be called directly (e.g. after the api key was rotated).
+    """
+
+    EXCLUDED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie")
+    """Response headers that are not stored, in lower case (the body is stored decompressed)"""
+
+    PRUNE_INTERVAL_S = 60
+    """Minimum number of seconds between two prunes while storing, unless the entries are larger than ``max_bytes``"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_age_s: float = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        **kwargs
+    ):
+        """
+        Class constructor
+
+        :param cache_dir: Directory the responses are stored in (created if it does not exist)
+        :param max_age_s: Number of seconds after which an entry that was not used is removed (default one week,
+            ``None`` to keep entries regardless of their age)
+        :param max_bytes: Maximum size of all entries in bytes (default ``256 MiB``, ``None`` for no limit)
+        :param kwargs: Arguments of :class:`moco_wrapper.util.requestor.DefaultRequestor`
+
+        :type cache_dir: str
+        :type max_age_s: float
+        :type max_bytes: int
+        """
+        super(DiskCacheRequestor, self).__init__(**kwargs)
+
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+        self.cache_dir = cache_dir
+        self.max_age_s = max_age_s
+        self.max_bytes = max_bytes
+        self.cache_statistics = DiskCacheStatistics()
+
+        self._prune_lock = threading.Lock()
+        self._pruned_at = None
+        self._size = 0  # size of all entries after the last prune plus the entries stored since
+
+    def _send(self, method, path, params=None, data=None, **kwargs):
+        if method != "GET" or data is not None or kwargs.get("stream", False):
+            return super(DiskCacheRequestor, self)._send(method, path, params=params, data=data, **kwargs)
+
+        entry_path = self.entry_path(path, params, kwargs.get("headers", None))
+        meta = self._load_meta(entry_path)
+
+        conditional_kwargs = kwargs
+        if meta is not None:
+            headers = dict(kwargs.get("headers", None) or {})
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+            conditional_kwargs = dict(kwargs)
+            conditional_kwargs["headers"] = headers
+
+        response = super(DiskCacheRequestor, self)._send(method, path, params=params, data=data, **conditional_kwargs)
+
+        if response.status_code == 304 and meta is not None:
+            cached_response = self._cached_response(entry_path, meta, response)
+            if cached_response is not None:
+                self.cache_statistics.record("revalidated")
+                return cached_response
+
+            # the entry was replaced or removed in the meantime, request the full body
+            response = super(DiskCacheRequestor, self)._send(method, path, params=params, data=data, **kwargs)
+
+        if response.status_code == 200 and self._store(entry_path, response):
+            self.cache_statistics.record("stored")
+        else:
+            self.cache_statistics.record("missed")
+
+        return response
+
+    def entry_path(self, path: str, params=None, headers=None) -> str:
+        """
+        Returns the path of the file a response is stored in
+
+        :param path: Full url of the request
+        :param params: Url parameters of the request
+        :param headers: Headers of the request (the api key and the impersonated user are part of the key)
+
+        :rtype: str
+        """
+        key = json.dumps([
+            path,
+            sorted((str(k), repr(v)) for k, v in (params or {}).items()),
+            sorted((str(k), str(v)) for k, v in (headers or {}).items()),
+        ])
+
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".cache")
+
+    def _load_meta(self, entry_path: str) -> dict:
+        """
+        Reads the headers of a stored response, the first line of the entry
+        """
+        try:
+            if self.max_age_s is not None and os.stat(entry_path).st_mtime < time.time() - self.max_age_s:
+                os.remove(entry_path)
+                return None
+
+            with open(entry_path, "rb") as entry_file:
+                return json.loads(entry_file.readline())
+        except (OSError, ValueError):
+            return None
+
+    def _cached_response(self, entry_path: str, meta: dict, not_modified):
+        """
+        Creates the response for a ``304 Not Modified`` answer from the stored body
+        """
+        try:
+            with open(entry_path, "rb") as entry_file:
+                stored_meta = json.loads(entry_file.readline())
+                body = entry_file.read()
+        except (OSError, ValueError):
+            return None
+
+        # replaced by another thread or process, the validators that were sent do not belong to this body
+        if (stored_meta.get("etag"), stored_meta.get("last_modified")) != (meta.get("etag"), meta.get("last_modified")):
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(stored_meta["headers"])
+        response.url = getattr(not_modified, "url", None)
+        response.request = getattr(not_modified, "request", None)
+        response.encoding = stored_meta.get("encoding", None)
+        response._content = body
+
+        # headers of the 304 answer replace the stored ones (e.g. a new Date)
+        for name, value in (getattr(not_modified, "headers", None) or {}).items():
+            if name.lower() not in self.EXCLUDED_HEADERS:
+                response.headers[name] = value
+
+        try:
+            # the modification time is the time of the last use, see prune
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        response.from_disk_cache = True
+        return response
+
+    def _store(self, entry_path: str, response) -> bool:
+        """
+        Writes a response to disk, if it has validators
+
+        :returns: If the response was stored
+        """
+        etag = response.headers.get("ETag", None)
+        last_modified = response.headers.get("Last-Modified", None)
+        if etag is None and last_modified is None:
+            return False
+
+        content = getattr(response, "content", None)
+        if not isinstance(content, bytes):
+            return False
+
+        meta = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": getattr(response, "encoding", None),
+            "stored_at": time.time(),
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in self.EXCLUDED_HEADERS},
+        }
+
+        part_path = "{}.{}.{}.part".format(entry_path, os.getpid(), threading.get_ident())
+        try:
+            with open(part_path, "wb") as part_file:
+                os.chmod(part_path, 0o600)
+                meta_line = json.dumps(meta).encode("utf-8") + b"\n"
+                part_file.write(meta_line)
+                part_file.write(content)
+
+            # renamed once complete, other threads and processes never see half written entries
+            os.replace(part_path, entry_path)
+        except OSError:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return False
+
+        self._prune_if_due(len(meta_line) + len(content))
+        return True
+
+    def _prune_if_due(self, stored: int):
+        """
+        Prunes the cache after storing a response, if the size limit may be exceeded or the last prune is a while ago
+        """
+        with self._prune_lock:
+            self._size += stored
+            now = time.monotonic()
+
+            due = self._pruned_at is None or now - self._pruned_at >= self.PRUNE_INTERVAL_S
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                due = True
+
+            if not due:
+                return
+
+            self._pruned_at = now
+
+        self.prune()
+
+    def prune(self, max_age_s: float = None, max_bytes: int = None) -> int:
+        """
+        Removes the entries that were not used for ``max_age_s`` seconds, then the least recently used entries until
+        all entries together are at most ``max_bytes`` large
+
+        :param max_age_s: Maximum age in seconds since the last use (default ``None``, the limit of the requestor)
+        :param max_bytes: Maximum size of all entries in bytes (default ``None``, the limit of the requestor)
+
+        :type max_age_s: float
+        :type max_bytes: int
+
+        :returns: Number of removed entries
+        :rtype: int
+        """
+        if max_age_s is None:
+            max_age_s = self.max_age_s
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith((".cache", ".part")):
+                        try:
+                            stat = dir_entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        except OSError:
+            return 0
+
+        # least recently used first, the modification time of an entry is the time it was last stored or revalidated
+        entries.sort()
+        total = sum(x[1] for x in entries)
+        expired_before = time.time() - max_age_s if max_age_s is not None else None
+        removed = 0
+
+        for mtime, size, path in entries:
+            expired = expired_before is not None and mtime < expired_before
+            if not expired and (max_bytes is None or total <= max_bytes):
+                break
+
+            # half written entries of other processes are only removed once they are expired
+            if path.endswith(".part") and not expired:
+                continue
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            total -= size
+            removed += 1
+
+        with self._prune_lock:
+            self._size = total
+
+        return removed
+
+    def clear(self):
+        """
+        Removes all stored responses
+        """
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".cache"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+class DiskCacheStatistics(object):
+    """
+    Counters of a :class:`.DiskCacheRequestor`
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.revalidated = 0
+        """Number of responses whose stored body was reused after a ``304 Not Modified``"""
+
+        self.stored = 0
+        """Number of responses that were stored"""
+
+        self.missed = 0
+        """Number of responses that could not be stored (no validators or not successful)"""
+
+    def record(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def __str__(self):
+        return "<DiskCacheStatistics, Revalidated: {}, Stored: {}, Missed: {}>".format(
+            self.revalidated, self.stored, self.missed
+        )
@@ -1,10 +1,6 @@
-import requests
-import time
-import collections
-
 from moco_wrapper.util.requestor.base import BaseRequestor
-from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, \
-    FileResponse
+from moco_wrapper.util.requestor.pool import create_session
+from moco_wrapper.util.requestor.compression import TransferStatistics
 
 
 class NoRetryRequestor(BaseRequestor):
@@ -30,11 +26,27 @@ class NoRetryRequestor(BaseRequestor):
         :class:`moco_wrapper.util.requestor.DefaultRequestor`
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter=None,
+        json_codec=None,
+        connection_pool=None
+    ):
         """
         Class constructor
+
+        :param rate_limiter: Rate limiter that paces all requests of this requestor
+            (see :class:`moco_wrapper.util.requestor.RateLimiter`, default ``None``)
+        :param json_codec: Codec for encoding and decoding json (see :class:`moco_wrapper.util.json_codec.JsonCodec`,
+            default ``None``, orjson is used if it is installed, otherwise the standard library)
+        :param connection_pool: Settings for the http connections (see
+            :class:`moco_wrapper.util.requestor.ConnectionPool`, default ``None``, a plain :class:`requests.Session`)
         """
-        self._session = requests.Session()
+        self._session = create_session(connection_pool)
+        self.connection_pool = connection_pool
+        self.transfer_statistics = TransferStatistics()
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec
 
     @property
     def session(self):
@@ -61,57 +73,6 @@ class NoRetryRequestor(BaseRequestor):
         :returns: Response object
         """
 
-        if params is not None:
-            params = self._format_params(params)
-
-        # format data submitted to requests as json
-        response = None
-        if method == "GET":
-            response = self.session.get(path, params=params, json=data, **kwargs)
-        elif method == "POST":
-            response = self.session.post(path, params=params, json=data, **kwargs)
-        elif method == "DELETE":
-            response = self.session.delete(path, params=params, json=data, **kwargs)
-        elif method == "PUT":
-            response = self.session.put(path, params=params, json=data, **kwargs)
-        elif method == "PATCH":
-            response = self.session.patch(path, params=params, json=data, **kwargs)
-
-        # convert the response into an MWRAPResponse object
-        try:
-            # check if the response has a success status code
-            if response.status_code in self.SUCCESS_STATUS_CODES:
-                # filter by content type what type of response this is
-                if response.status_code == 204:
-                    # no content but success
-                    return EmptyResponse(response)
-
-                if response.status_code == 200 and response.text.strip() == "":
-                    # touch endpoint returns 200 with no content
-                    return EmptyResponse(response)
-
-                if response.headers["Content-Type"] == "application/pdf":
-                    return FileResponse(response)
-
-                # json response handling is the default
-                response_content = response.json()
-
-                # if response is a list, return list response
-                if isinstance(response_content, list):
-                    if "X-Page" in response.headers.keys():
-                        return PagedListResponse(response)  # response is a paged list
-                    else:
-                        return ListResponse(response) # response is an unpaged list
-
-                # return single json response
-                return ObjectResponse(response)
-
-            # check if the response has an error status code
-            if response.status_code in self.ERROR_STATUS_CODES:
-                error_response = ErrorResponse(response)
-                return error_response
-
-        except ValueError as ex:
-            # print("ValueError in response conversion:" + str(ex))
-            response_obj = ErrorResponse(response)
-            return response_obj
+        response = self._send(method, path, params=params, data=data, **kwargs)
+
+        return self._create_response(response)
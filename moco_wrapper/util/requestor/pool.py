@@ -0,0 +1,200 @@
+import socket
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from moco_wrapper.util.requestor.compression import accept_encoding
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter that passes socket options and an ssl context to the connection pools it creates.
+
+    .. seealso::
+
+        :class:`moco_wrapper.util.requestor.ConnectionPool`
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options", "ssl_context"]
+
+    def __init__(
+        self,
+        socket_options=None,
+        ssl_context=None,
+        **kwargs
+    ):
+        """
+        Class constructor
+
+        :param socket_options: Socket options set on every new connection (default ``None``, the urllib3 defaults)
+        :param ssl_context: Ssl context used for https connections (default ``None``, the urllib3 default context)
+        :param kwargs: Arguments of :class:`requests.adapters.HTTPAdapter` (``pool_connections``, ``pool_maxsize``,
+            ``pool_block``, ``max_retries``)
+        """
+        self.socket_options = socket_options
+        self.ssl_context = ssl_context
+
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
+
+        super(PooledHTTPAdapter, self).init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+class ConnectionPool(object):
+    """
+    Settings for the http connections of a requestor.
+
+    By default a requestor uses a plain :class:`requests.Session`, which keeps at most 10 connections per host. If more
+    threads send requests at the same time, the connections that do not fit into the pool are closed after every request
+    and have to be opened again (including a new tls handshake). Size the pool for the number of threads that share
+    the requestor, and set ``pool_block`` so threads wait for a free connection instead of opening extra ones.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DefaultRequestor, ConnectionPool
+
+        pool = ConnectionPool(pool_maxsize=32, pool_block=True)
+        m = Moco(
+            requestor=DefaultRequestor(connection_pool=pool)
+        )
+
+    .. note::
+
+        Tls sessions are reused by keeping connections alive, a connection that stays in the pool needs no new
+        handshake. ``tcp_keepalive`` keeps idle connections from being dropped by proxies and load balancers.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_keepalive: bool = True,
+        tcp_keepalive_idle_s: int = 60,
+        tcp_keepalive_interval_s: int = 15,
+        tcp_keepalive_count: int = 4,
+        ssl_context=None
+    ):
+        """
+        Class constructor
+
+        :param pool_connections: Number of hosts connection pools are kept for (default ``10``)
+        :param pool_maxsize: Maximum number of connections kept per host (default ``10``), should be at least the
+            number of threads that share the requestor
+        :param pool_block: If a request should wait for a free connection when all connections of the pool are in use,
+            instead of opening a connection that is discarded afterwards (default ``False``)
+        :param keep_alive: If connections should be kept open after a request (default ``True``), ``False`` sends
+            ``Connection: close`` with every request
+        :param tcp_keepalive: If tcp keepalive probes should be sent on idle connections (default ``True``)
+        :param tcp_keepalive_idle_s: Idle time in seconds before the first keepalive probe is sent (default ``60``)
+        :param tcp_keepalive_interval_s: Time in seconds between keepalive probes (default ``15``)
+        :param tcp_keepalive_count: Number of unanswered probes before the connection is dropped (default ``4``)
+        :param ssl_context: Ssl context for https connections (see :class:`ssl.SSLContext`, default ``None``)
+
+        :type pool_connections: int
+        :type pool_maxsize: int
+        :type pool_block: bool
+        :type keep_alive: bool
+        :type tcp_keepalive: bool
+        :type tcp_keepalive_idle_s: int
+        :type tcp_keepalive_interval_s: int
+        :type tcp_keepalive_count: int
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.tcp_keepalive = tcp_keepalive
+        self.tcp_keepalive_idle_s = tcp_keepalive_idle_s
+        self.tcp_keepalive_interval_s = tcp_keepalive_interval_s
+        self.tcp_keepalive_count = tcp_keepalive_count
+        self.ssl_context = ssl_context
+
+    def socket_options(self) -> list:
+        """
+        Returns the socket options for new connections
+
+        :returns: List of ``(level, option, value)`` tuples
+        :rtype: list
+        """
+        options = list(HTTPConnection.default_socket_options)
+
+        if self.tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+            # the names of the options differ between platforms, unsupported ones are left out
+            idle_option = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+            if idle_option is not None:
+                options.append((socket.IPPROTO_TCP, idle_option, self.tcp_keepalive_idle_s))
+
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.tcp_keepalive_interval_s))
+
+            if hasattr(socket, "TCP_KEEPCNT"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.tcp_keepalive_count))
+
+        return options
+
+    def create_adapter(self) -> PooledHTTPAdapter:
+        """
+        Creates the transport adapter for a session
+
+        :rtype: :class:`moco_wrapper.util.requestor.pool.PooledHTTPAdapter`
+        """
+        return PooledHTTPAdapter(
+            socket_options=self.socket_options(),
+            ssl_context=self.ssl_context,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+
+    def create_session(self) -> requests.Session:
+        """
+        Creates a http session with these settings
+
+        :rtype: :class:`requests.Session`
+        """
+        session = requests.Session()
+
+        adapter = self.create_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers["Accept-Encoding"] = accept_encoding()
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+
+def create_session(connection_pool: ConnectionPool = None) -> requests.Session:
+    """
+    Creates the http session of a requestor
+
+    :param connection_pool: Connection settings (default ``None``, a plain :class:`requests.Session`)
+
+    Sessions always ask for compressed responses (see :func:`moco_wrapper.util.requestor.compression.accept_encoding`).
+
+    :rtype: :class:`requests.Session`
+    """
+    if connection_pool is None:
+        session = requests.Session()
+        session.headers["Accept-Encoding"] = accept_encoding()
+        return session
+
+    return connection_pool.create_session()
@@ -0,0 +1,171 @@
+import threading
+import time
+
+
+class RateLimiter(object):
+    """
+    Token bucket that paces requests before they are sent, so the rate limit of the api is not exceeded.
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``requests`` tokens every ``period`` seconds. Every
+    request takes one token, if the bucket is empty the request waits until a token is available.
+
+    If the api responds with rate limit headers (``X-RateLimit-Remaining``/``X-RateLimit-Reset`` or
+    ``RateLimit-Remaining``/``RateLimit-Reset``), the bucket is corrected with the budget the server reports. If the
+    server reports the budget as used up, all requests wait until the reported reset.
+
+    The limiter is thread safe, one limiter should be shared by all requests of a :class:`moco_wrapper.Moco` instance
+    (i.e. set it on the requestor of that instance).
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DefaultRequestor, RateLimiter
+
+        # at most 100 requests in 15 seconds
+        m = Moco(
+            requestor=DefaultRequestor(
+                rate_limiter=RateLimiter(requests=100, period=15)
+            )
+        )
+    """
+
+    REMAINING_HEADERS = ["X-RateLimit-Remaining", "RateLimit-Remaining"]
+    RESET_HEADERS = ["X-RateLimit-Reset", "RateLimit-Reset"]
+
+    def __init__(
+        self,
+        requests: int = 100,
+        period: float = 15.0,
+        burst: int = None,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        """
+        Class constructor
+
+        :param requests: Number of requests that are allowed per ``period`` (default ``100``)
+        :param period: Length of the period in seconds (default ``15``)
+        :param burst: Maximum number of requests that can be sent at once (default ``None``, same as ``requests``)
+        :param clock: Monotonic clock function (default :func:`time.monotonic`)
+        :param sleep: Function used for waiting (default :func:`time.sleep`)
+
+        :type requests: int
+        :type period: float
+        :type burst: int
+        """
+        if requests <= 0 or period <= 0:
+            raise ValueError("requests and period must be greater than 0")
+
+        self.rate = requests / float(period)
+        self.capacity = float(burst if burst is not None else requests)
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._blocked_until = None
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of requests that can currently be sent without waiting
+
+        :type: float
+        """
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def _refill(self, now):
+        if self._blocked_until is not None:
+            if now < self._blocked_until:
+                self._updated_at = now
+                return
+
+            # server budget was reset, tokens are refilled from the moment of the reset
+            self._updated_at = self._blocked_until
+            self._blocked_until = None
+
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self):
+        """
+        Takes a token from the bucket, waits until a token is available if the bucket is empty.
+
+        :returns: Time in seconds that was waited
+        :rtype: float
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            # reserve the token right away, so concurrent callers queue up behind each other
+            self._tokens -= 1.0
+
+            wait = 0.0
+            if self._blocked_until is not None:
+                wait = self._blocked_until - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+
+        if wait > 0:
+            self._sleep(wait)
+
+        return wait
+
+    def block(self, seconds: float):
+        """
+        Stops handing out tokens for the given amount of time (e.g. after the api responded with 429).
+
+        :param seconds: Number of seconds to wait
+
+        :type seconds: float
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            until = now + seconds
+            if self._blocked_until is None or until > self._blocked_until:
+                self._blocked_until = until
+
+    def update(self, headers):
+        """
+        Corrects the bucket with the rate limit budget reported by the server.
+
+        :param headers: Headers of the http response
+        """
+        remaining = self._header_value(headers, self.REMAINING_HEADERS)
+        if remaining is None:
+            return
+
+        reset = self._header_value(headers, self.RESET_HEADERS)
+        if reset is not None and reset > 1000000000:
+            # reset is an unix timestamp, not the number of seconds until the reset
+            reset = max(reset - time.time(), 0.0)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            self._tokens = min(self._tokens, remaining)
+
+        if remaining <= 0 and reset is not None:
+            self.block(reset)
+
+    def _header_value(self, headers, names):
+        for name in names:
+            value = headers.get(name, None)
+            if value is None:
+                continue
+
+            try:
+                # values may contain parameters, e.g. "100;w=60"
+                return float(str(value).split(";")[0].split(",")[0].strip())
+            except ValueError:
+                return None
+
+        return None
@@ -0,0 +1,217 @@
+import datetime
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+
+
+class RetryStatistics(object):
+    """
+    Counters of a :class:`.RetryPolicy`
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.attempts = 0
+        """Number of requests that were sent (first attempts and retries)"""
+
+        self.retries = 0
+        """Number of requests that were retried"""
+
+        self.exhausted = 0
+        """Number of requests that were given up on, because the maximum attempts or the deadline was reached"""
+
+        self.wait_seconds = 0.0
+        """Total time in seconds that was waited before retries"""
+
+    def record_attempt(self):
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, delay):
+        with self._lock:
+            self.retries += 1
+            self.wait_seconds += delay
+
+    def record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def reset(self):
+        """
+        Sets all counters back to zero
+        """
+        with self._lock:
+            self.attempts = 0
+            self.retries = 0
+            self.exhausted = 0
+            self.wait_seconds = 0.0
+
+    def __str__(self):
+        return "<RetryStatistics, Attempts: {}, Retries: {}, Exhausted: {}, Wait: {:.2f}s>".format(
+            self.attempts, self.retries, self.exhausted, self.wait_seconds
+        )
+
+
+class RetryPolicy(object):
+    """
+    Policy that decides if and when a recoverable error response (see
+    :attr:`moco_wrapper.util.response.ErrorResponse.is_recoverable`) is retried.
+
+    The delay before the n-th retry grows exponentially (``base_delay_ms * backoff_factor ** (n - 1)``) and is capped
+    at ``max_delay_ms``. With ``jitter`` enabled a random delay between zero and that value is used (full jitter), so
+    many clients that are rate limited at the same moment do not retry in lockstep. If the response contains a
+    ``Retry-After`` header, the delay the server asks for is used instead.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+
+        policy = RetryPolicy(max_attempts=8, base_delay_ms=500, max_delay_ms=20000, deadline_s=120)
+        m = Moco(
+            requestor=DefaultRequestor(retry_policy=policy)
+        )
+
+        ...
+        print(policy.statistics.retries)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 10,
+        base_delay_ms: float = 1000.0,
+        max_delay_ms: float = 60000.0,
+        backoff_factor: float = 2.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        deadline_s: float = None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        random_func=random.random
+    ):
+        """
+        Class constructor
+
+        :param max_attempts: Maximum number of attempts per request, the first attempt included (default ``10``)
+        :param base_delay_ms: Delay before the first retry in milliseconds (default ``1000``)
+        :param max_delay_ms: Maximum delay before a retry in milliseconds (default ``60000``)
+        :param backoff_factor: Factor the delay grows by with every retry (default ``2``)
+        :param jitter: If the delay should be randomized between zero and the computed delay (default ``True``)
+        :param respect_retry_after: If the ``Retry-After`` header of the response should be used as delay
+            (default ``True``)
+        :param deadline_s: Maximum time in seconds a request including all retries may take (default ``None``,
+            no deadline)
+        :param clock: Monotonic clock function (default :func:`time.monotonic`)
+        :param sleep: Function used for waiting (default :func:`time.sleep`)
+        :param random_func: Function returning a random float between 0 and 1 (default :func:`random.random`)
+
+        :type max_attempts: int
+        :type base_delay_ms: float
+        :type max_delay_ms: float
+        :type backoff_factor: float
+        :type jitter: bool
+        :type respect_retry_after: bool
+        :type deadline_s: float
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.deadline_s = deadline_s
+
+        self.clock = clock
+        self.sleep = sleep
+        self._random = random_func
+
+        self.statistics = RetryStatistics()
+        """
+        Counters of all requests this policy was used for
+
+        :type: :class:`.RetryStatistics`
+        """
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before the retry that follows the given attempt, ignoring ``Retry-After``.
+
+        :param attempt: Number of the attempt that failed (starting with 1)
+
+        :type attempt: int
+
+        :rtype: float
+        """
+        delay_ms = min(self.max_delay_ms, self.base_delay_ms * (self.backoff_factor ** (attempt - 1)))
+        if self.jitter:
+            delay_ms = self._random() * delay_ms
+
+        return delay_ms / 1000.0
+
+    def retry_after(self, http_response) -> float:
+        """
+        Returns the delay in seconds the server asked for with the ``Retry-After`` header.
+
+        :param http_response: http response object
+
+        :returns: Delay in seconds, ``None`` if the header is missing or invalid
+        :rtype: float
+        """
+        headers = getattr(http_response, "headers", None)
+        if not headers:
+            return None
+
+        value = headers.get("Retry-After", None)
+        if value is None:
+            return None
+
+        value = str(value).strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
+
+    def next_delay(self, attempt: int, http_response=None, started_at: float = None) -> float:
+        """
+        Decides if a request should be retried after the given attempt failed.
+
+        :param attempt: Number of the attempt that failed (starting with 1)
+        :param http_response: http response object of the failed attempt (default ``None``)
+        :param started_at: Clock value of the first attempt (default ``None``)
+
+        :type attempt: int
+        :type started_at: float
+
+        :returns: Delay in seconds before the next attempt, ``None`` if the request should not be retried
+        :rtype: float
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = None
+        if self.respect_retry_after and http_response is not None:
+            delay = self.retry_after(http_response)
+
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if self.deadline_s is not None and started_at is not None:
+            if self.clock() - started_at + delay > self.deadline_s:
+                return None
+
+        return delay
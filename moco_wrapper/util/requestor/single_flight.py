@@ -0,0 +1,201 @@
+import copy
+import threading
+
+from moco_wrapper.util.requestor.default import DefaultRequestor
+
+
+class _Call(object):
+    """
+    Request that is in flight, shared by every thread that asks for the same resource
+    """
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlightRequestor(object):
+    """
+    Requestor that sends identical ``GET`` requests only once, if they are in flight at the same time.
+
+    Threads that ask for a resource while the same resource is already being requested wait for that request and
+    receive its response, instead of sending a request of their own. Requests are identical if they have the same url,
+    url parameters and headers (which include the api key and the impersonated user). Every thread receives a copy of
+    the response object and its decoded body. Other http methods and streamed requests are always sent.
+
+    .. code-block:: python
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import SingleFlightRequestor, DefaultRequestor
+
+        m = Moco(
+            requestor=SingleFlightRequestor(
+                requestor=DefaultRequestor()
+            )
+        )
+
+        # workers that enrich activities with their project fetch every project only once at a time
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            projects = list(executor.map(lambda x: m.Project.get(x.project.id), activities))
+
+        print(m.requestor.coalesced_requests)
+
+    .. note::
+
+        Only requests that are in flight at the same time are shared, responses are not cached.
+    """
+
+    def __init__(
+        self,
+        requestor=None
+    ):
+        """
+        Class constructor
+
+        :param requestor: Requestor the requests are sent with
+            (default ``None``, a new :class:`moco_wrapper.util.requestor.DefaultRequestor`)
+
+        :type requestor: :class:`moco_wrapper.util.requestor.BaseRequestor`
+        """
+        if requestor is None:
+            requestor = DefaultRequestor()
+
+        self._requestor = requestor
+        self._lock = threading.Lock()
+        self._calls = {}
+
+        self.coalesced_requests = 0
+        """Number of requests that were answered with the response of another request"""
+
+    @property
+    def requestor(self):
+        """
+        Requestor this requestor wraps
+        """
+        return self._requestor
+
+    @property
+    def session(self):
+        """
+        Http Session of the wrapped requestor
+        """
+        return self._requestor.session
+
+    @property
+    def rate_limiter(self):
+        """
+        Rate limiter of the wrapped requestor
+        """
+        return getattr(self._requestor, "rate_limiter", None)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        **kwargs
+    ):
+        """
+        Request the given resource, or wait for the identical request that is already in flight
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: Path of the resource (e.g. ``/projects``)
+        :param params: Url parameters (e.g. ``page=1``, query parameters) (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+        :param kwargs: Additional http arguments.
+
+        :type method: str
+        :type path: str
+        :type params: dict
+        :type data: dict
+
+        :returns: Response object
+        """
+        key = None
+        if method == "GET" and data is None and not kwargs.get("stream", False):
+            key = self._key(path, params, kwargs)
+
+        if key is None:
+            return self._requestor.request(method, path, params=params, data=data, **kwargs)
+
+        with self._lock:
+            call = self._calls.get(key, None)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced_requests += 1
+
+        if leader:
+            try:
+                call.response = self._requestor.request(method, path, params=params, data=data, **kwargs)
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        # every caller gets its own response and decoded body, so changes of one caller are not seen by the others
+        copy_response = getattr(call.response, "copy", None)
+        return copy_response() if copy_response is not None else copy.copy(call.response)
+
+    def _key(self, path: str, params, kwargs: dict):
+        """
+        Returns the key identical requests share, ``None`` if the request cannot be shared
+        """
+        try:
+            key = (
+                path,
+                self._freeze(params),
+                self._freeze(kwargs.get("headers", None)),
+                self._freeze({k: v for k, v in kwargs.items() if k != "headers"})
+            )
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def _freeze(self, value):
+        """
+        Converts dictionaries and lists into hashable tuples
+        """
+        if value is None:
+            return None
+
+        if hasattr(value, "items"):
+            return tuple(sorted((str(k), self._freeze(v)) for k, v in value.items()))
+
+        if isinstance(value, (list, tuple)):
+            return tuple(self._freeze(x) for x in value)
+
+        return value
+
+    def get(self, path, params=None, **kwargs):
+        return self.request("GET", path, params=params, **kwargs)
+
+    def post(self, path, data=None, **kwargs):
+        return self.request("POST", path, data=data, **kwargs)
+
+    def put(self, path, data=None, params=None, **kwargs):
+        return self.request("PUT", path, data=data, params=params, **kwargs)
+
+    def delete(self, path, data=None, params=None, **kwargs):
+        return self.request("DELETE", path, data=data, params=params, **kwargs)
+
+    def patch(self, path, data=None, params=None, **kwargs):
+        return self.request("PATCH", path, data=data, params=params, **kwargs)
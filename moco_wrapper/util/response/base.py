@@ -1,3 +1,6 @@
+import copy
+
+
 
 class MWRAPResponse(object):
     """
@@ -11,9 +14,34 @@ class MWRAPResponse(object):
     def data(self):
         return self.response
 
+    def copy(self):
+        """
+        Returns a copy of the response that shares no data with this response, nested dictionaries and lists of the
+        decoded body included
+
+        :returns: Response object of the same class
+        """
+        duplicate = copy.copy(self)
+
+        data = getattr(self, "_data", None)
+        if isinstance(data, (dict, list)):
+            duplicate._data = copy.deepcopy(data)
+
+        return duplicate
+
     @property
     def response(self):
         """
         http response object
         """
         return self._response
+
+    @property
+    def transfer(self):
+        """
+        Size of the response body as transferred and after decompression (see
+        :class:`moco_wrapper.util.requestor.TransferRecord`), ``None`` if the body was not read
+        """
+        from moco_wrapper.util.requestor.compression import TransferRecord
+
+        return TransferRecord.from_response(self._response)
@@ -4,8 +4,21 @@ from .base import MWRAPResponse
 class FileResponse(MWRAPResponse):
     """
     Class for handling http responses where the body is just binary content representing a file
+
+    By default the body is read into memory when the response is received. Documents requested with ``stream=True``
+    (e.g. ``m.Invoice.pdf(invoice_id, stream=True)``) are only read when :attr:`data` is accessed or the file is
+    written with :meth:`write_to_file`, which reads the body in chunks, so the document is never held in memory as a
+    whole.
+
+    .. note::
+
+        The body of a streamed response can only be read once, and its connection is only returned to the pool once
+        the body was read or :meth:`close` was called.
     """
 
+    CHUNK_SIZE = 64 * 1024
+    """Default size of the chunks the body is read in (64 KiB)"""
+
     @property
     def data(self):
         """
@@ -17,6 +30,10 @@ class FileResponse(MWRAPResponse):
             :attr:`file`
 
         """
+        if self._data is None:
+            self._check_consumed()
+            self._data = self.response.content
+
         return self._data
 
     @property
@@ -36,19 +53,65 @@ class FileResponse(MWRAPResponse):
 
         .. seealso::
 
-            :attr:`data`
+            :attr:`data`, :meth:`write_to_file` for writing large files without reading them into memory
 
         """
-        return self._data
+        return self.data
 
-    def write_to_file(
+    def iter_chunks(
         self,
-        file_path: str
+        chunk_size: int = None
     ):
+        """
+        Yields the body of the response in chunks, without reading it into memory as a whole
+
+        :param chunk_size: Size of the chunks in bytes (default :attr:`CHUNK_SIZE`)
+
+        :type chunk_size: int
+
+        .. note::
+
+            The body of a streamed response can only be iterated once, unless :attr:`data` was accessed before.
+        """
+        if chunk_size is None:
+            chunk_size = self.CHUNK_SIZE
+
+        if self._data is not None:
+            for start in range(0, len(self._data), chunk_size):
+                yield self._data[start:start + chunk_size]
+            return
+
+        iter_content = getattr(self.response, "iter_content", None)
+        if iter_content is None:
+            # http response objects without streaming support
+            yield self.data
+            return
+
+        self._check_consumed()
+
+        # responses that were not streamed keep their content and can be iterated again
+        self._consumed = not getattr(self.response, "_content_consumed", False)
+
+        for chunk in iter_content(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+
+    def write_to_file(
+        self,
+        file_path,
+        chunk_size: int = None
+    ) -> int:
         """
         Writes the binary response content to a file
 
-        :param file_path: path of the target file
+        :param file_path: path of the target file, or a binary file object to write to
+        :param chunk_size: Size of the chunks the body is written in (default :attr:`CHUNK_SIZE`)
+
+        :type file_path: str, file object
+        :type chunk_size: int
+
+        :returns: Number of bytes written
+        :rtype: int
 
         .. code-block:: python
 
@@ -60,9 +123,42 @@ class FileResponse(MWRAPResponse):
             file_response.write_to_file(target_path)
 
         """
+        # checked before the target file is opened, so an existing file is not truncated
+        if self._data is None:
+            self._check_consumed()
+
+        written = 0
+
+        if hasattr(file_path, "write"):
+            for chunk in self.iter_chunks(chunk_size):
+                file_path.write(chunk)
+                written += len(chunk)
+        else:
+            with open(file_path, 'w+b') as bf:
+                for chunk in self.iter_chunks(chunk_size):
+                    bf.write(chunk)
+                    written += len(chunk)
+
+        self.close()
+        return written
+
+    def _check_consumed(self):
+        """
+        Raises an error if the body of a streamed response was already read
+        """
+        if self._consumed:
+            raise RuntimeError(
+                "The body of the streamed response was already read, request the document without stream=True to "
+                "read it more than once"
+            )
 
-        with open(file_path, 'w+b') as bf:
-            bf.write(self._data)
+    def close(self):
+        """
+        Releases the connection of a streamed response that was not (fully) read
+        """
+        close = getattr(self.response, "close", None)
+        if close is not None:
+            close()
 
     def __init__(
         self,
@@ -75,8 +171,8 @@ class FileResponse(MWRAPResponse):
         """
         super(FileResponse, self).__init__(response)
 
-        binary_format = bytearray(response.content)
-        self._data = binary_format
+        self._data = None
+        self._consumed = False
 
     def __str__(self):
         return "<FileResponse, Status Code: {}, Data: binary_content>".format(self.response.status_code)
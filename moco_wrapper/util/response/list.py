@@ -8,21 +8,21 @@ class ListResponse(MWRAPResponse):
     The difference to :class:`moco_wrapper.util.response.PagedListResponse` is that ListResponses are not paged.
     """
 
-    def __init__(self, response):
+    def __init__(self, response, data: list = None):
         """
         Class constructor
 
         :param response: http response object
+        :param data: Decoded json content of the response (default ``None``, the response body will be decoded)
+
+        :type data: list
         """
         super(ListResponse, self).__init__(response)
 
-        # loop over every single item in the json dictionary and convert it into an object by itself
-        json_content = response.json()
-        items = []
-        for json_item in json_content:
-            items.append(json_item)
+        if data is None:
+            data = response.json()
 
-        self._data = items
+        self._data = data
 
     @property
     def items(self) -> list:
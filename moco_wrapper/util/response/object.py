@@ -22,15 +22,21 @@ class ObjectResponse(MWRAPResponse):
         """
         return self._data
 
-    def __init__(self, response):
+    def __init__(self, response, data: dict = None):
         """
         class constructor
 
         :param response: http response object
+        :param data: Decoded json content of the response (default ``None``, the response body will be decoded)
+
+        :type data: dict
         """
         super(ObjectResponse, self).__init__(response)
 
-        self._data = self.response.json()
+        if data is None:
+            data = self.response.json()
+
+        self._data = data
 
     def __str__(self):
         return "<ObjectResponse, Status Code: {}, Data: {}>".format(self.response.status_code, str(self._data))
@@ -104,21 +104,18 @@ class PagedListResponse(ListResponse):
         # result has rest, so there is another page
         return last_page + 1
 
-    def __init__(self, response):
+    def __init__(self, response, data: list = None):
         """
         Class constructor
 
         :param response: http response object
-        """
-        super(PagedListResponse, self).__init__(response)
+        :param data: Decoded json content of the response (default ``None``, the response body will be decoded)
 
-        # loop over every single item in the json dictionary and convert it into an object by itself
-        json_content = response.json()
-        items = []
-        for json_item in json_content:
-            items.append(json_item)
+        :type data: list
+        """
+        super(PagedListResponse, self).__init__(response, data=data)
 
-        self._data = items
+        items = self._data
 
         if "x-page" in response.headers.keys():
             self._current_page = int(response.headers["x-page"])
@@ -13,6 +13,13 @@ with open('HISTORY.rst') as history_file:
 
 requirements = ["requests"]
 
+extras_requirements = {
+    "orjson": ["orjson"],
+    "ujson": ["ujson"],
+    "brotli": ["brotli"],
+    "zstd": ["zstandard", "urllib3>=2"],
+}
+
 setup_requirements = ['pytest-runner', ]
 
 test_requirements = ['pytest', 'betamax', 'betamax-serializers']
@@ -20,19 +27,18 @@ test_requirements = ['pytest', 'betamax', 'betamax-serializers']
 setup(
     author="sommalia",
     author_email='sommalia@protonmail.com',
-    python_requires='>=3.5.0',
+    python_requires='>=3.7.0',
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Natural Language :: English',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
     description="Wrapper package for using the moco api interface",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="GNU General Public License v3",
     long_description=readme + '\n\n' + history,
     include_package_data=True,
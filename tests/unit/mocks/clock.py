@@ -0,0 +1,15 @@
+class FakeClock(object):
+    """
+    Clock that only advances when it is set or slept on
+    """
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
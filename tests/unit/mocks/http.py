@@ -1,10 +1,13 @@
+import json
+
 from moco_wrapper.util.response import ErrorResponse
 
 
 class MockHttpResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, headers=None):
         self.json_data = json_data
         self.status_code = status_code
+        self.headers = headers if headers is not None else {}
 
     def json(self):
         return self.json_data
@@ -17,3 +20,36 @@ class MockHttpErrorResponse(object):
 
     def to_error(self):
         return ErrorResponse(self)
+
+
+class FakeHttpResponse(object):
+    """
+    Http response with a text body, like the responses of a requests session
+    """
+
+    def __init__(self, status_code=200, body="", headers=None):
+        self.status_code = status_code
+        self.text = body
+        self.content = body.encode("utf-8")
+        self.headers = {"Content-Type": "application/json"}
+        self.headers.update(headers or {})
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession(object):
+    """
+    Session that answers requests with the given responses in order (``None`` once they are used up) and records the
+    arguments of the last request
+    """
+
+    def __init__(self, responses=None):
+        self.responses = list(responses or [])
+        self.calls = 0
+        self.kwargs = None
+
+    def request(self, method, path, **kwargs):
+        self.calls += 1
+        self.kwargs = kwargs
+        return self.responses.pop(0) if self.responses else None
@@ -0,0 +1,71 @@
+import threading
+
+from moco_wrapper.util.response import ListResponse, PagedListResponse, ObjectResponse, EmptyResponse
+
+from .http import MockHttpResponse
+
+
+class CountingRequestor(object):
+    """
+    Requestor that records every request, answers with a list of units for ``/units`` and with an object otherwise
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, path, params=None, data=None, **kwargs):
+        self.calls.append((method, path))
+
+        if method == "DELETE":
+            return EmptyResponse(MockHttpResponse(None, 204))
+
+        if path.endswith("/units"):
+            return ListResponse(MockHttpResponse([{"id": 1, "name": "Unit"}, {"id": 2, "name": "Unit"}], 200))
+
+        return ObjectResponse(MockHttpResponse({
+            "id": len(self.calls),
+            "name": "Object",
+            "custom_properties": {"Department": "Sales"},
+            "tags": ["a"]
+        }, 200))
+
+    def get(self, path, params=None, **kwargs):
+        return self.request("GET", path, params=params, **kwargs)
+
+    def post(self, path, data=None, **kwargs):
+        return self.request("POST", path, data=data, **kwargs)
+
+    def put(self, path, data=None, params=None, **kwargs):
+        return self.request("PUT", path, data=data, params=params, **kwargs)
+
+    def delete(self, path, data=None, params=None, **kwargs):
+        return self.request("DELETE", path, data=data, params=params, **kwargs)
+
+    def patch(self, path, data=None, params=None, **kwargs):
+        return self.request("PATCH", path, data=data, params=params, **kwargs)
+
+
+class HeaderRecordingRequestor(object):
+    """
+    Requestor that returns 3 pages of projects and records the headers of every page
+    """
+
+    def __init__(self):
+        self.headers = {}
+        self.lock = threading.Lock()
+
+    def request(self, method, path, params=None, data=None, headers=None, **kwargs):
+        page = (params or {}).get("page", 1)
+
+        with self.lock:
+            self.headers[page] = dict(headers or {})
+
+        response_headers = {"X-Page": str(page), "x-page": str(page), "x-total": "3", "x-per-page": "1"}
+        if page < 3:
+            response_headers["Link"] = '<https://x/api/v1/projects?page={}>; rel="next", ' \
+                '<https://x/api/v1/projects?page=3>; rel="last"'.format(page + 1)
+
+        return PagedListResponse(MockHttpResponse([{"id": page, "name": "Project"}], 200, response_headers))
+
+    def get(self, path, params=None, **kwargs):
+        return self.request("GET", path, params=params, **kwargs)
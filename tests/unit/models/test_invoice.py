@@ -196,6 +196,17 @@ class TestInvoice(UnitTest):
         )
 
         assert response["method"] == "GET"
+        assert dict(response["args"])["stream"] is False
+
+    def test_pdf_stream(self):
+        invoice_id = 2
+
+        response = self.moco.Invoice.pdf(
+            invoice_id=invoice_id,
+            stream=True
+        )
+
+        assert dict(response["args"])["stream"] is True
 
     def test_get(self):
         invoice_id = 2
@@ -0,0 +1,96 @@
+import asyncio
+
+from moco_wrapper import AsyncMoco, models, util
+
+
+class TestAsyncMoco(object):
+    def setup(self):
+        self.moco = AsyncMoco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=util.requestor.RawRequestor(),
+            objector=util.objector.RawObjector()
+        )
+
+    def run(self, coroutine):
+        return asyncio.new_event_loop().run_until_complete(coroutine)
+
+    def test_requestor_wrapped(self):
+        assert isinstance(self.moco.requestor, util.requestor.AsyncRequestor)
+        assert isinstance(self.moco.requestor.requestor, util.requestor.RawRequestor)
+
+    def test_default_requestor(self):
+        new_moco = AsyncMoco(auth={"api_key": "api_key", "domain": "domain"})
+
+        assert isinstance(new_moco.requestor, util.requestor.AsyncRequestor)
+        assert isinstance(new_moco.requestor.requestor, util.requestor.DefaultRequestor)
+
+    def test_models_set(self):
+        assert isinstance(self.moco.Activity, models.Activity)
+        assert isinstance(self.moco.Project, models.Project)
+
+    def test_model_method_awaitable(self):
+        response = self.run(self.moco.Project.get(1234))
+
+        assert response["method"] == "GET"
+        assert response["path"].endswith("/projects/1234")
+
+    def test_gather(self):
+        async def get_projects():
+            return await asyncio.gather(*[self.moco.Project.get(x) for x in range(10)])
+
+        responses = self.run(get_projects())
+
+        assert [x["path"].split("/")[-1] for x in responses] == [str(x) for x in range(10)]
+
+    def test_authenticate(self):
+        self.run(self.moco.Unit.getlist())
+
+        assert self.moco.api_key == "<TOKEN>"
+        assert self.moco.domain == "<DOMAIN>"
+
+    def test_header_append(self):
+        response = self.run(self.moco.request("GET", "path", bypass_auth=True, headers={"not-needed-header": "new"}))
+
+        headers = dict(response["args"])["headers"]
+        assert headers["not-needed-header"] == "new"
+        assert headers["Authorization"] == "Token token=<TOKEN>"
+
+    def test_impersonation_per_task(self):
+        async def get_project(user_id):
+            with self.moco.impersonation(user_id):
+                await asyncio.sleep(0)
+                return await self.moco.Project.get(1)
+
+        async def get_projects():
+            return await asyncio.gather(*[get_project(x) for x in range(5)])
+
+        responses = self.run(get_projects())
+
+        user_ids = [dict(x["args"])["headers"]["X-IMPERSONATE-USER-ID"] for x in responses]
+        assert user_ids == [str(x) for x in range(5)]
+
+    def test_context_manager_closes_executor(self):
+        async def get_project():
+            async with AsyncMoco(auth={"api_key": "api_key", "domain": "domain"},
+                                 requestor=util.requestor.RawRequestor(),
+                                 objector=util.objector.RawObjector()) as moco:
+                await moco.Project.get(1)
+                return moco
+
+        moco = self.run(get_project())
+
+        assert moco.requestor._executor._shutdown
+
+    def test_given_executor_not_closed(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        requestor = util.requestor.AsyncRequestor(requestor=util.requestor.RawRequestor(), executor=executor)
+
+        requestor.close()
+
+        assert not executor._shutdown
+        executor.shutdown()
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import time
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+
+def loaded_modules(code):
+    """
+    Runs the code in a new interpreter and returns the modules that were loaded
+    """
+    result = run_python(code + "\nimport sys\nprint('\\n'.join(sys.modules.keys()))")
+    return set(result.stdout.split())
+
+
+class TestImportTime(object):
+
+    def test_package_import_loads_nothing(self):
+        modules = loaded_modules("import moco_wrapper")
+
+        assert "moco_wrapper.moco" not in modules
+        assert "moco_wrapper.models" not in modules
+        assert "moco_wrapper.util" not in modules
+        assert "requests" not in modules
+
+    def test_moco_import_does_not_load_requests(self):
+        modules = loaded_modules("from moco_wrapper import Moco")
+
+        assert "moco_wrapper.moco" in modules
+        assert "requests" not in modules
+        assert "asyncio" not in modules
+        assert "concurrent.futures" not in modules
+
+    def test_lazy_attributes(self):
+        run_python(
+            "import moco_wrapper\n"
+            "assert moco_wrapper.Moco is moco_wrapper.moco.Moco\n"
+            "assert moco_wrapper.util.requestor.DefaultRequestor is not None\n"
+            "assert moco_wrapper.exceptions.MocoException is not None\n"
+            "assert 'AsyncMoco' in dir(moco_wrapper)\n"
+        )
+
+    def test_import_time(self):
+        # generous limit, only catches imports of heavy dependencies creeping back into the package import
+        started_at = time.perf_counter()
+        run_python("import moco_wrapper")
+        with_package = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        run_python("pass")
+        without_package = time.perf_counter() - started_at
+
+        assert with_package - without_package < 0.5
@@ -1,5 +1,9 @@
+import threading
+
 import pytest
 
+from concurrent.futures import ThreadPoolExecutor
+
 from . import UnitTest
 
 from moco_wrapper import moco, util, models
@@ -181,3 +185,125 @@ class TestMocoWrapper(UnitTest):
                 assert headers[additional_header_key] == additional_header
 
 
+
+    def test_bind(self):
+        new_moco = moco.Moco(objector=util.objector.RawObjector(), requestor=util.requestor.RawRequestor())
+
+        ep = new_moco.bind("activity_get")
+
+        assert isinstance(ep, util.endpoint.BoundEndpoint)
+        assert ep.method == "GET"
+        assert ep.url_format({"id": 4}) == "/activities/4"
+        assert new_moco.bind("activity_get") is ep
+        assert new_moco.bind(ep.endpoint) is not None
+
+    def test_bind_unknown_slug(self):
+        new_moco = moco.Moco()
+
+        assert new_moco.bind("this_slug_does_not_exist") is None
+
+    def test_request_bound_endpoint(self):
+        new_moco = moco.Moco(objector=util.objector.RawObjector(), requestor=util.requestor.RawRequestor())
+
+        response = new_moco.request_e(new_moco.bind("activity_update"), ep_params={"id": 4}, bypass_auth=True)
+
+        assert response["method"] == "PUT"
+        assert response["path"].endswith("/activities/4")
+
+    def test_headers_cached(self):
+        new_moco = moco.Moco(auth={"api_key": "api_key", "domain": "domain"})
+        new_moco.authenticate()
+
+        headers = new_moco._default_headers()
+
+        assert new_moco._default_headers() is headers
+        assert headers["Authorization"] == "Token token=api_key"
+
+    def test_headers_rebuilt_on_impersonation(self):
+        new_moco = moco.Moco(auth={"api_key": "api_key", "domain": "domain"})
+        new_moco.authenticate()
+
+        headers = new_moco._default_headers()
+        new_moco.impersonate(123)
+
+        assert new_moco._default_headers() is not headers
+        assert new_moco._default_headers()["X-IMPERSONATE-USER-ID"] == "123"
+        assert "X-IMPERSONATE-USER-ID" not in headers
+
+    def test_headers_copy(self):
+        new_moco = moco.Moco(auth={"api_key": "api_key", "domain": "domain"})
+
+        headers = new_moco.headers
+        headers["Content-Type"] = "text/plain"
+
+        assert new_moco.headers["Content-Type"] == "application/json"
+
+    def test_header_append_does_not_change_defaults(self):
+        new_moco = moco.Moco(objector=util.objector.RawObjector(), requestor=util.requestor.RawRequestor())
+        new_moco.request("GET", "path", bypass_auth=True, headers={"not-needed-header": "value"})
+
+        assert "not-needed-header" not in new_moco._default_headers()
+
+    def test_models_created_on_access(self):
+        new_moco = moco.Moco()
+
+        assert "Activity" not in vars(new_moco)
+        activity = new_moco.Activity
+
+        assert vars(new_moco)["Activity"] is activity
+        assert new_moco.Activity is activity
+
+    def test_endpoint_manager_shared(self):
+        first = moco.Moco()
+        second = moco.Moco()
+
+        assert first.endpoint_manager is second.endpoint_manager
+        assert first.endpoint_manager is util.endpoint.EndpointManager.shared()
+
+    def test_impersonation_context(self):
+        new_moco = moco.Moco(objector=util.objector.RawObjector(), requestor=util.requestor.RawRequestor())
+
+        with new_moco.impersonation(123):
+            assert new_moco.impersonation_user_id == 123
+            response = new_moco.request("GET", "path", bypass_auth=True)
+
+        assert dict(response["args"])["headers"]["X-IMPERSONATE-USER-ID"] == "123"
+        assert new_moco.impersonation_user_id is None
+        assert new_moco._impersonation_user_id is None
+
+    def test_impersonation_context_nested(self):
+        new_moco = moco.Moco(impersonate_user_id=1)
+        other_moco = moco.Moco()
+
+        with new_moco.impersonation(2):
+            with new_moco.impersonation(None):
+                assert new_moco.impersonation_user_id is None
+
+            assert new_moco.impersonation_user_id == 2
+            assert other_moco.impersonation_user_id is None
+
+        assert new_moco.impersonation_user_id == 1
+
+    def test_impersonation_context_threads(self):
+        new_moco = moco.Moco(objector=util.objector.RawObjector(), requestor=util.requestor.RawRequestor())
+        barrier = threading.Barrier(4)
+
+        def send(user_id):
+            with new_moco.impersonation(user_id):
+                barrier.wait()
+                response = new_moco.request("GET", "path", bypass_auth=True)
+                return dict(response["args"])["headers"]["X-IMPERSONATE-USER-ID"]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            user_ids = list(executor.map(send, range(4)))
+
+        assert user_ids == ["0", "1", "2", "3"]
+
+    def test_authenticate_threads(self):
+        new_moco = moco.Moco(auth={"api_key": "api_key", "domain": "domain"})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda x: new_moco.authenticate(), range(32)))
+
+        assert new_moco.api_key == "api_key"
+        assert new_moco.domain == "domain"
@@ -0,0 +1,138 @@
+import os
+import threading
+
+import pytest
+
+from moco_wrapper import Moco
+from moco_wrapper.exceptions import NotFoundException
+from moco_wrapper.util.archive import DocumentArchiver, ArchiveResult
+from moco_wrapper.util.response import FileResponse, ListResponse
+
+from .test_file_response import make_stream_response
+from ..mocks.http import MockHttpResponse
+
+
+class PdfModel(object):
+    def __init__(self, prefix, client):
+        self.prefix = prefix
+        self.client = client
+        self.calls = []
+        self.impersonated = {}
+        self.lock = threading.Lock()
+
+    def document(self, document_id):
+        return "{} {}".format(self.prefix, document_id).encode("utf-8") * 1000
+
+    def pdf(self, document_id, stream=False):
+        assert stream
+        with self.lock:
+            self.calls.append(document_id)
+            self.impersonated[document_id] = self.client.impersonation_user_id
+
+        if document_id == 404:
+            raise NotFoundException(MockHttpResponse({}, 404), "not found")
+
+        response, _ = make_stream_response(self.document(document_id))
+        return FileResponse(response)
+
+    def timesheet_pdf(self, document_id, stream=False):
+        return self.pdf(document_id, stream=stream)
+
+    def getlist(self, **kwargs):
+        return ListResponse(MockHttpResponse([{"id": 1}, {"id": 2}], 200))
+
+
+class MockMoco(object):
+    def __init__(self):
+        self.client = Moco(auth={"api_key": "api_key", "domain": "domain"})
+        self.Invoice = PdfModel("invoice", self.client)
+        self.Offer = PdfModel("offer", self.client)
+        self.PurchaseDraft = PdfModel("draft", self.client)
+
+
+class TestDocumentArchiver(object):
+    def setup(self):
+        self.moco = MockMoco()
+
+    def test_archive_invoices(self, tmp_path):
+        archiver = DocumentArchiver(self.moco, str(tmp_path), max_workers=3)
+
+        results = archiver.archive_invoices(ids=range(10))
+
+        assert [x.document_id for x in results] == list(range(10))
+        assert all(x.status == ArchiveResult.DOWNLOADED for x in results)
+        assert (tmp_path / "invoice_3.pdf").read_bytes() == self.moco.Invoice.document(3)
+        assert not any(x.name.endswith(".part") for x in tmp_path.iterdir())
+
+    def test_timesheets(self, tmp_path):
+        archiver = DocumentArchiver(self.moco, str(tmp_path))
+
+        results = archiver.archive_invoices(ids=[1], timesheets=True)
+
+        assert [x.document_type for x in results] == ["invoice", "invoice_timesheet"]
+        assert os.path.isfile(str(tmp_path / "invoice_1_timesheet.pdf"))
+
+    def test_ids_from_getlist(self, tmp_path):
+        results = DocumentArchiver(self.moco, str(tmp_path)).archive_offers()
+
+        assert [x.path for x in results] == [str(tmp_path / "offer_1.pdf"), str(tmp_path / "offer_2.pdf")]
+
+    def test_resume(self, tmp_path):
+        DocumentArchiver(self.moco, str(tmp_path)).archive_purchase_drafts(ids=[1, 2])
+        self.moco.PurchaseDraft.calls = []
+
+        results = DocumentArchiver(self.moco, str(tmp_path)).archive_purchase_drafts(ids=[1, 2, 3])
+
+        assert [x.status for x in results] == ["skipped", "skipped", "downloaded"]
+        assert self.moco.PurchaseDraft.calls == [3]
+
+    def test_resume_changed_file(self, tmp_path):
+        DocumentArchiver(self.moco, str(tmp_path)).archive_offers(ids=[1, 2])
+        (tmp_path / "offer_1.pdf").write_bytes(b"truncated")
+
+        results = DocumentArchiver(self.moco, str(tmp_path)).archive_offers(ids=[1, 2])
+
+        assert [x.status for x in results] == ["downloaded", "skipped"]
+        assert (tmp_path / "offer_1.pdf").read_bytes() == self.moco.Offer.document(1)
+
+    def test_resume_verify_hash(self, tmp_path):
+        DocumentArchiver(self.moco, str(tmp_path)).archive_offers(ids=[1])
+        content = bytearray((tmp_path / "offer_1.pdf").read_bytes())
+        content[0] = ord("X")
+        (tmp_path / "offer_1.pdf").write_bytes(bytes(content))
+
+        assert DocumentArchiver(self.moco, str(tmp_path)).archive_offers(ids=[1])[0].status == "skipped"
+        assert DocumentArchiver(self.moco, str(tmp_path), verify="hash").archive_offers(ids=[1])[0].status == \
+            "downloaded"
+
+    def test_failed_download(self, tmp_path):
+        results = DocumentArchiver(self.moco, str(tmp_path)).archive_invoices(ids=[1, 404])
+
+        assert results[0].ok
+        assert not results[1].ok
+        assert isinstance(results[1].error, NotFoundException)
+        assert not os.path.exists(results[1].path)
+
+    def test_progress(self, tmp_path):
+        reported = []
+
+        def progress(result, done, total):
+            reported.append((done, total))
+
+        DocumentArchiver(self.moco, str(tmp_path), max_workers=2, progress=progress).archive(
+            [("invoice", 1), ("offer", 1), ("purchase_draft", 1)]
+        )
+
+        assert reported == [(1, 3), (2, 3), (3, 3)]
+
+    def test_unknown_document_type(self, tmp_path):
+        with pytest.raises(ValueError):
+            DocumentArchiver(self.moco, str(tmp_path)).archive([("project", 1)])
+
+    def test_keeps_impersonation(self, tmp_path):
+        archiver = DocumentArchiver(self.moco, str(tmp_path), max_workers=3)
+
+        with self.moco.client.impersonation(42):
+            archiver.archive_invoices(ids=range(6))
+
+        assert self.moco.Invoice.impersonated == {x: 42 for x in range(6)}
@@ -1,3 +1,7 @@
+import json
+
+from moco_wrapper.util.json_codec import JsonCodec
+from moco_wrapper.util.response import PagedListResponse, ObjectResponse
 from moco_wrapper.util.requestor.base import BaseRequestor
 
 class TestDefaultRequestor(object):
@@ -19,3 +23,49 @@ class TestDefaultRequestor(object):
 
         assert new_params["bool_param"] != params["bool_param"]
         assert new_params["bool_param"] == "true"
+
+    def test_response_decoded_once(self):
+        self.requestor.json_codec = CountingCodec()
+        response = CountingHttpResponse([{"id": 1}, {"id": 2}], {"X-Page": "1", "x-page": "1", "x-total": "2"})
+
+        list_response = self.requestor._create_response(response)
+
+        assert isinstance(list_response, PagedListResponse)
+        assert list_response.items == [{"id": 1}, {"id": 2}]
+        assert list_response.total == 2
+        assert self.requestor.json_codec.loads_calls == 1
+        assert response.json_calls == 0
+
+    def test_object_response_decoded_once(self):
+        self.requestor.json_codec = CountingCodec()
+        response = CountingHttpResponse({"id": 1})
+
+        object_response = self.requestor._create_response(response)
+
+        assert isinstance(object_response, ObjectResponse)
+        assert object_response.data == {"id": 1}
+        assert self.requestor.json_codec.loads_calls == 1
+        assert response.json_calls == 0
+
+
+class CountingHttpResponse(object):
+    def __init__(self, json_data, headers=None):
+        self.json_data = json_data
+        self.status_code = 200
+        self.content = json.dumps(json_data).encode("utf-8")
+        self.headers = {"Content-Type": "application/json"}
+        self.headers.update(headers or {})
+        self.json_calls = 0
+
+    def json(self):
+        self.json_calls += 1
+        return self.json_data
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, content):
+        self.loads_calls += 1
+        return super(CountingCodec, self).loads(content)
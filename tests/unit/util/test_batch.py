@@ -0,0 +1,193 @@
+import threading
+import time
+
+import requests
+import urllib3
+
+from moco_wrapper import Moco
+from moco_wrapper.exceptions import NotFoundException, RateLimitException, ServerErrorException
+from moco_wrapper.util.batch import BatchExecutor, Operation, OperationResult
+from moco_wrapper.util.requestor import RetryPolicy, RateLimiter
+from moco_wrapper.util.response import ObjectResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class Activity(object):
+    def __init__(self, client):
+        self.client = client
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.failures = {}
+        self.impersonated = {}
+
+    def create(self, number, fail_with=None, fail_times=1):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.impersonated[number] = self.client.impersonation_user_id
+
+        try:
+            # later operations finish first, the results must still be in input order
+            time.sleep(0.001 * (10 - number % 10))
+
+            if fail_with is not None:
+                with self.lock:
+                    failed = self.failures.get(number, 0)
+                    self.failures[number] = failed + 1
+
+                if failed < fail_times:
+                    raise fail_with
+
+            return ObjectResponse(MockHttpResponse({"id": number}, 200))
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class Requestor(object):
+    def __init__(self):
+        self.rate_limiter = RateLimiter()
+
+
+class MockMoco(object):
+    def __init__(self):
+        self.client = Moco(auth={"api_key": "api_key", "domain": "domain"})
+        self.Activity = Activity(self.client)
+        self.requestor = Requestor()
+
+
+class TestBatchExecutor(object):
+    def setup(self):
+        self.moco = MockMoco()
+        self.slept = []
+        self.policy = RetryPolicy(max_attempts=3, jitter=False, sleep=self.slept.append)
+
+    def test_results_in_order(self):
+        executor = BatchExecutor(self.moco, max_workers=4, retry_policy=self.policy)
+
+        results = executor.run([Operation("Activity", "create", {"number": x}) for x in range(30)])
+
+        assert [x.data["id"] for x in results] == list(range(30))
+        assert all(x.ok and x.attempts == 1 for x in results)
+
+    def test_bounded_parallelism(self):
+        executor = BatchExecutor(self.moco, max_workers=3, retry_policy=self.policy)
+
+        executor.run(Operation("Activity", "create", {"number": x}) for x in range(30))
+
+        assert 1 < self.moco.Activity.max_running <= 3
+
+    def test_tuples_and_model_objects(self):
+        executor = BatchExecutor(self.moco, retry_policy=self.policy)
+
+        results = executor.run([
+            ("Activity", "create", {"number": 1}),
+            (self.moco.Activity, "create", {"number": 2}),
+        ])
+
+        assert [x.data["id"] for x in results] == [1, 2]
+        assert "Activity.create" in repr(results[1])
+
+    def test_errors_collected(self):
+        not_found = NotFoundException(MockHttpResponse({}, 404), "not found")
+        executor = BatchExecutor(self.moco, retry_policy=self.policy)
+
+        results = executor.run([
+            Operation("Activity", "create", {"number": 1}),
+            Operation("Activity", "create", {"number": 2, "fail_with": not_found}),
+            Operation("Activity", "create", {"number": 3}),
+            Operation("Activity", "unknown_method", {}),
+        ])
+
+        assert [x.status for x in results] == [
+            OperationResult.SUCCEEDED, OperationResult.FAILED, OperationResult.SUCCEEDED, OperationResult.FAILED
+        ]
+        assert results[1].error is not_found
+        assert results[1].attempts == 1
+        assert results[1].data is None
+        assert isinstance(results[3].error, AttributeError)
+        assert self.slept == []
+
+    def test_connect_errors_retried(self):
+        refused = requests.ConnectionError(urllib3.exceptions.MaxRetryError(
+            None, "/activities", urllib3.exceptions.NewConnectionError(None, "connection refused")
+        ))
+        executor = BatchExecutor(self.moco, retry_policy=self.policy)
+
+        results = executor.run([
+            Operation("Activity", "create", {"number": 1, "fail_with": refused, "fail_times": 2}),
+            Operation("Activity", "create", {"number": 2, "fail_with": requests.ConnectTimeout("timeout")}),
+        ])
+
+        assert all(x.ok for x in results)
+        assert [x.attempts for x in results] == [3, 2]
+        assert sorted(self.slept) == [1.0, 1.0, 2.0]
+
+    def test_unsafe_errors_not_retried(self):
+        server_error = ServerErrorException(MockHttpResponse({}, 500), "error")
+        executor = BatchExecutor(self.moco, retry_policy=self.policy)
+
+        results = executor.run([
+            Operation("Activity", "create", {"number": 1, "fail_with": server_error}),
+            Operation("Activity", "create", {"number": 2, "fail_with": requests.ReadTimeout("timeout")}),
+            Operation("Activity", "create", {"number": 3, "fail_with": requests.ConnectionError("reset")}),
+        ])
+
+        assert not any(x.ok for x in results)
+        assert [x.attempts for x in results] == [1, 1, 1]
+        assert self.moco.Activity.failures == {1: 1, 2: 1, 3: 1}
+        assert self.slept == []
+
+    def test_unsafe_errors_retried(self):
+        server_error = ServerErrorException(MockHttpResponse({}, 500), "error")
+        executor = BatchExecutor(self.moco, retry_policy=self.policy, retry_unsafe=True)
+
+        results = executor.run([
+            Operation("Activity", "create", {"number": 1, "fail_with": server_error, "fail_times": 2}),
+            Operation("Activity", "create", {"number": 2, "fail_with": requests.ReadTimeout("timeout")}),
+        ])
+
+        assert all(x.ok for x in results)
+        assert [x.attempts for x in results] == [3, 2]
+
+    def test_retries_exhausted(self):
+        server_error = ServerErrorException(MockHttpResponse({}, 500), "error")
+        executor = BatchExecutor(self.moco, retry_policy=self.policy, retry_unsafe=True)
+
+        results = executor.run([
+            Operation("Activity", "create", {"number": 1, "fail_with": server_error, "fail_times": 5}),
+        ])
+
+        assert not results[0].ok
+        assert results[0].attempts == 3
+        assert self.policy.statistics.exhausted == 1
+
+    def test_rate_limit_blocks_limiter(self):
+        rate_limited = RateLimitException(MockHttpResponse({}, 429, headers={"Retry-After": "3"}), "rate limited")
+        executor = BatchExecutor(self.moco, retry_policy=self.policy)
+
+        results = executor.run([Operation("Activity", "create", {"number": 1, "fail_with": rate_limited})])
+
+        assert results[0].ok
+        assert self.slept == [3.0]
+        assert self.moco.requestor.rate_limiter._blocked_until is not None
+
+    def test_progress(self):
+        reported = []
+        executor = BatchExecutor(self.moco, retry_policy=self.policy,
+                                 progress=lambda result, done, total: reported.append((done, total)))
+
+        executor.run([Operation("Activity", "create", {"number": x}) for x in range(5)])
+
+        assert [x[0] for x in reported] == [1, 2, 3, 4, 5]
+        assert all(x[1] == 5 for x in reported)
+
+    def test_keeps_impersonation(self):
+        executor = BatchExecutor(self.moco, max_workers=4, retry_policy=self.policy)
+
+        with self.moco.client.impersonation(42):
+            executor.run(Operation("Activity", "create", {"number": x}) for x in range(12))
+
+        assert self.moco.Activity.impersonated == {x: 42 for x in range(12)}
@@ -0,0 +1,145 @@
+import threading
+
+from moco_wrapper import Moco
+from moco_wrapper.exceptions import UnprocessableException, ServerErrorException
+from moco_wrapper.util.bulk import BulkWriter, BulkItemResult
+from moco_wrapper.util.response import ListResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class BulkModel(object):
+    def __init__(self, client):
+        self.client = client
+        self.chunks = []
+        self.impersonated = []
+        self.lock = threading.Lock()
+
+    def create(self, items):
+        with self.lock:
+            self.chunks.append(items)
+            self.impersonated.append(self.client.impersonation_user_id)
+
+        if any(x.get("title") == "invalid" for x in items):
+            raise UnprocessableException(MockHttpResponse({}, 422), "invalid")
+
+        if any(x.get("title") == "error" for x in items):
+            raise ServerErrorException(MockHttpResponse({}, 500), "error")
+
+        return ListResponse(MockHttpResponse([{"id": 1000 + x["number"]} for x in items], 200))
+
+
+class ProjectExpense(BulkModel):
+    def create_bulk(self, project_id, items):
+        assert project_id == 22
+        return self.create(items)
+
+
+class InvoicePayment(BulkModel):
+    def create_bulk(self, items):
+        return self.create(items)
+
+
+class MockMoco(object):
+    def __init__(self):
+        self.client = Moco(auth={"api_key": "api_key", "domain": "domain"})
+        self.ProjectExpense = ProjectExpense(self.client)
+        self.InvoicePayment = InvoicePayment(self.client)
+
+
+def make_items(count, overrides=None):
+    for x in range(count):
+        item = {"number": x, "title": "expense {}".format(x)}
+        item.update((overrides or {}).get(x, {}))
+        yield item
+
+
+class TestBulkWriter(object):
+    def setup(self):
+        self.moco = MockMoco()
+
+    def test_chunks_by_count(self):
+        writer = BulkWriter(self.moco, max_workers=3, chunk_size=10)
+
+        results = writer.write_project_expenses(22, make_items(95))
+
+        assert [x.index for x in results] == list(range(95))
+        assert all(x.ok for x in results)
+        assert [x.data["id"] for x in results] == [1000 + x for x in range(95)]
+        assert sorted(len(x) for x in self.moco.ProjectExpense.chunks) == [5] + [10] * 9
+
+    def test_chunks_by_bytes(self):
+        writer = BulkWriter(self.moco, chunk_size=100, max_chunk_bytes=200)
+
+        writer.write_invoice_payments(make_items(20))
+
+        assert all(len(x) < 20 for x in self.moco.InvoicePayment.chunks)
+        assert sum(len(x) for x in self.moco.InvoicePayment.chunks) == 20
+
+    def test_large_item_own_chunk(self):
+        writer = BulkWriter(self.moco, max_workers=1, max_chunk_bytes=100)
+
+        results = writer.write_invoice_payments(make_items(3, {1: {"description": "x" * 500}}))
+
+        assert all(x.ok for x in results)
+        assert [len(x) for x in self.moco.InvoicePayment.chunks] == [1, 1, 1]
+
+    def test_invalid_items_isolated(self):
+        writer = BulkWriter(self.moco, max_workers=2, chunk_size=8)
+
+        results = writer.write_project_expenses(22, make_items(16, {3: {"title": "invalid"}}))
+
+        assert [x.index for x in results if not x.ok] == [3]
+        assert isinstance(results[3].error, UnprocessableException)
+        assert results[4].data["id"] == 1004
+
+    def test_invalid_items_not_split(self):
+        writer = BulkWriter(self.moco, chunk_size=8, split_invalid=False)
+
+        results = writer.write_project_expenses(22, make_items(16, {3: {"title": "invalid"}}))
+
+        assert [x.index for x in results if not x.ok] == list(range(8))
+
+    def test_server_error_fails_chunk(self):
+        writer = BulkWriter(self.moco, chunk_size=5)
+
+        results = writer.write_invoice_payments(make_items(10, {7: {"title": "error"}}))
+
+        assert [x.status for x in results] == [BulkItemResult.CREATED] * 5 + [BulkItemResult.FAILED] * 5
+        assert len(self.moco.InvoicePayment.chunks) == 2
+
+    def test_unencodable_item(self):
+        writer = BulkWriter(self.moco, chunk_size=5)
+
+        results = writer.write_invoice_payments(make_items(3, {1: {"value": object()}}))
+
+        assert [x.ok for x in results] == [True, False, True]
+        assert results[1].error is not None
+
+    def test_generator_read_lazily(self):
+        read = []
+
+        def items():
+            for item in make_items(1000):
+                read.append(item["number"])
+                yield item
+
+        def progress(chunk_results, done, total):
+            # the writer never reads far ahead of the finished chunks
+            assert total - done <= 2 * 2 * 10 + 10
+
+        writer = BulkWriter(self.moco, max_workers=2, chunk_size=10, progress=progress)
+
+        results = writer.write_invoice_payments(items())
+
+        assert len(results) == 1000
+        assert len(read) == 1000
+
+    def test_keeps_impersonation(self):
+        writer = BulkWriter(self.moco, max_workers=3, chunk_size=10)
+
+        with self.moco.client.impersonation(42):
+            writer.write_project_expenses(22, make_items(95))
+
+        assert len(self.moco.ProjectExpense.impersonated) == 10
+        assert all(x == 42 for x in self.moco.ProjectExpense.impersonated)
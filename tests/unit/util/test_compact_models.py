@@ -0,0 +1,130 @@
+import pickle
+
+import pytest
+
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.objector_models import compact
+from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util.objector import DefaultObjector
+from moco_wrapper.util.response import ListResponse, ObjectResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class TestCompactModels(object):
+    def setup(self):
+        self.activity_data = {
+            "id": 1,
+            "hours": 2.5,
+            "project": {"id": 2, "name": "Project"},
+            "task": {"id": 3, "name": "Task"},
+            "customer": {"id": 4, "name": "Customer"},
+            "user": {"id": 5, "firstname": "Jane", "lastname": "Doe", "unit": {"id": 6, "name": "Unit"}},
+            "not_declared": "value"
+        }
+
+    def test_fields(self):
+        activity = compact.Activity(**self.activity_data)
+
+        assert activity.id == 1
+        assert activity.hours == 2.5
+
+    def test_no_instance_dict(self):
+        activity = compact.Activity(**self.activity_data)
+
+        assert not hasattr(activity, "__dict__")
+
+    def test_nested(self):
+        activity = compact.Activity(**self.activity_data)
+
+        assert isinstance(activity.project, compact.Project)
+        assert isinstance(activity.task, compact.ProjectTask)
+        assert isinstance(activity.customer, compact.Company)
+        assert isinstance(activity.user, compact.User)
+        assert isinstance(activity.user.unit, compact.Unit)
+        assert activity.user.firstname == "Jane"
+
+    def test_nested_list(self):
+        project = compact.Project(id=1, tasks=[{"id": 2}, {"id": 3}])
+
+        assert [x.id for x in project.tasks] == [2, 3]
+        assert all(isinstance(x, compact.ProjectTask) for x in project.tasks)
+
+    def test_nested_list_converted_once(self):
+        project = compact.Project(id=1, tasks=[{"id": 2}, {"id": 3}])
+
+        tasks = project.tasks
+        tasks.append(compact.ProjectTask(id=4))
+
+        assert project.tasks is tasks
+        assert project.tasks[0] is tasks[0]
+        assert [x.id for x in project.tasks] == [2, 3, 4]
+        assert pickle.loads(pickle.dumps(project)).tasks[2].id == 4
+
+    def test_unknown_keys(self):
+        activity = compact.Activity(**self.activity_data)
+
+        assert activity.not_declared == "value"
+        assert activity.to_dict()["not_declared"] == "value"
+
+    def test_missing_attribute(self):
+        activity = compact.Activity(id=1)
+
+        with pytest.raises(AttributeError):
+            activity.description
+
+        with pytest.raises(AttributeError):
+            activity.not_declared
+
+    def test_user_birthday(self):
+        user = compact.User(id=1, bday="1990-01-01")
+
+        assert user.birthday == "1990-01-01"
+
+    def test_pickle(self):
+        activity = pickle.loads(pickle.dumps(compact.Activity(**self.activity_data)))
+
+        assert activity.project.name == "Project"
+        assert activity.not_declared == "value"
+
+    def test_compact_type(self):
+        assert compact.compact_type(om.Activity) is compact.Activity
+        assert compact.compact_type(om.Invoice) is None
+
+
+class TestCompactObjector(object):
+    def setup(self):
+        self.objector = DefaultObjector(compact=True)
+
+    def test_object_response(self):
+        endpoint = Endpoint("activity_get", "/activities/{id}", "GET", om.Activity)
+        response = ObjectResponse(MockHttpResponse({"id": 1, "project": {"id": 2}}, 200))
+
+        converted = self.objector.convert_e(response, endpoint)
+
+        assert isinstance(converted.data, compact.Activity)
+        assert isinstance(converted.data.project, compact.Project)
+
+    def test_list_response(self):
+        endpoint = Endpoint("unit_getlist", "/units", "GET", om.Unit)
+        response = ListResponse(MockHttpResponse([{"id": 1}, {"id": 2}], 200))
+
+        converted = self.objector.convert_e(response, endpoint)
+
+        assert [type(x) for x in converted] == [compact.Unit, compact.Unit]
+
+    def test_fallback_to_regular_model(self):
+        endpoint = Endpoint("invoice_get", "/invoices/{id}", "GET", om.Invoice)
+        response = ObjectResponse(MockHttpResponse({"id": 1}, 200))
+
+        converted = self.objector.convert_e(response, endpoint)
+
+        assert isinstance(converted.data, om.Invoice)
+
+    def test_disabled_by_default(self):
+        endpoint = Endpoint("activity_get", "/activities/{id}", "GET", om.Activity)
+        response = ObjectResponse(MockHttpResponse({"id": 1}, 200))
+
+        converted = DefaultObjector().convert_e(response, endpoint)
+
+        assert isinstance(converted.data, om.Activity)
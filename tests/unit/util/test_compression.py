@@ -0,0 +1,107 @@
+import gzip
+import io
+import json
+
+import requests
+import urllib3
+
+from requests.structures import CaseInsensitiveDict
+
+from moco_wrapper.util.requestor import DefaultRequestor, NoRetryRequestor, TransferStatistics, TransferRecord, \
+    ConnectionPool
+from moco_wrapper.util.requestor.compression import accept_encoding
+from moco_wrapper.util.response import ListResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+def make_response(content: bytes, encoding=None):
+    headers = {"Content-Type": "application/json"}
+    body = content
+
+    if encoding == "gzip":
+        body = gzip.compress(content)
+        headers["Content-Encoding"] = "gzip"
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(headers)
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        preload_content=False,
+        decode_content=True
+    )
+
+    return response, len(body)
+
+
+class TestCompression(object):
+    def setup(self):
+        self.content = json.dumps([{"id": x, "description": "activity"} for x in range(500)]).encode("utf-8")
+
+    def test_accept_encoding(self):
+        value = accept_encoding()
+
+        assert "gzip" in value
+        assert "deflate" in value
+
+    def test_session_header(self):
+        for requestor in (DefaultRequestor(), NoRetryRequestor(), DefaultRequestor(connection_pool=ConnectionPool())):
+            assert requestor.session.headers["Accept-Encoding"] == accept_encoding()
+
+    def test_record_gzip(self):
+        response, body_size = make_response(self.content, "gzip")
+        response.content
+
+        record = TransferRecord.from_response(response)
+
+        assert record.encoding == "gzip"
+        assert record.wire_bytes == body_size
+        assert record.decoded_bytes == len(self.content)
+        assert record.ratio < 0.5
+
+    def test_record_identity(self):
+        response, body_size = make_response(self.content)
+        response.content
+
+        record = TransferRecord.from_response(response)
+
+        assert record.encoding == "identity"
+        assert record.wire_bytes == record.decoded_bytes == len(self.content)
+        assert record.ratio == 1.0
+
+    def test_record_not_consumed(self):
+        response, _ = make_response(self.content, "gzip")
+
+        assert TransferRecord.from_response(response) is None
+
+    def test_statistics(self):
+        statistics = TransferStatistics()
+
+        for encoding in ("gzip", "gzip", None):
+            response, _ = make_response(self.content, encoding)
+            response.content
+            statistics.record(response)
+
+        assert statistics.responses == 3
+        assert statistics.compressed_responses == 2
+        assert statistics.decoded_bytes == 3 * len(self.content)
+        assert statistics.saved_bytes > 0
+        assert statistics.encodings == {"gzip": 2, "identity": 1}
+
+        statistics.reset()
+        assert statistics.responses == 0
+        assert statistics.wire_bytes == 0
+
+    def test_response_transfer(self):
+        http_response, body_size = make_response(self.content, "gzip")
+        response = ListResponse(http_response)
+
+        assert response.transfer.wire_bytes == body_size
+        assert response.transfer.decoded_bytes == len(self.content)
+
+    def test_response_transfer_mock(self):
+        response = ListResponse(MockHttpResponse([{"id": 1}], 200))
+
+        assert response.transfer is None
@@ -0,0 +1,74 @@
+import pickle
+import socket
+
+import pytest
+import requests
+
+from moco_wrapper.util.requestor import ConnectionPool, DefaultRequestor, NoRetryRequestor
+from moco_wrapper.util.requestor.pool import PooledHTTPAdapter
+
+
+class TestConnectionPool(object):
+
+    def test_session_adapter(self):
+        pool = ConnectionPool(pool_connections=2, pool_maxsize=32, pool_block=True)
+        session = pool.create_session()
+
+        adapter = session.get_adapter("https://test.mocoapp.com/api/v1/projects")
+
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert session.get_adapter("http://test.mocoapp.com") is adapter
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert adapter._pool_connections == 2
+
+    def test_tcp_keepalive(self):
+        pool = ConnectionPool(tcp_keepalive_idle_s=30)
+
+        options = pool.socket_options()
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+        adapter = pool.create_adapter()
+        assert adapter.poolmanager.connection_pool_kw["socket_options"] == options
+
+    def test_no_tcp_keepalive(self):
+        options = ConnectionPool(tcp_keepalive=False).socket_options()
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in options
+
+    def test_keep_alive_disabled(self):
+        session = ConnectionPool(keep_alive=False).create_session()
+
+        assert session.headers["Connection"] == "close"
+
+    def test_ssl_context(self):
+        context = object()
+        adapter = ConnectionPool(ssl_context=context).create_adapter()
+
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is context
+
+    def test_adapter_pickle(self):
+        adapter = pickle.loads(pickle.dumps(ConnectionPool(pool_maxsize=20).create_adapter()))
+
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+        assert "socket_options" in adapter.poolmanager.connection_pool_kw
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(pool_maxsize=0)
+
+    def test_requestors(self):
+        pool = ConnectionPool(pool_maxsize=16)
+
+        for requestor in (DefaultRequestor(connection_pool=pool), NoRetryRequestor(connection_pool=pool)):
+            assert requestor.connection_pool is pool
+            assert isinstance(requestor.session.get_adapter("https://test.mocoapp.com"), PooledHTTPAdapter)
+
+    def test_requestor_default_session(self):
+        requestor = DefaultRequestor()
+
+        assert requestor.connection_pool is None
+        assert type(requestor.session.get_adapter("https://test.mocoapp.com")) is requests.adapters.HTTPAdapter
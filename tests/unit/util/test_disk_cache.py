@@ -0,0 +1,243 @@
+import json
+import os
+import stat
+import time
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from moco_wrapper.util.requestor import DiskCacheRequestor, DefaultRequestor
+from moco_wrapper.util.response import ListResponse, PagedListResponse, ObjectResponse, EmptyResponse
+
+
+def make_response(status_code, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    response.url = "https://example.org/projects"
+    return response
+
+
+class ConditionalSession(object):
+    """
+    Session that answers like the api, with 304 if the validators of the request match the resource
+    """
+
+    def __init__(self, body, etag='"v1"', last_modified=None, headers=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.extra_headers = headers or {}
+        self.requests = []
+
+    def request(self, method, path, params=None, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append((method, path, params, dict(headers)))
+
+        validators = {}
+        if self.etag is not None:
+            validators["ETag"] = self.etag
+        if self.last_modified is not None:
+            validators["Last-Modified"] = self.last_modified
+
+        if method == "POST":
+            return make_response(200, b'{"id": 2}', {"Content-Type": "application/json"})
+
+        not_modified = (
+            (self.etag is not None and headers.get("If-None-Match") == self.etag) or
+            (self.etag is None and self.last_modified is not None and
+             headers.get("If-Modified-Since") == self.last_modified)
+        )
+        if not_modified:
+            return make_response(304, b"", dict(validators, Date="Thu, 01 Oct 2020 10:00:00 GMT"))
+
+        response_headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        response_headers.update(validators)
+        response_headers.update(self.extra_headers)
+        return make_response(200, self.body, response_headers)
+
+
+class TestDiskCacheRequestor(object):
+    def setup(self):
+        self.body = json.dumps([{"id": 1, "name": "Project"}]).encode("utf-8")
+        self.headers = {"Authorization": "Token token=a", "Content-Type": "application/json"}
+
+    def create(self, tmp_path, session, **kwargs):
+        requestor = DiskCacheRequestor(str(tmp_path / "cache"), **kwargs)
+        requestor._session = session
+        return requestor
+
+    def test_revalidated_with_etag(self, tmp_path):
+        session = ConditionalSession(self.body)
+
+        first = self.create(tmp_path, session).get("https://example.org/projects", headers=self.headers)
+
+        # a new requestor, like the next run of a cron job
+        requestor = self.create(tmp_path, session)
+        second = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert isinstance(first, ListResponse)
+        assert isinstance(second, ListResponse)
+        assert second.data == first.data
+        assert second.response.from_disk_cache
+        assert "If-None-Match" not in session.requests[0][3]
+        assert session.requests[1][3]["If-None-Match"] == '"v1"'
+        assert requestor.cache_statistics.revalidated == 1
+
+    def test_revalidated_with_last_modified(self, tmp_path):
+        session = ConditionalSession(self.body, etag=None, last_modified="Wed, 30 Sep 2020 10:00:00 GMT")
+        requestor = self.create(tmp_path, session)
+
+        requestor.get("https://example.org/projects", headers=self.headers)
+        response = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert session.requests[1][3]["If-Modified-Since"] == "Wed, 30 Sep 2020 10:00:00 GMT"
+        assert response.response.from_disk_cache
+        assert response.data == [{"id": 1, "name": "Project"}]
+
+    def test_changed_resource(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session)
+        requestor.get("https://example.org/projects", headers=self.headers)
+
+        session.etag = '"v2"'
+        session.body = json.dumps([{"id": 3}]).encode("utf-8")
+
+        changed = requestor.get("https://example.org/projects", headers=self.headers)
+        revalidated = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert changed.data == [{"id": 3}]
+        assert not hasattr(changed.response, "from_disk_cache")
+        assert revalidated.data == [{"id": 3}]
+        assert session.requests[2][3]["If-None-Match"] == '"v2"'
+
+    def test_key_by_user_and_params(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session)
+
+        requestor.get("https://example.org/projects", headers=self.headers)
+        requestor.get("https://example.org/projects", headers=dict(self.headers, Authorization="Token token=b"))
+        requestor.get("https://example.org/projects", headers=dict(self.headers, **{"X-IMPERSONATE-USER-ID": "5"}))
+        requestor.get("https://example.org/projects", params={"page": 2}, headers=self.headers)
+
+        assert all("If-None-Match" not in x[3] for x in session.requests)
+        assert len(os.listdir(requestor.cache_dir)) == 4
+
+    def test_paged_headers_kept(self, tmp_path):
+        session = ConditionalSession(self.body, headers={"X-Page": "1", "X-Total": "1"})
+        requestor = self.create(tmp_path, session)
+
+        requestor.get("https://example.org/projects", headers=self.headers)
+        response = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert isinstance(response, PagedListResponse)
+        assert response.response.headers["Date"] == "Thu, 01 Oct 2020 10:00:00 GMT"
+        assert "Content-Encoding" not in response.response.headers
+
+    def test_without_validators_not_stored(self, tmp_path):
+        session = ConditionalSession(self.body, etag=None)
+        requestor = self.create(tmp_path, session)
+
+        requestor.get("https://example.org/projects", headers=self.headers)
+        requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert os.listdir(requestor.cache_dir) == []
+        assert requestor.cache_statistics.missed == 2
+
+    def test_writes_not_cached(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session)
+
+        response = requestor.post("https://example.org/projects", data={"name": "Project"}, headers=self.headers)
+
+        assert isinstance(response, ObjectResponse)
+        assert os.listdir(requestor.cache_dir) == []
+
+    def test_removed_entry(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session)
+        requestor.get("https://example.org/projects", headers=self.headers)
+
+        entry_path = requestor.entry_path("https://example.org/projects", None, self.headers)
+        meta = requestor._load_meta(entry_path)
+        requestor.clear()
+
+        # the entry disappears between reading the validators and the 304 answer
+        requestor._load_meta = lambda path: meta
+        response = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert response.data == [{"id": 1, "name": "Project"}]
+        assert "If-None-Match" not in session.requests[-1][3]
+
+    def test_entry_permissions(self, tmp_path):
+        requestor = self.create(tmp_path, ConditionalSession(self.body))
+        requestor.get("https://example.org/projects", headers=self.headers)
+
+        entry_path = requestor.entry_path("https://example.org/projects", None, self.headers)
+
+        assert stat.S_IMODE(os.stat(entry_path).st_mode) == 0o600
+        assert not [x for x in os.listdir(requestor.cache_dir) if x.endswith(".part")]
+
+    def test_not_modified_without_cache(self):
+        requestor = DefaultRequestor()
+
+        assert isinstance(requestor._create_response(make_response(304)), EmptyResponse)
+
+    def age(self, requestor, path, seconds, params=None):
+        entry_path = requestor.entry_path(path, params, self.headers)
+        mtime = time.time() - seconds
+        os.utime(entry_path, (mtime, mtime))
+        return entry_path
+
+    def test_expired_entry_not_used(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session, max_age_s=3600)
+        requestor.get("https://example.org/projects", headers=self.headers)
+        self.age(requestor, "https://example.org/projects", 7200)
+
+        response = requestor.get("https://example.org/projects", headers=self.headers)
+
+        assert "If-None-Match" not in session.requests[1][3]
+        assert not hasattr(response.response, "from_disk_cache")
+
+    def test_prune_by_age(self, tmp_path):
+        requestor = self.create(tmp_path, ConditionalSession(self.body), max_age_s=3600)
+
+        for page in (1, 2, 3):
+            requestor.get("https://example.org/projects", params={"page": page}, headers=self.headers)
+
+        self.age(requestor, "https://example.org/projects", 7200, params={"page": 1})
+
+        assert requestor.prune() == 1
+        assert len(os.listdir(requestor.cache_dir)) == 2
+        assert requestor.prune(max_age_s=0) == 2
+
+    def test_prune_by_size(self, tmp_path):
+        session = ConditionalSession(self.body)
+        requestor = self.create(tmp_path, session, max_bytes=None)
+
+        for page in (1, 2, 3):
+            requestor.get("https://example.org/projects", params={"page": page}, headers=self.headers)
+            self.age(requestor, "https://example.org/projects", 100 - page, params={"page": page})
+
+        # revalidating page 1 makes it the most recently used entry
+        requestor.get("https://example.org/projects", params={"page": 1}, headers=self.headers)
+        kept_size = sum(
+            os.path.getsize(requestor.entry_path("https://example.org/projects", {"page": x}, self.headers))
+            for x in (1, 3)
+        )
+
+        assert requestor.prune(max_bytes=kept_size) == 1
+        assert not os.path.exists(requestor.entry_path("https://example.org/projects", {"page": 2}, self.headers))
+        assert os.path.exists(requestor.entry_path("https://example.org/projects", {"page": 1}, self.headers))
+
+    def test_size_limit_enforced_on_store(self, tmp_path):
+        requestor = self.create(tmp_path, ConditionalSession(self.body), max_bytes=1000)
+
+        for page in range(20):
+            requestor.get("https://example.org/projects", params={"page": page}, headers=self.headers)
+
+        assert sum(os.path.getsize(os.path.join(requestor.cache_dir, x)) for x in os.listdir(requestor.cache_dir)) \
+            <= 1000
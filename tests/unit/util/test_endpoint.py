@@ -1,4 +1,6 @@
-from moco_wrapper.util.endpoint import Endpoint
+import pytest
+
+from moco_wrapper.util.endpoint import Endpoint, EndpointManager
 
 class MockObjectorModel(object):
     def __init__(self):
@@ -30,3 +32,29 @@ class TestEndpoint(object):
         e = Endpoint("test-slug", "test/template", "GET")
 
         assert e.type is None
+
+    def test_url_fields(self):
+        e = Endpoint("test-slug", "/ba/{id}/ha/{value}", "GET")
+
+        assert e.url_fields == ("id", "value")
+
+    def test_url_template_static(self):
+        e = Endpoint("test-slug", "/projects", "GET")
+
+        assert e.url_fields == ()
+        assert e.url_format({"id": 1}) == "/projects"
+
+
+class TestEndpointManager(object):
+
+    def test_get(self):
+        manager = EndpointManager()
+
+        assert manager.get("activity_get").url_template == "/activities/{id}"
+        assert manager.get("this_slug_does_not_exist") is None
+
+    def test_map_read_only(self):
+        manager = EndpointManager.shared()
+
+        with pytest.raises(TypeError):
+            manager.map["activity_get"] = None
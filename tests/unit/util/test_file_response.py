@@ -0,0 +1,120 @@
+import io
+
+import pytest
+import requests
+import urllib3
+
+from requests.structures import CaseInsensitiveDict
+
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import FileResponse
+
+
+class ReadCountingBody(io.BytesIO):
+    def __init__(self, content):
+        super(ReadCountingBody, self).__init__(content)
+        self.max_read = 0
+
+    def read(self, size=-1):
+        chunk = super(ReadCountingBody, self).read(size)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+def make_stream_response(content):
+    headers = {"Content-Type": "application/pdf"}
+    body = ReadCountingBody(content)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(headers)
+    response.raw = urllib3.HTTPResponse(body=body, headers=headers, preload_content=False)
+
+    return response, body
+
+
+def make_buffered_response(content):
+    response, _ = make_stream_response(content)
+    response.content  # read like a request that was sent without stream=True
+
+    return response
+
+
+class TestFileResponse(object):
+    def setup(self):
+        self.content = bytes(range(256)) * 1024
+
+    def test_created_without_reading(self):
+        response, body = make_stream_response(self.content)
+
+        file_response = BaseRequestor()._create_response(response)
+
+        assert isinstance(file_response, FileResponse)
+        assert body.tell() == 0
+
+    def test_pdf_content_type_parameters(self):
+        response, _ = make_stream_response(self.content)
+        response.headers["Content-Type"] = "application/pdf; charset=binary"
+
+        assert isinstance(BaseRequestor()._create_response(response), FileResponse)
+
+    def test_write_to_file_streamed(self, tmp_path):
+        response, body = make_stream_response(self.content)
+        target = tmp_path / "invoice.pdf"
+
+        written = FileResponse(response).write_to_file(str(target), chunk_size=4096)
+
+        assert written == len(self.content)
+        assert target.read_bytes() == self.content
+        assert body.max_read <= 4096
+
+    def test_write_to_file_object(self):
+        response, _ = make_stream_response(self.content)
+        target = io.BytesIO()
+
+        FileResponse(response).write_to_file(target)
+
+        assert target.getvalue() == self.content
+
+    def test_data(self):
+        response, _ = make_stream_response(self.content)
+        file_response = FileResponse(response)
+
+        assert file_response.data == self.content
+        assert file_response.file is file_response.data
+
+    def test_write_to_file_after_data(self, tmp_path):
+        response, _ = make_stream_response(self.content)
+        file_response = FileResponse(response)
+        file_response.data
+        target = tmp_path / "offer.pdf"
+
+        file_response.write_to_file(str(target), chunk_size=1000)
+
+        assert target.read_bytes() == self.content
+
+    def test_buffered_written_twice(self, tmp_path):
+        file_response = FileResponse(make_buffered_response(self.content))
+        first, second = tmp_path / "first.pdf", tmp_path / "second.pdf"
+
+        file_response.write_to_file(str(first))
+        file_response.write_to_file(str(second))
+
+        assert first.read_bytes() == self.content
+        assert second.read_bytes() == self.content
+        assert file_response.data == self.content
+
+    def test_streamed_written_twice(self, tmp_path):
+        response, _ = make_stream_response(self.content)
+        file_response = FileResponse(response)
+        target = tmp_path / "invoice.pdf"
+        file_response.write_to_file(str(target))
+
+        with pytest.raises(RuntimeError):
+            file_response.write_to_file(str(target))
+
+        with pytest.raises(RuntimeError):
+            file_response.data
+
+        # the existing file is not truncated by the failed second write
+        assert target.read_bytes() == self.content
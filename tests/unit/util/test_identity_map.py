@@ -0,0 +1,102 @@
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.objector_models import compact
+from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util.objector import DefaultObjector, IdentityMap
+from moco_wrapper.util.response import ListResponse, ObjectResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class TestIdentityMap(object):
+    def setup(self):
+        self.endpoint = Endpoint("activity_getlist", "/activities", "GET", om.Activity)
+        self.items = [
+            {
+                "id": x,
+                "project": {"id": 10 + (x % 2), "name": "Project"},
+                "user": {"id": 20, "firstname": "John", "lastname": "Doe"}
+            }
+            for x in range(4)
+        ]
+
+    def convert(self, objector):
+        response = ListResponse(MockHttpResponse(self.items, 200))
+        return objector.convert_e(response, self.endpoint).data
+
+    def test_regular_models_shared(self):
+        activities = self.convert(DefaultObjector(identity_map=True))
+
+        assert activities[0].project is activities[2].project
+        assert activities[1].project is activities[3].project
+        assert activities[0].project is not activities[1].project
+        assert all(x.user is activities[0].user for x in activities)
+
+    def test_compact_models_shared(self):
+        activities = self.convert(DefaultObjector(compact=True, identity_map=True))
+
+        assert isinstance(activities[0].project, compact.Project)
+        assert activities[0].project is activities[2].project
+        assert activities[0].project is not activities[1].project
+        assert all(x.user is activities[0].user for x in activities)
+
+    def test_compact_lazy_models_shared(self):
+        activities = self.convert(DefaultObjector(compact=True, lazy=True, identity_map=True))
+
+        assert activities[3].user is activities[0].user
+        assert activities.converted_count == 2
+
+    def test_not_shared_by_default(self):
+        activities = self.convert(DefaultObjector())
+
+        assert activities[0].project is not activities[2].project
+
+    def test_new_map_per_response(self):
+        objector = DefaultObjector(identity_map=True)
+
+        first = self.convert(objector)
+        second = self.convert(objector)
+
+        assert first[0].user is not second[0].user
+
+    def test_session_map(self):
+        identity_map = IdentityMap()
+        objector = DefaultObjector(compact=True, identity_map=identity_map)
+
+        first = self.convert(objector)
+        second = self.convert(objector)
+
+        assert first[0].user is second[0].user
+        assert len(identity_map) == 3
+
+    def test_session_map_releases_objects(self):
+        identity_map = IdentityMap()
+        objector = DefaultObjector(identity_map=identity_map)
+
+        activities = self.convert(objector)
+        assert len(identity_map) == 3
+
+        del activities
+        assert len(identity_map) == 0
+
+    def test_object_response(self):
+        identity_map = IdentityMap()
+        objector = DefaultObjector(identity_map=identity_map)
+        endpoint = Endpoint("activity_get", "/activities/{id}", "GET", om.Activity)
+
+        activities = self.convert(objector)
+        response = ObjectResponse(MockHttpResponse(self.items[0], 200))
+        activity = objector.convert_e(response, endpoint).data
+
+        assert activity.project is activities[0].project
+
+    def test_different_representations_not_shared(self):
+        self.items[2]["project"] = {"id": 10, "name": "P-renamed", "identifier": "P-1"}
+
+        for objector in (DefaultObjector(identity_map=True), DefaultObjector(compact=True, identity_map=True)):
+            activities = self.convert(objector)
+
+            assert activities[0].project.name == "Project"
+            assert activities[2].project.name == "P-renamed"
+            assert activities[2].project.identifier == "P-1"
+            assert activities[0].project is not activities[2].project
+            assert activities[1].project is activities[3].project
@@ -0,0 +1,56 @@
+import pytest
+
+from moco_wrapper.util import json_codec
+from moco_wrapper.util.requestor import NoRetryRequestor
+
+from ..mocks.http import FakeSession
+
+
+class TestJsonCodec(object):
+
+    def test_stdlib_roundtrip(self):
+        codec = json_codec.JsonCodec()
+        data = {"name": "Äpfel", "items": [1, 2.5, None, True]}
+
+        assert isinstance(codec.dumps(data), bytes)
+        assert codec.loads(codec.dumps(data)) == data
+
+    def test_stdlib_invalid(self):
+        with pytest.raises(ValueError):
+            json_codec.JsonCodec().loads(b"not json")
+
+    def test_default_codec(self):
+        codec = json_codec.default_codec()
+
+        assert isinstance(codec, json_codec.JsonCodec)
+        assert codec is json_codec.default_codec()
+
+    def test_orjson_fallback(self):
+        pytest.importorskip("orjson")
+        codec = json_codec.OrjsonCodec()
+
+        assert codec.loads(codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+        assert codec.dumps({1: 1}) == b'{"1": 1}'
+
+    def test_orjson_invalid(self):
+        pytest.importorskip("orjson")
+
+        with pytest.raises(ValueError):
+            json_codec.OrjsonCodec().loads(b"not json")
+
+    def test_requestor_encodes_body(self):
+        requestor = NoRetryRequestor(json_codec=json_codec.JsonCodec())
+        requestor._session = FakeSession()
+
+        requestor._send("POST", "https://example.org", data={"a": 1}, headers={"X-Test": "1"})
+
+        assert requestor._session.kwargs["data"] == b'{"a": 1}'
+        assert requestor._session.kwargs["headers"] == {"X-Test": "1", "Content-Type": "application/json"}
+
+    def test_requestor_no_body(self):
+        requestor = NoRetryRequestor()
+        requestor._session = FakeSession()
+
+        requestor._send("GET", "https://example.org")
+
+        assert "data" not in requestor._session.kwargs
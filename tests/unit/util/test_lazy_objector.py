@@ -0,0 +1,123 @@
+import copy
+import pickle
+import threading
+import time
+
+import pytest
+
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.objector_models import compact
+from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util.objector import DefaultObjector, LazyList
+from moco_wrapper.util.response import ListResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class CountingModel(object):
+    created = 0
+
+    def __init__(self, **kwargs):
+        CountingModel.created += 1
+        self.__dict__.update(kwargs)
+
+
+class TestLazyList(object):
+    def setup(self):
+        CountingModel.created = 0
+        self.items = LazyList([{"id": x} for x in range(5)], CountingModel)
+
+    def test_not_converted_on_creation(self):
+        assert len(self.items) == 5
+        assert CountingModel.created == 0
+
+    def test_converted_on_access(self):
+        assert self.items[2].id == 2
+        assert self.items[-1].id == 4
+        assert CountingModel.created == 2
+        assert self.items.converted_count == 2
+
+    def test_converted_once(self):
+        first = self.items[0]
+
+        assert self.items[0] is first
+        assert CountingModel.created == 1
+
+    def test_converted_once_by_threads(self):
+        class SlowModel(CountingModel):
+            def __init__(self, **kwargs):
+                # keeps the other threads waiting while the item is converted
+                time.sleep(0.01)
+                super(SlowModel, self).__init__(**kwargs)
+
+        items = LazyList([{"id": 1}], SlowModel)
+        results, errors = [], []
+
+        def access():
+            try:
+                results.append(items[0])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert CountingModel.created == 1
+        assert all(x is results[0] for x in results)
+
+    def test_pickle_and_copy(self):
+        assert self.items[1].id == 1
+
+        for items in (pickle.loads(pickle.dumps(self.items)), copy.deepcopy(self.items)):
+            assert items.converted_count == 1
+            assert [x.id for x in items] == list(range(5))
+
+    def test_iterate(self):
+        assert [x.id for x in self.items] == [0, 1, 2, 3, 4]
+        assert CountingModel.created == 5
+
+    def test_slice(self):
+        assert [x.id for x in self.items[1:3]] == [1, 2]
+        assert CountingModel.created == 2
+
+    def test_index_error(self):
+        with pytest.raises(IndexError):
+            self.items[5]
+
+
+class TestLazyObjector(object):
+    def setup(self):
+        self.endpoint = Endpoint("activity_getlist", "/activities", "GET", om.Activity)
+        self.items = [{"id": x, "project": {"id": 10, "name": "Project"}} for x in range(3)]
+
+    def test_list_response_lazy(self):
+        response = ListResponse(MockHttpResponse(self.items, 200))
+
+        converted = DefaultObjector(lazy=True).convert_e(response, self.endpoint)
+
+        assert isinstance(converted.data, LazyList)
+        assert converted.data.converted_count == 0
+        assert isinstance(converted[1], om.Activity)
+        assert converted.data.converted_count == 1
+
+    def test_compact_nested_converted_on_access(self):
+        response = ListResponse(MockHttpResponse(self.items, 200))
+
+        converted = DefaultObjector(compact=True, lazy=True).convert_e(response, self.endpoint)
+        activity = converted[0]
+        project_slot = compact.Activity.__dict__["project"].member
+
+        assert isinstance(project_slot.__get__(activity), dict)
+        assert isinstance(activity.project, compact.Project)
+        assert project_slot.__get__(activity) is activity.project
+
+    def test_not_lazy_by_default(self):
+        response = ListResponse(MockHttpResponse(self.items, 200))
+
+        converted = DefaultObjector().convert_e(response, self.endpoint)
+
+        assert isinstance(converted.data, list)
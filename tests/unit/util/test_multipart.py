@@ -0,0 +1,174 @@
+import email
+import os
+import tempfile
+
+from base64 import b64encode
+
+import requests
+
+from moco_wrapper.util.io import File, MultipartStream
+from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+
+from ..mocks.http import FakeHttpResponse
+
+
+class ReadingSession(object):
+    """
+    Session that reads the body of every request, like the http connection would
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.bodies = []
+        self.headers = []
+
+    def request(self, method, path, data=None, headers=None, **kwargs):
+        self.bodies.append(data.read(100) + data.read())
+        self.headers.append(headers)
+        return self.responses.pop(0)
+
+
+class TestMultipartStream(object):
+    def setup(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.content = os.urandom(100 * 1024 + 7)
+        self.path = os.path.join(self.tmp_dir.name, "receipt.pdf")
+
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+
+    def teardown(self):
+        self.tmp_dir.cleanup()
+
+    def parse(self, stream, body):
+        message = email.message_from_bytes(
+            "Content-Type: {}\r\n\r\n".format(stream.content_type).encode("utf-8") + body
+        )
+        return {x.get_param("name", header="Content-Disposition"): x for x in message.get_payload()}
+
+    def test_body(self):
+        stream = MultipartStream({"file": File(self.path)}, fields={"title": "Receipt"})
+        body = stream.read()
+
+        parts = self.parse(stream, body)
+
+        assert parts["file"].get_filename() == "receipt.pdf"
+        assert parts["file"].get_content_type() == "application/pdf"
+        assert parts["file"].get_payload(decode=True) == self.content
+        assert parts["title"].get_payload() == "Receipt"
+
+    def test_length(self):
+        stream = MultipartStream({"file": File(self.path)})
+
+        assert len(stream) == len(stream.read())
+
+    def test_bounded_reads(self):
+        stream = MultipartStream({"file": File(self.path)})
+
+        chunks = list(iter(lambda: stream.read(8192), b""))
+
+        assert max(len(x) for x in chunks) == 8192
+        assert b"".join(chunks) == MultipartStream({"file": File(self.path)}, boundary=stream.boundary).read()
+
+    def test_file_closed_after_read(self):
+        stream = MultipartStream({"file": File(self.path)})
+
+        stream.read(1024)
+        assert stream._file is not None and not stream._file.closed
+
+        stream.read()
+        assert stream._file is None
+
+    def test_close(self):
+        stream = MultipartStream({"file": File(self.path)})
+        stream.read(1024)
+        opened_file = stream._file
+
+        with stream:
+            pass
+
+        assert opened_file.closed
+        assert stream.closed
+
+    def test_rewind(self):
+        stream = MultipartStream({"file": File(self.path)})
+        first = stream.read()
+
+        stream.seek(0)
+
+        assert stream.tell() == 0
+        assert stream.read() == first
+
+    def test_prepared_request_content_length(self):
+        stream = MultipartStream({"file": File(self.path)})
+
+        request = requests.Request("PATCH", "https://example.org", data=stream).prepare()
+
+        assert request.headers["Content-Length"] == str(len(stream))
+        assert request.body is stream
+
+    def test_requestor_sends_raw_body(self):
+        stream = MultipartStream({"file": File(self.path)})
+        requestor = DefaultRequestor()
+        requestor._session = ReadingSession([FakeHttpResponse(204)])
+
+        requestor.request("PATCH", "https://example.org", data=stream, headers={"Content-Type": stream.content_type})
+
+        assert requestor._session.headers[0]["Content-Type"] == stream.content_type
+        assert self.parse(stream, requestor._session.bodies[0])["file"].get_payload(decode=True) == self.content
+
+    def test_requestor_closes_file(self):
+        stream = MultipartStream({"file": File(self.path)})
+        requestor = DefaultRequestor()
+
+        class FailingSession(object):
+            def request(self, method, path, data=None, **kwargs):
+                data.read(1024)
+                raise requests.ConnectionError("connection lost")
+
+        requestor._session = FailingSession()
+
+        try:
+            requestor.request("PATCH", "https://example.org", data=stream)
+        except requests.ConnectionError:
+            pass
+
+        assert stream._file is None
+
+    def test_requestor_rewinds_on_retry(self):
+        stream = MultipartStream({"file": File(self.path)})
+        requestor = DefaultRequestor(retry_policy=RetryPolicy(jitter=False, sleep=lambda x: None))
+        requestor._session = ReadingSession([FakeHttpResponse(429, "too many requests"), FakeHttpResponse(204)])
+
+        requestor.request("PATCH", "https://example.org", data=stream)
+
+        assert len(requestor._session.bodies) == 2
+        assert requestor._session.bodies[0] == requestor._session.bodies[1]
+        assert len(requestor._session.bodies[1]) == len(stream)
+
+
+class TestFileBase64(object):
+    def setup(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.content = os.urandom(10000)
+        self.path = os.path.join(self.tmp_dir.name, "receipt.pdf")
+
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+
+    def teardown(self):
+        self.tmp_dir.cleanup()
+
+    def test_name(self):
+        assert File(self.path).name == "receipt.pdf"
+        assert File(self.path, "other.pdf").name == "other.pdf"
+
+    def test_to_base64(self):
+        assert File(self.path).to_base64() == b64encode(self.content).decode("utf-8")
+
+    def test_iter_base64(self):
+        for chunk_size in (1, 3, 1000, 1024, 20000):
+            chunks = list(File(self.path).iter_base64(chunk_size))
+
+            assert "".join(chunks) == b64encode(self.content).decode("utf-8")
+            assert all("=" not in x for x in chunks[:-1])
@@ -0,0 +1,175 @@
+import asyncio
+import gc
+import warnings
+
+import pytest
+
+from moco_wrapper import Moco, AsyncMoco
+from moco_wrapper.util import pagination
+from moco_wrapper.util.response import PagedListResponse, ListResponse
+
+from ..mocks.http import MockHttpResponse
+from ..mocks.requestor import HeaderRecordingRequestor
+
+
+class MockListMethod(object):
+    """
+    Listing method that returns 10 items per page
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def __call__(self, some_arg, page=1):
+        self.calls.append((some_arg, page))
+
+        items = list(range((page - 1) * 10, min(page * 10, self.total)))
+        headers = {
+            "X-Page": str(page),
+            "x-page": str(page),
+            "x-total": str(self.total),
+            "x-per-page": "10",
+        }
+
+        if page * 10 < self.total:
+            headers["Link"] = '<https://x/api/v1/y?page={}>; rel="next", <https://x/api/v1/y>; rel="last"'.format(
+                page + 1)
+
+        return PagedListResponse(MockHttpResponse(items, 200, headers))
+
+
+class TestPagination(object):
+
+    def test_iter_items(self):
+        method = MockListMethod(35)
+
+        assert list(pagination.iter_items(method, "arg")) == list(range(35))
+        assert method.calls == [("arg", 1), ("arg", 2), ("arg", 3), ("arg", 4)]
+
+    def test_iter_items_start_page(self):
+        method = MockListMethod(35)
+
+        assert list(pagination.iter_items(method, "arg", page=3)) == list(range(20, 35))
+
+    def test_iter_pages_is_lazy(self):
+        method = MockListMethod(35)
+
+        pages = pagination.iter_pages(method, "arg")
+        first = next(pages)
+
+        assert first.current_page == 1
+        assert len(method.calls) == 1
+
+    def test_iter_unpaged_list(self):
+        def list_method():
+            return ListResponse(MockHttpResponse([1, 2, 3], 200))
+
+        assert list(pagination.iter_items(list_method)) == [1, 2, 3]
+
+    def test_fetch_all(self):
+        method = MockListMethod(95)
+
+        assert pagination.fetch_all(method, "arg", max_workers=3) == list(range(95))
+        assert sorted(method.calls) == [("arg", x) for x in range(1, 11)]
+
+    def test_fetch_all_single_page(self):
+        method = MockListMethod(5)
+
+        assert pagination.fetch_all(method, "arg") == list(range(5))
+        assert method.calls == [("arg", 1)]
+
+    def test_fetch_all_ignores_page(self):
+        method = MockListMethod(15)
+
+        assert pagination.fetch_all(method, "arg", page=2) == list(range(15))
+
+    def test_fetch_all_unpaged_list(self):
+        def list_method():
+            return ListResponse(MockHttpResponse([1, 2, 3], 200))
+
+        assert pagination.fetch_all(list_method) == [1, 2, 3]
+
+    def test_fetch_all_keeps_impersonation(self):
+        requestor = HeaderRecordingRequestor()
+        m = Moco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=requestor
+        )
+
+        with m.impersonation(42):
+            projects = m.Project.fetch_all()
+
+        assert [x.id for x in projects] == [1, 2, 3]
+        assert sorted(requestor.headers.keys()) == [1, 2, 3]
+        assert all(x.get("X-IMPERSONATE-USER-ID") == "42" for x in requestor.headers.values())
+
+    def test_iter_async_client(self):
+        m = AsyncMoco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=HeaderRecordingRequestor()
+        )
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+
+            with pytest.raises(TypeError):
+                list(m.Project.iter())
+
+            gc.collect()
+
+        assert not [x for x in caught if "never awaited" in str(x.message)]
+
+    def test_aiter(self):
+        m = AsyncMoco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=HeaderRecordingRequestor()
+        )
+
+        async def collect():
+            return [x.id async for x in m.Project.aiter()]
+
+        assert asyncio.run(collect()) == [1, 2, 3]
+
+    def test_fetch_all_async_client(self):
+        m = AsyncMoco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=HeaderRecordingRequestor()
+        )
+
+        with pytest.raises(TypeError):
+            m.Project.fetch_all()
+
+    def test_afetch_all(self):
+        requestor = HeaderRecordingRequestor()
+        m = AsyncMoco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=requestor
+        )
+
+        async def fetch():
+            with m.impersonation(42):
+                return await m.Project.afetch_all(max_workers=2)
+
+        assert [x.id for x in asyncio.run(fetch())] == [1, 2, 3]
+        assert all(x.get("X-IMPERSONATE-USER-ID") == "42" for x in requestor.headers.values())
+
+    def test_iter_without_getlist(self):
+        m = Moco(auth={"api_key": "api_key", "domain": "domain"}, requestor=HeaderRecordingRequestor())
+
+        for model in (m.Session, m.Report, m.Tagging, m.AccountHourlyRate):
+            with pytest.raises(TypeError, match="getlist"):
+                model.iter()
+
+            with pytest.raises(TypeError, match="getlist"):
+                model.aiter()
+
+    def test_fetch_all_without_getlist(self):
+        m = Moco(auth={"api_key": "api_key", "domain": "domain"}, requestor=HeaderRecordingRequestor())
+
+        for model in (m.Session, m.Report, m.Tagging, m.AccountInternalHourlyRate):
+            with pytest.raises(TypeError, match="getlist"):
+                model.fetch_all()
+
+            with pytest.raises(TypeError, match="getlist"):
+                model.afetch_all()
@@ -0,0 +1,63 @@
+from moco_wrapper.util.requestor import RateLimiter, NoRetryRequestor
+
+from ..mocks.clock import FakeClock
+from ..mocks.http import FakeHttpResponse, FakeSession
+
+
+class TestRateLimiter(object):
+    def setup(self):
+        self.clock = FakeClock(100.0)
+        self.limiter = RateLimiter(requests=10, period=10, burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_without_waiting(self):
+        assert self.limiter.acquire() == 0
+        assert self.limiter.acquire() == 0
+        assert self.clock.slept == []
+
+    def test_waits_when_empty(self):
+        self.limiter.acquire()
+        self.limiter.acquire()
+
+        assert self.limiter.acquire() == 1.0
+        assert self.clock.slept == [1.0]
+
+    def test_refill(self):
+        self.limiter.acquire()
+        self.limiter.acquire()
+
+        self.clock.now += 5
+
+        assert self.limiter.tokens == 2
+        assert self.limiter.acquire() == 0
+
+    def test_update_remaining(self):
+        self.limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+
+        assert self.limiter.acquire() == 31.0
+
+    def test_update_without_headers(self):
+        self.limiter.update({})
+
+        assert self.limiter.tokens == 2
+
+    def test_block(self):
+        self.limiter.block(5)
+
+        assert self.limiter.acquire() == 5.0
+
+    def test_invalid_budget(self):
+        try:
+            RateLimiter(requests=0)
+            assert False
+        except ValueError:
+            pass
+
+    def test_requestor_uses_limiter(self):
+        requestor = NoRetryRequestor(rate_limiter=self.limiter)
+        requestor._session = FakeSession([
+            FakeHttpResponse(200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "10"})
+        ])
+
+        requestor._send("GET", "https://example.org")
+
+        assert self.limiter.acquire() == 11.0
@@ -0,0 +1,164 @@
+import asyncio
+
+from moco_wrapper import Moco, AsyncMoco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.cache import ResponseCache, resource_family
+from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util.response import ObjectResponse
+
+from ..mocks.clock import FakeClock
+from ..mocks.http import MockHttpResponse, MockHttpErrorResponse
+from ..mocks.requestor import CountingRequestor
+
+
+class TestResponseCache(object):
+    def setup(self):
+        self.requestor = CountingRequestor()
+        self.clock = FakeClock()
+        self.cache = ResponseCache(clock=self.clock)
+        self.moco = Moco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=self.requestor,
+            response_cache=self.cache
+        )
+
+    def test_resource_family(self):
+        assert resource_family("/projects/{id}/tasks") == "projects"
+        assert resource_family("/units") == "units"
+        assert resource_family("/account/hourly_rates?page=2") == "account"
+
+    def test_endpoint_ttl(self):
+        assert Endpoint("unit_getlist", "/units", "GET", cache_ttl=60).cache_ttl == 60
+        assert Endpoint("project_getlist", "/projects", "GET").cache_ttl is None
+        assert self.moco.bind("unit_getlist").cache_ttl == 3600
+        assert self.moco.bind("unit_getlist").resource == "units"
+
+    def test_cached_read(self):
+        first = self.moco.Unit.getlist()
+        second = self.moco.Unit.getlist()
+
+        assert len(self.requestor.calls) == 1
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+        assert isinstance(second.data[0], om.Unit)
+        assert first is not second
+        assert first.data[0] is not second.data[0]
+
+    def test_nested_data_not_shared(self):
+        first = self.moco.User.get(1)
+        first.data.custom_properties["Department"] = "Changed"
+        first.data.tags.append("b")
+
+        second = self.moco.User.get(1)
+        second.data.tags.append("c")
+
+        third = self.moco.User.get(1)
+
+        assert len(self.requestor.calls) == 1
+        assert third.data.custom_properties == {"Department": "Sales"}
+        assert third.data.tags == ["a"]
+
+    def test_uncached_endpoint(self):
+        self.moco.Project.get(1)
+        self.moco.Project.get(1)
+
+        assert len(self.requestor.calls) == 2
+        assert len(self.cache) == 0
+
+    def test_ttl_expires(self):
+        self.moco.User.get(1)
+        self.clock.now = 299
+        self.moco.User.get(1)
+        self.clock.now = 301
+        self.moco.User.get(1)
+
+        assert len(self.requestor.calls) == 2
+
+    def test_ttl_override(self):
+        self.cache.ttls = {"unit_getlist": 0, "project_get": 10}
+
+        self.moco.Unit.getlist()
+        self.moco.Unit.getlist()
+        self.moco.Project.get(1)
+        self.moco.Project.get(1)
+
+        assert len(self.requestor.calls) == 3
+
+    def test_key_by_params_and_user(self):
+        self.moco.User.getlist()
+        self.moco.User.getlist(include_archived=True)
+
+        with self.moco.impersonation(5):
+            self.moco.User.getlist()
+
+        self.moco.User.getlist()
+
+        assert len(self.requestor.calls) == 3
+
+    def test_write_invalidates_family(self):
+        self.moco.Unit.getlist()
+        self.moco.User.get(1)
+        self.moco.User.delete(2)
+
+        self.moco.Unit.getlist()
+        self.moco.User.get(1)
+
+        assert [x[0] for x in self.requestor.calls] == ["GET", "GET", "DELETE", "GET"]
+
+    def test_write_during_read_not_stored(self):
+        generation = self.cache.generation("users")
+        response = ObjectResponse(MockHttpResponse({"id": 1}, 200))
+
+        self.cache.invalidate("users")
+        self.cache.set(("key",), "users", response, 60, generation=generation)
+
+        assert len(self.cache) == 0
+
+    def test_errors_not_cached(self):
+        self.cache.set(("key",), "units", MockHttpErrorResponse(404, "not found").to_error(), 60)
+
+        assert len(self.cache) == 0
+
+    def test_lru_by_entries(self):
+        cache = ResponseCache(max_entries=2, clock=self.clock)
+
+        for key in ("a", "b"):
+            cache.set((key,), "units", ObjectResponse(MockHttpResponse({"id": key}, 200)), 60)
+
+        cache.get(("a",))
+        cache.set(("c",), "units", ObjectResponse(MockHttpResponse({"id": "c"}, 200)), 60)
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+        assert cache.evictions == 1
+
+    def test_lru_by_bytes(self):
+        response = ObjectResponse(MockHttpResponse({"name": "x" * 100}, 200))
+        cache = ResponseCache(max_bytes=250, clock=self.clock)
+
+        for key in ("a", "b", "c"):
+            cache.set((key,), "units", response, 60)
+
+        assert len(cache) == 2
+        assert cache.size <= 250
+
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_async_moco(self):
+        requestor = CountingRequestor()
+        moco = AsyncMoco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=requestor,
+            response_cache=ResponseCache()
+        )
+
+        async def run():
+            await moco.Unit.getlist()
+            await moco.Unit.getlist()
+            await moco.DealCategory.delete(1)
+            await moco.DealCategory.getlist()
+
+        asyncio.run(run())
+
+        assert len(requestor.calls) == 3
@@ -0,0 +1,84 @@
+from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+from moco_wrapper.util.response import ObjectResponse, ErrorResponse
+
+from ..mocks.http import FakeHttpResponse, FakeSession
+
+
+class TestRetryPolicy(object):
+    def setup(self):
+        self.slept = []
+        self.policy = RetryPolicy(
+            max_attempts=4,
+            base_delay_ms=1000,
+            max_delay_ms=3000,
+            jitter=False,
+            sleep=self.slept.append
+        )
+
+    def test_exponential_backoff(self):
+        assert [self.policy.next_delay(x) for x in range(1, 5)] == [1.0, 2.0, 3.0, None]
+
+    def test_full_jitter(self):
+        policy = RetryPolicy(base_delay_ms=1000, random_func=lambda: 0.5)
+
+        assert policy.backoff(1) == 0.5
+        assert policy.backoff(2) == 1.0
+
+    def test_retry_after_seconds(self):
+        response = FakeHttpResponse(429, headers={"Retry-After": "7"})
+
+        assert self.policy.next_delay(1, response) == 7.0
+
+    def test_retry_after_date(self):
+        response = FakeHttpResponse(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        assert self.policy.retry_after(response) == 0.0
+
+    def test_retry_after_ignored(self):
+        policy = RetryPolicy(jitter=False, respect_retry_after=False)
+        response = FakeHttpResponse(429, headers={"Retry-After": "7"})
+
+        assert policy.next_delay(1, response) == 1.0
+
+    def test_deadline(self):
+        now = [0.0]
+        policy = RetryPolicy(jitter=False, deadline_s=2.5, clock=lambda: now[0])
+
+        assert policy.next_delay(1, started_at=0.0) == 1.0
+        now[0] = 1.0
+        assert policy.next_delay(2, started_at=0.0) is None
+
+    def test_requestor_retries_in_loop(self):
+        requestor = DefaultRequestor(retry_policy=self.policy)
+        requestor._session = FakeSession([
+            FakeHttpResponse(429, "too many requests"),
+            FakeHttpResponse(429, "too many requests"),
+            FakeHttpResponse(200, '{"id": 1}'),
+        ])
+
+        response = requestor.request("GET", "https://example.org")
+
+        assert isinstance(response, ObjectResponse)
+        assert self.slept == [1.0, 2.0]
+        assert requestor.retry_statistics.attempts == 3
+        assert requestor.retry_statistics.retries == 2
+        assert requestor.retry_statistics.exhausted == 0
+
+    def test_requestor_gives_up(self):
+        requestor = DefaultRequestor(retry_policy=self.policy)
+        requestor._session = FakeSession([FakeHttpResponse(429, "too many requests") for _ in range(10)])
+
+        response = requestor.request("GET", "https://example.org")
+
+        assert isinstance(response, ErrorResponse)
+        assert requestor._session.calls == 4
+        assert requestor.retry_statistics.exhausted == 1
+
+    def test_requestor_does_not_retry_permanent_errors(self):
+        requestor = DefaultRequestor(retry_policy=self.policy)
+        requestor._session = FakeSession([FakeHttpResponse(404, "not found")])
+
+        response = requestor.request("GET", "https://example.org")
+
+        assert isinstance(response, ErrorResponse)
+        assert self.slept == []
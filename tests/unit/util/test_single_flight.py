@@ -0,0 +1,119 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from moco_wrapper import Moco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.requestor import SingleFlightRequestor
+from moco_wrapper.util.response import ObjectResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class SlowRequestor(object):
+    """
+    Requestor that holds every request until it is released
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+        self.lock = threading.Lock()
+        self.session = object()
+
+    def request(self, method, path, params=None, data=None, **kwargs):
+        with self.lock:
+            self.calls.append((method, path, params))
+
+        self.release.wait(5)
+
+        if path.endswith("/fail"):
+            raise ValueError("request failed")
+
+        return ObjectResponse(MockHttpResponse({"id": 1, "name": "Project", "path": path, "tags": ["a"]}, 200))
+
+
+class TestSingleFlightRequestor(object):
+    def setup(self):
+        self.inner = SlowRequestor()
+        self.requestor = SingleFlightRequestor(requestor=self.inner)
+
+    def run_concurrently(self, calls, coalesced):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(x) for x in calls]
+
+            # wait until the followers joined the requests in flight
+            deadline = time.monotonic() + 5
+            while self.requestor.coalesced_requests < coalesced and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            self.inner.release.set()
+            return [x.exception() or x.result() for x in futures]
+
+    def test_identical_gets_shared(self):
+        responses = self.run_concurrently(
+            [lambda: self.requestor.get("/projects/1", headers={"Authorization": "Token token=a"})] * 8, 7
+        )
+
+        assert len(self.inner.calls) == 1
+        assert self.requestor.coalesced_requests == 7
+        assert all(x.data == responses[0].data for x in responses)
+        assert len(set(id(x) for x in responses)) == 8
+
+    def test_different_requests_not_shared(self):
+        self.run_concurrently([
+            lambda: self.requestor.get("/projects/1", params={"include_archived": True}),
+            lambda: self.requestor.get("/projects/1", params={"include_archived": False}),
+            lambda: self.requestor.get("/projects/1", headers={"X-IMPERSONATE-USER-ID": "5"}),
+            lambda: self.requestor.get("/projects/2"),
+        ], 0)
+
+        assert len(self.inner.calls) == 4
+        assert self.requestor.coalesced_requests == 0
+
+    def test_writes_not_shared(self):
+        self.inner.release.set()
+
+        self.run_concurrently([lambda: self.requestor.post("/projects", data={"name": "Project"})] * 3, 0)
+
+        assert len(self.inner.calls) == 3
+
+    def test_error_shared(self):
+        responses = self.run_concurrently([lambda: self.requestor.get("/projects/fail")] * 4, 3)
+
+        assert len(self.inner.calls) == 1
+        assert all(isinstance(x, ValueError) for x in responses)
+
+    def test_not_shared_after_completion(self):
+        self.inner.release.set()
+
+        self.requestor.get("/projects/1")
+        self.requestor.get("/projects/1")
+
+        assert len(self.inner.calls) == 2
+        assert self.requestor._calls == {}
+
+    def test_converted_for_every_caller(self):
+        m = Moco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=self.requestor
+        )
+
+        projects = self.run_concurrently([lambda: m.Project.get(1)] * 6, 5)
+
+        assert len(self.inner.calls) == 1
+        assert all(isinstance(x.data, om.Project) for x in projects)
+        assert len(set(id(x.data) for x in projects)) == 6
+
+    def test_nested_data_not_shared(self):
+        m = Moco(
+            auth={"api_key": "api_key", "domain": "domain"},
+            requestor=self.requestor
+        )
+
+        projects = self.run_concurrently([lambda: m.Project.get(1)] * 4, 3)
+        projects[0].data.tags.append("b")
+
+        assert len(self.inner.calls) == 1
+        assert [x.data.tags for x in projects[1:]] == [["a"]] * 3